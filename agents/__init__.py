@@ -1,15 +1,23 @@
-"""
-Multi-Agent System for Enhanced Onboarding
-"""
-
-from .orchestrator import OrchestratorAgent
-from .personalization import PersonalizationAgent
-from .content_curator import ContentCuratorAgent
-from .assessment import AssessmentAgent
-
-__all__ = [
-    'OrchestratorAgent',
-    'PersonalizationAgent', 
-    'ContentCuratorAgent',
-    'AssessmentAgent'
-]
+"""
+Multi-Agent System for Enhanced Onboarding
+"""
+
+# Agent modules import boto3 and build shared clients, which is a large
+# chunk of cold-start time. PEP 562 lazy attributes defer each module
+# until its agent class is actually referenced.
+_AGENT_MODULES = {
+    'OrchestratorAgent': '.orchestrator',
+    'PersonalizationAgent': '.personalization',
+    'ContentCuratorAgent': '.content_curator',
+    'AssessmentAgent': '.assessment',
+}
+
+__all__ = list(_AGENT_MODULES)
+
+def __getattr__(name):
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    return getattr(import_module(module_name, __name__), name)
@@ -0,0 +1,36 @@
+"""
+Shared boto3 session and service clients for the agent package
+
+Each agent used to build its own clients, paying credential resolution and
+a fresh connection pool per instance. Everything here is created once at
+import and reused.
+"""
+
+import boto3
+from botocore.config import Config as BotoConfig
+from config import config
+
+SESSION = boto3.session.Session(region_name=config.REGION_NAME)
+
+# Pool sized for concurrent user sessions sharing these clients
+_BASE_CONFIG = BotoConfig(
+    region_name=config.REGION_NAME,
+    connect_timeout=10,
+    max_pool_connections=50
+)
+
+# Bedrock agent calls stream for a while, so they get a longer read timeout.
+# Adaptive retries handle throttling/server errors with backoff and jitter,
+# and TCP keepalive lets sequential messages reuse the TLS connection.
+_BEDROCK_CONFIG = BotoConfig(
+    region_name=config.REGION_NAME,
+    connect_timeout=10,
+    read_timeout=config.BEDROCK_TIMEOUT,
+    max_pool_connections=50,
+    retries={'max_attempts': config.API_RETRY_COUNT, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+DDB = SESSION.resource('dynamodb', config=_BASE_CONFIG)
+S3 = SESSION.client('s3', config=_BASE_CONFIG)
+BEDROCK = SESSION.client('bedrock-agent-runtime', config=_BEDROCK_CONFIG)
@@ -0,0 +1,25 @@
+"""
+Lazy loaders for the static agent catalogs
+
+The catalogs used to live as nested literals executed on every import of
+the agents package. They now ship as JSON under agents/data/ and parse
+once on first access, which keeps cold start light and makes content
+edits a non-code change.
+"""
+
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+_DATA_DIR = Path(__file__).parent / 'data'
+
+@cache
+def load(name):
+    """Parse a catalog file once; the result is shared and read-only"""
+    data = _loads((_DATA_DIR / f'{name}.json').read_bytes())
+    return MappingProxyType(data)
@@ -0,0 +1,15 @@
+"""
+Shared role detection for the agent package
+
+Several agents matched role keywords with repeated substring checks, each
+lowercasing the role string again. One compiled regex does a single scan.
+"""
+
+import re
+
+_ROLE_RE = re.compile(r'engineer|sales|marketing', re.IGNORECASE)
+
+def role_of(user_role):
+    """Map a free-form role string to a known role key, or 'default'"""
+    match = _ROLE_RE.search(user_role or '')
+    return match.group(0).lower() if match else 'default'
@@ -1,219 +1,270 @@
-"""
-Assessment Agent - Skills evaluation and testing
-"""
-
-import boto3
-from config import config
-import json
-import random
-
-class AssessmentAgent:
-    """
-    Manages skills assessments and evaluations
-    """
-    
-    def __init__(self):
-        self.dynamodb = None
-        self.table = None
-        
-        if config.ENABLE_ASSESSMENTS:
-            try:
-                self.dynamodb = boto3.resource('dynamodb', region_name=config.REGION_NAME)
-                self.table = self.dynamodb.Table(config.DYNAMODB_ASSESSMENTS_TABLE)
-            except:
-                print("Assessment table not available. Assessments disabled.")
-    
-    def get_available_assessments(self, user_role):
-        """
-        Get list of available assessments for user role
-        """
-        assessments = {
-            'engineer': [
-                {
-                    'id': 'tech_001',
-                    'name': 'Technical Fundamentals',
-                    'duration': '30 min',
-                    'questions': 20,
-                    'difficulty': 'intermediate',
-                    'status': 'available'
-                },
-                {
-                    'id': 'code_001',
-                    'name': 'Coding Best Practices',
-                    'duration': '45 min',
-                    'questions': 15,
-                    'difficulty': 'intermediate',
-                    'status': 'available'
-                },
-                {
-                    'id': 'arch_001',
-                    'name': 'System Architecture',
-                    'duration': '40 min',
-                    'questions': 25,
-                    'difficulty': 'advanced',
-                    'status': 'locked'
-                }
-            ],
-            'sales': [
-                {
-                    'id': 'product_001',
-                    'name': 'Product Knowledge',
-                    'duration': '25 min',
-                    'questions': 30,
-                    'difficulty': 'beginner',
-                    'status': 'available'
-                },
-                {
-                    'id': 'sales_001',
-                    'name': 'Sales Process',
-                    'duration': '30 min',
-                    'questions': 20,
-                    'difficulty': 'intermediate',
-                    'status': 'available'
-                }
-            ],
-            'default': [
-                {
-                    'id': 'culture_001',
-                    'name': 'Company Culture Quiz',
-                    'duration': '15 min',
-                    'questions': 15,
-                    'difficulty': 'beginner',
-                    'status': 'available'
-                },
-                {
-                    'id': 'policy_001',
-                    'name': 'Policies & Compliance',
-                    'duration': '20 min',
-                    'questions': 20,
-                    'difficulty': 'beginner',
-                    'status': 'available'
-                }
-            ]
-        }
-        
-        role_key = 'engineer' if 'engineer' in user_role.lower() else \
-                   'sales' if 'sales' in user_role.lower() else 'default'
-        
-        return assessments.get(role_key, assessments['default'])
-    
-    def get_assessment_questions(self, assessment_id):
-        """
-        Get questions for a specific assessment
-        """
-        # Sample question bank
-        question_banks = {
-            'culture_001': [
-                {
-                    'id': 1,
-                    'question': 'What is our company\'s primary mission?',
-                    'type': 'multiple_choice',
-                    'options': [
-                        'Maximize profits',
-                        'Deliver innovative solutions to customers',
-                        'Expand globally',
-                        'Reduce costs'
-                    ],
-                    'correct_answer': 1
-                },
-                {
-                    'id': 2,
-                    'question': 'Which value is most important in our company culture?',
-                    'type': 'multiple_choice',
-                    'options': [
-                        'Competition',
-                        'Individual achievement',
-                        'Collaboration and teamwork',
-                        'Speed over quality'
-                    ],
-                    'correct_answer': 2
-                }
-            ],
-            'tech_001': [
-                {
-                    'id': 1,
-                    'question': 'What is the recommended approach for code reviews?',
-                    'type': 'multiple_choice',
-                    'options': [
-                        'Review only critical bugs',
-                        'All code must be reviewed before merging',
-                        'Reviews are optional',
-                        'Only senior developers review code'
-                    ],
-                    'correct_answer': 1
-                }
-            ]
-        }
-        
-        return question_banks.get(assessment_id, [])
-    
-    def submit_assessment(self, user_id, assessment_id, answers):
-        """
-        Submit assessment and calculate score
-        """
-        questions = self.get_assessment_questions(assessment_id)
-        
-        if not questions:
-            return {'success': False, 'error': 'Assessment not found'}
-        
-        # Calculate score
-        correct = 0
-        total = len(questions)
-        
-        for i, question in enumerate(questions):
-            if i < len(answers) and answers[i] == question['correct_answer']:
-                correct += 1
-        
-        score = (correct / total) * 100
-        passed = score >= 70  # 70% passing grade
-        
-        result = {
-            'success': True,
-            'assessment_id': assessment_id,
-            'user_id': user_id,
-            'score': score,
-            'correct_answers': correct,
-            'total_questions': total,
-            'passed': passed,
-            'feedback': self._generate_feedback(score)
-        }
-        
-        # Save result to DynamoDB/ or any other database can be used
-        if self.table:
-            try:
-                self.table.put_item(Item={
-                    'user_id': user_id,
-                    'assessment_id': assessment_id,
-                    'result': json.dumps(result)
-                })
-            except Exception as e:
-                print(f"Error saving assessment result: {e}")
-        
-        return result
-    
-    def _generate_feedback(self, score):
-        """Generate feedback based on score"""
-        if score >= 90:
-            return "Excellent! You have demonstrated mastery of this topic."
-        elif score >= 80:
-            return "Great job! You have a strong understanding of this material."
-        elif score >= 70:
-            return "Good work! You passed the assessment. Review the materials to strengthen your knowledge."
-        else:
-            return "You did not pass this time. Please review the materials and try again."
-    
-    def get_assessment_history(self, user_id):
-        """Get user's assessment history"""
-        if not self.table:
-            return []
-        
-        try:
-            response = self.table.query(
-                KeyConditionExpression='user_id = :uid',
-                ExpressionAttributeValues={':uid': user_id}
-            )
-            
-            return response.get('Items', [])
-        except Exception as e:
-            print(f"Error retrieving assessment history: {e}")
-            return []
+"""
+Assessment Agent - Skills evaluation and testing
+"""
+
+from config import config
+from decimal import Decimal
+from functools import cache
+import json
+import numpy as np
+import queue
+import random
+import threading
+import time
+
+from ._aws import DDB
+from ._catalog import load as _load_catalog
+from ._roles import role_of
+
+# The assessment and question catalogs ship as JSON under agents/data/
+# and parse once on first use via _load_catalog
+
+@cache
+def _correct_answers():
+    """Answer keys as contiguous int arrays for vectorized batch grading"""
+    return {
+        assessment_id: np.array([q['correct_answer'] for q in questions], dtype=np.int8)
+        for assessment_id, questions in _load_catalog('questions').items()
+    }
+
+class AssessmentAgent:
+    """
+    Manages skills assessments and evaluations
+    """
+
+    # DynamoDB allows at most 25 items per BatchWriteItem call
+    _BATCH_SIZE = 25
+
+    def __init__(self):
+        self.dynamodb = None
+        self.table = None
+        self._write_buffer = None
+
+        if config.ENABLE_ASSESSMENTS:
+            try:
+                self.dynamodb = DDB
+                self.table = DDB.Table(config.DYNAMODB_ASSESSMENTS_TABLE)
+                # Buffer results and write them in batches from a background
+                # thread so submissions don't block on a DynamoDB round-trip
+                self._write_buffer = queue.Queue(maxsize=256)
+                self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flush_thread.start()
+            except:
+                print("Assessment table not available. Assessments disabled.")
+
+    def _flush_loop(self):
+        """Drain the write buffer and flush results via BatchWriteItem"""
+        while True:
+            batch = [self._write_buffer.get()]
+            while len(batch) < self._BATCH_SIZE:
+                try:
+                    batch.append(self._write_buffer.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, items):
+        """Write a batch of items, retrying unprocessed items with backoff"""
+        request_items = {
+            config.DYNAMODB_ASSESSMENTS_TABLE: [
+                {'PutRequest': {'Item': item}} for item in items
+            ]
+        }
+        delay = 0.5
+        try:
+            for _ in range(5):
+                response = self.dynamodb.batch_write_item(RequestItems=request_items)
+                request_items = response.get('UnprocessedItems') or {}
+                if not request_items:
+                    return
+                time.sleep(delay)
+                delay *= 2
+        except Exception as e:
+            print(f"Error saving assessment results: {e}")
+
+    def flush(self):
+        """Flush any buffered results synchronously (for shutdown hooks)"""
+        if not self._write_buffer:
+            return
+        batch = []
+        while True:
+            try:
+                batch.append(self._write_buffer.get_nowait())
+            except queue.Empty:
+                break
+            if len(batch) == self._BATCH_SIZE:
+                self._write_batch(batch)
+                batch = []
+        if batch:
+            self._write_batch(batch)
+
+    def get_available_assessments(self, user_role):
+        """
+        Get list of available assessments for user role
+        """
+        catalog = _load_catalog('assessments')
+        return catalog.get(role_of(user_role), catalog['default'])
+
+    def get_assessment_questions(self, assessment_id):
+        """
+        Get questions for a specific assessment
+        """
+        return _load_catalog('questions').get(assessment_id, [])
+
+    def submit_assessment(self, user_id, assessment_id, answers):
+        """
+        Submit assessment and calculate score
+        """
+        questions = self.get_assessment_questions(assessment_id)
+
+        if not questions:
+            return {'success': False, 'error': 'Assessment not found'}
+
+        # Calculate score
+        correct = 0
+        total = len(questions)
+
+        for i, question in enumerate(questions):
+            if i < len(answers) and answers[i] == question['correct_answer']:
+                correct += 1
+
+        score = (correct / total) * 100
+        passed = score >= 70  # 70% passing grade
+
+        result = {
+            'success': True,
+            'assessment_id': assessment_id,
+            'user_id': user_id,
+            'score': score,
+            'correct_answers': correct,
+            'total_questions': total,
+            'passed': passed,
+            'feedback': self._generate_feedback(score)
+        }
+
+        self._enqueue_result(result)
+
+        return result
+
+    def submit_assessments_batch(self, user_ids, assessment_id, answers_matrix):
+        """
+        Grade many submissions at once. Scoring runs as one C-level
+        comparison over a contiguous int matrix instead of a Python loop
+        per user, and results feed the batched DynamoDB writer.
+        """
+        correct = _correct_answers().get(assessment_id)
+        if correct is None:
+            return [{'success': False, 'error': 'Assessment not found'}] * len(user_ids)
+
+        total = correct.shape[0]
+        answers = np.asarray(answers_matrix, dtype=np.int8)
+
+        correct_counts = (answers[:, :total] == correct).sum(axis=1)
+        scores = correct_counts * (100.0 / total)
+        passed_mask = scores >= 70
+
+        results = []
+        for user_id, count, score, passed in zip(
+                user_ids, correct_counts, scores, passed_mask):
+            result = {
+                'success': True,
+                'assessment_id': assessment_id,
+                'user_id': user_id,
+                'score': float(score),
+                'correct_answers': int(count),
+                'total_questions': total,
+                'passed': bool(passed),
+                'feedback': self._generate_feedback(score)
+            }
+            results.append(result)
+            self._enqueue_result(result)
+
+        return results
+
+    def _enqueue_result(self, result):
+        """
+        Queue a graded result for the batched DynamoDB writer. Score and
+        pass flag are stored top-level so history reads can project just
+        those fields instead of pulling the full result blob.
+        """
+        if self._write_buffer is None:
+            return
+
+        item = {
+            'user_id': result['user_id'],
+            'assessment_id': result['assessment_id'],
+            'score': Decimal(str(result['score'])),
+            'passed': result['passed'],
+            'result': json.dumps(result)
+        }
+        try:
+            self._write_buffer.put_nowait(item)
+        except queue.Full:
+            # Buffer backed up - fall back to a direct write
+            try:
+                self.table.put_item(Item=item)
+            except Exception as e:
+                print(f"Error saving assessment result: {e}")
+
+    def _generate_feedback(self, score):
+        """Generate feedback based on score"""
+        if score >= 90:
+            return "Excellent! You have demonstrated mastery of this topic."
+        elif score >= 80:
+            return "Great job! You have a strong understanding of this material."
+        elif score >= 70:
+            return "Good work! You passed the assessment. Review the materials to strengthen your knowledge."
+        else:
+            return "You did not pass this time. Please review the materials and try again."
+
+    def get_assessment_history(self, user_id):
+        """Get user's assessment history"""
+        if not self.table:
+            return []
+
+        try:
+            # Project only the summary fields the UI needs and page through
+            # the query so large histories don't come back as one huge read
+            query_kwargs = {
+                'KeyConditionExpression': 'user_id = :uid',
+                'ExpressionAttributeValues': {':uid': user_id},
+                'ProjectionExpression': 'assessment_id, score, passed',
+                'Limit': 50
+            }
+
+            items = []
+            while True:
+                response = self.table.query(**query_kwargs)
+                items.extend(response.get('Items', []))
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    break
+                query_kwargs['ExclusiveStartKey'] = last_key
+
+            return items
+        except Exception as e:
+            print(f"Error retrieving assessment history: {e}")
+            return []
+
+    def get_assessments_by_ids(self, user_id, assessment_ids):
+        """Get full results for specific assessments in one batched read"""
+        if not self.table or not assessment_ids:
+            return []
+
+        table_name = config.DYNAMODB_ASSESSMENTS_TABLE
+        items = []
+        try:
+            # BatchGetItem accepts at most 100 keys per call
+            for start in range(0, len(assessment_ids), 100):
+                keys = [
+                    {'user_id': user_id, 'assessment_id': aid}
+                    for aid in assessment_ids[start:start + 100]
+                ]
+                response = self.dynamodb.batch_get_item(
+                    RequestItems={table_name: {'Keys': keys}}
+                )
+                items.extend(response.get('Responses', {}).get(table_name, []))
+            return items
+        except Exception as e:
+            print(f"Error retrieving assessments: {e}")
+            return []
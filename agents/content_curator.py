@@ -2,107 +2,119 @@
 Content Curator Agent - Manages and recommends onboarding content
 """
 
-import boto3
 from config import config
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+
+from ._aws import S3
+from ._catalog import load as _load_catalog
+from ._roles import role_of
+
+# The content catalog ships as JSON under agents/data/ and parses once
+# on first use via _load_catalog
+
+@cache
+def _all_items():
+    """Flat item list across all categories, built on first search"""
+    return [
+        item
+        for category in _load_catalog('content').values()
+        for item in category['items']
+    ]
+
+@cache
+def _search_index():
+    """token -> item-index inverted index, built on first search so
+    queries are set intersections instead of linear substring scans"""
+    index = defaultdict(set)
+    for i, item in enumerate(_all_items()):
+        for token in item['name'].lower().split():
+            index[token].add(i)
+    return dict(index)
+
+# Role-based recommendations, precomputed per role key
+_ROLE_RECOMMENDATIONS = {
+    'engineer': (
+        {'name': 'Code Review Best Practices', 'reason': 'Essential for engineers'},
+        {'name': 'System Architecture Deep Dive', 'reason': 'Understanding our stack'},
+    ),
+    'sales': (
+        {'name': 'Product Demo Training', 'reason': 'Core sales skill'},
+        {'name': 'Customer Success Stories', 'reason': 'Learn from wins'},
+    ),
+}
+
+@lru_cache(maxsize=512)
+def _search_item_ids(query):
+    """Resolve a query to a sorted tuple of matching item indices"""
+    tokens = query.lower().split()
+    if not tokens:
+        return ()
+
+    # Start from the smallest posting list to keep intersections cheap
+    index = _search_index()
+    postings = [index.get(token) for token in tokens]
+    if any(posting is None for posting in postings):
+        return ()
+
+    postings.sort(key=len)
+    result = postings[0]
+    for posting in postings[1:]:
+        result = result & posting
+        if not result:
+            break
+
+    return tuple(sorted(result))
 
 class ContentCuratorAgent:
     """
     Manages content discovery, organization, and recommendations
     """
-    
+
     def __init__(self):
-        self.s3 = boto3.client('s3', region_name=config.REGION_NAME)
+        self.s3 = S3
         self.bucket = config.S3_BUCKET
-    
+
     def get_content_by_category(self, category):
         """
         Get content organized by category
         """
-        content_categories = {
-            'company_culture': {
-                'title': 'Company Culture & Values',
-                'items': [
-                    {'name': 'Welcome Video', 'type': 'video', 'duration': '15 min'},
-                    {'name': 'Mission & Vision', 'type': 'document', 'duration': '10 min'},
-                    {'name': 'Company History', 'type': 'article', 'duration': '8 min'},
-                ]
-            },
-            'technical': {
-                'title': 'Technical Resources',
-                'items': [
-                    {'name': 'Development Setup Guide', 'type': 'guide', 'duration': '30 min'},
-                    {'name': 'Architecture Overview', 'type': 'video', 'duration': '45 min'},
-                    {'name': 'Best Practices', 'type': 'document', 'duration': '20 min'},
-                ]
-            },
-            'policies': {
-                'title': 'Policies & Procedures',
-                'items': [
-                    {'name': 'Employee Handbook', 'type': 'document', 'duration': '30 min'},
-                    {'name': 'Code of Conduct', 'type': 'document', 'duration': '15 min'},
-                    {'name': 'Security Policies', 'type': 'document', 'duration': '20 min'},
-                ]
-            },
-            'tools': {
-                'title': 'Tools & Systems',
-                'items': [
-                    {'name': 'Slack Guide', 'type': 'guide', 'duration': '10 min'},
-                    {'name': 'Project Management Tools', 'type': 'video', 'duration': '15 min'},
-                    {'name': 'Communication Best Practices', 'type': 'article', 'duration': '12 min'},
-                ]
-            }
-        }
-        
-        return content_categories.get(category, {})
+        return _load_catalog('content').get(category, {})
     
+    def get_contents_by_categories(self, categories):
+        """
+        Get several categories in one call
+
+        One pass over the catalog gives callers a single result to
+        cache and render, instead of one lookup (and one cache entry)
+        per category.
+        """
+        catalog = _load_catalog('content')
+        return {category: catalog.get(category, {}) for category in categories}
+
     def search_content(self, query):
         """
         Search for content based on query
         """
         # Simplified search - in production, use vector search or full-text search
-        all_content = []
-        
-        categories = ['company_culture', 'technical', 'policies', 'tools']
-        for cat in categories:
-            content = self.get_content_by_category(cat)
-            if content:
-                all_content.extend(content.get('items', []))
-        
-        # Filter based on query
-        query_lower = query.lower()
-        results = [
-            item for item in all_content 
-            if query_lower in item['name'].lower()
-        ]
-        
-        return results
+        items = _all_items()
+        return [items[i] for i in _search_item_ids(query)]
     
     def get_recommended_content(self, user_role, completed_modules):
         """
         Get recommended content based on role and progress
         """
-        recommendations = []
-        
         # Role-based recommendations
-        if 'engineer' in user_role.lower():
-            recommendations.extend([
-                {'name': 'Code Review Best Practices', 'reason': 'Essential for engineers'},
-                {'name': 'System Architecture Deep Dive', 'reason': 'Understanding our stack'},
-            ])
-        
-        if 'sales' in user_role.lower():
-            recommendations.extend([
-                {'name': 'Product Demo Training', 'reason': 'Core sales skill'},
-                {'name': 'Customer Success Stories', 'reason': 'Learn from wins'},
-            ])
-        
+        recommendations = list(_ROLE_RECOMMENDATIONS.get(role_of(user_role), ()))
+
         # Progress-based recommendations
         if len(completed_modules) < 3:
             recommendations.append({
                 'name': 'Getting Started Guide',
                 'reason': 'Start with the basics'
             })
-        
+
         return recommendations
     
     def list_s3_content(self, prefix=''):
@@ -110,25 +122,40 @@ class ContentCuratorAgent:
         List content stored in S3 bucket
         """
         try:
-            response = self.s3.list_objects_v2(
+            # Paginate so prefixes with more than 1000 keys aren't truncated
+            paginator = self.s3.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.bucket,
-                Prefix=prefix
+                Prefix=prefix,
+                PaginationConfig={'PageSize': 1000}
             )
-            
-            contents = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    contents.append({
-                        'key': obj['Key'],
-                        'size': obj['Size'],
-                        'last_modified': obj['LastModified'].isoformat()
-                    })
-            
-            return contents
-        
+
+            return [
+                {
+                    'key': obj['Key'],
+                    'size': obj['Size'],
+                    'last_modified': obj['LastModified'].isoformat()
+                }
+                for page in pages
+                for obj in page.get('Contents', [])
+            ]
+
         except Exception as e:
             print(f"Error listing S3 content: {e}")
             return []
+
+    def list_s3_content_by_prefixes(self, prefixes):
+        """
+        List several prefixes concurrently (S3 listing is network-bound,
+        so threads overlap the round-trips)
+        """
+        if not prefixes:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(prefixes))) as executor:
+            results = executor.map(self.list_s3_content, prefixes)
+
+        return dict(zip(prefixes, results))
     
     def get_content_stats(self):
         """
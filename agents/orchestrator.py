@@ -3,80 +3,120 @@ Orchestrator Agent - Main coordinator for all specialized agents
 Uses Bedrock agent setup
 """
 
-import boto3
-from botocore.config import Config as BotoConfig
+import asyncio
+
+from botocore.exceptions import ClientError
 from config import config
-import time
+from functools import lru_cache
+
+from ._aws import BEDROCK
+
+# Caps in-flight Bedrock invocations so a burst of concurrent user
+# sessions doesn't trip service quotas
+_BEDROCK_SEMAPHORE = asyncio.Semaphore(config.MAX_CONCURRENT_BEDROCK)
+
+@lru_cache(maxsize=256)
+def _profile_prefix(role, department):
+    """
+    Stable prompt prefix for a profile, assembled once per (role, dept)
+    """
+    return f"User Role: {role}. Department: {department}. "
 
 class OrchestratorAgent:
     """
     Main orchestrator that coordinates all specialized agents
     """
-    
+
     def __init__(self):
-        self.boto_config = BotoConfig(
-            region_name=config.REGION_NAME,
-            connect_timeout=10,
-            read_timeout=config.BEDROCK_TIMEOUT
-        )
-        self.client = boto3.client('bedrock-agent-runtime', config=self.boto_config)
+        self.client = BEDROCK
         self.agent_id = config.AGENT_ID
         self.agent_alias_id = config.AGENT_ALIAS_ID
     
-    def ask_agent(self, question, session_id, retries=None):
+    def ask_agent(self, question, session_id):
         """
-        Ask the main Bedrock agent with retry logic
+        Ask the main Bedrock agent. Throttling and transient server errors
+        are retried by botocore's adaptive retry mode on the shared client,
+        so only the final failure has to be mapped for the user here.
         """
-        retries = retries or config.API_RETRY_COUNT
-        delay = config.API_RETRY_DELAY
-        
-        for attempt in range(retries):
-            try:
-                response = self.client.invoke_agent(
-                    agentId=self.agent_id,
-                    agentAliasId=self.agent_alias_id,
-                    sessionId=session_id,
-                    inputText=question
-                )
-                
-                response_text = ""
-                for event in response['completion']:
-                    if 'chunk' in event:
-                        response_text += event['chunk']['bytes'].decode('utf-8')
-                
-                return {
-                    'success': True,
-                    'response': response_text,
-                    'session_id': session_id
-                }
-            
-            except self.client.exceptions.InternalServerException:
-                if attempt < retries - 1:
-                    time.sleep(delay)
-                else:
-                    return {
-                        'success': False,
-                        'error': 'Service temporarily unavailable',
-                        'response': 'Sorry, I am temporarily unavailable. Please try again later.'
-                    }
-            
-            except Exception as e:
-                return {
-                    'success': False,
-                    'error': str(e),
-                    'response': f'An error occurred: {str(e)}'
-                }
+        try:
+            response = self.client.invoke_agent(
+                agentId=self.agent_id,
+                agentAliasId=self.agent_alias_id,
+                sessionId=session_id,
+                inputText=question
+            )
+
+            # Accumulate raw bytes and decode once - repeated str
+            # concatenation is quadratic on long streamed responses
+            buf = bytearray()
+            for event in response.get('completion', ()):
+                chunk = event.get('chunk')
+                if chunk:
+                    buf += chunk['bytes']
+
+            return {
+                'success': True,
+                'response': buf.decode('utf-8'),
+                'session_id': session_id
+            }
+
+        except ClientError:
+            return {
+                'success': False,
+                'error': 'Service temporarily unavailable',
+                'response': 'Sorry, I am temporarily unavailable. Please try again later.'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'response': f'An error occurred: {str(e)}'
+            }
     
+    async def ask_agent_async(self, question, session_id):
+        """
+        Async variant of ask_agent for event-loop callers. invoke_agent
+        blocks for seconds while the response streams, so it runs on the
+        default executor; awaiting it lets other sessions share the loop
+        instead of tying up a thread each for the full duration.
+        """
+        async with _BEDROCK_SEMAPHORE:
+            return await asyncio.to_thread(self.ask_agent, question, session_id)
+
+    def make_context(self, user_profile, session_id):
+        """
+        Precompute the per-session prompt context
+
+        The profile is stable within a session, so the prefix is built
+        once and every message reuses it; keeping the prefix identical
+        across turns also lets Bedrock's session-level prompt caching
+        recognize the repeated prefix instead of reprocessing it.
+        """
+        return {
+            'prefix': _profile_prefix(
+                user_profile.get('role', 'Unknown'),
+                user_profile.get('department', 'Unknown')
+            ),
+            'session_id': session_id
+        }
+
+    def ask_with_context(self, context, question):
+        """
+        Personalized ask using a precomputed session context
+        """
+        return self.ask_agent(
+            f"{context['prefix']}Question: {question}",
+            context['session_id']
+        )
+
     def get_personalized_response(self, question, user_profile, session_id):
         """
         Get personalized response based on user profile
         """
-        # Enhance question with user context
-        context = f"User Role: {user_profile.get('role', 'Unknown')}. "
-        context += f"Department: {user_profile.get('department', 'Unknown')}. "
-        context += f"Question: {question}"
-        
-        return self.ask_agent(context, session_id)
+        return self.ask_with_context(
+            self.make_context(user_profile, session_id), question
+        )
     
     def route_to_specialist(self, query_type, question, session_id):
         """
@@ -1,36 +1,51 @@
-"""
-Configuration file for Onboarding AI Assistant
-
-"""
-
-import os
-from dataclasses import dataclass
-
-@dataclass
-class Config:
-    
-    AGENT_ID = 'REMOVED'
-    AGENT_ALIAS_ID = 'REMOVED'
-    REGION_NAME = 'us-east-1'
-    
-    # S3 bucket
-    S3_BUCKET = 'storevoice'
-    
-    # DynamoDB tables created in AWS
-    DYNAMODB_ONBOARDING_TABLE = 'onboarding-progress'
-    DYNAMODB_KNOWLEDGE_TABLE = 'knowledge-base'
-    
-    # SES configuration
-    SES_SENDER_EMAIL = 'biswarup.mukherjee@company.com'  # this is a template
-    
-    # Application settings
-    COMPANY_NAME = 'Company'
-    APP_TITLE = 'PEP EASY ONBOARD'
-    
-    # Feature flags
-    ENABLE_VR_TRAINING = True
-    ENABLE_PROGRESS_TRACKING = True
-    ENABLE_EMAIL_AUTOMATION = True
-    ENABLE_SCHEDULER = True
-
-config = Config()
+"""
+Configuration file for Onboarding AI Assistant
+
+"""
+
+import os
+from dataclasses import dataclass, field
+
+# frozen + slots: attribute access goes through slot descriptors instead
+# of the instance dict, and the singleton below is hashable, so it can
+# key caches. Environment overrides resolve once, at class-body time.
+@dataclass(frozen=True, slots=True)
+class Config:
+
+    AGENT_ID: str = field(default=os.environ.get('AGENT_ID', 'REMOVED'))
+    AGENT_ALIAS_ID: str = field(default=os.environ.get('AGENT_ALIAS_ID', 'REMOVED'))
+    REGION_NAME: str = field(default=os.environ.get('AWS_REGION', 'us-east-1'))
+
+    # Bedrock call tuning
+    BEDROCK_TIMEOUT: int = field(default=int(os.environ.get('BEDROCK_TIMEOUT', '60')))
+    MAX_CONCURRENT_BEDROCK: int = field(default=int(os.environ.get('MAX_CONCURRENT_BEDROCK', '4')))
+    API_RETRY_COUNT: int = 3
+    API_RETRY_DELAY: int = 1
+
+    # S3 bucket
+    S3_BUCKET: str = field(default=os.environ.get('S3_BUCKET', 'storevoice'))
+
+    # DynamoDB tables created in AWS
+    DYNAMODB_ONBOARDING_TABLE: str = 'onboarding-progress'
+    DYNAMODB_KNOWLEDGE_TABLE: str = 'knowledge-base'
+    DYNAMODB_ASSESSMENTS_TABLE: str = 'assessment-results'
+
+    # SES configuration
+    SES_SENDER_EMAIL: str = 'biswarup.mukherjee@company.com'  # this is a template
+
+    # Application settings
+    COMPANY_NAME: str = 'Company'
+    APP_TITLE: str = 'PEP EASY ONBOARD'
+
+    # Branding colors used in email templates
+    PRIMARY_COLOR: str = '#1f77b4'
+    SECONDARY_COLOR: str = '#ff7f0e'
+
+    # Feature flags
+    ENABLE_VR_TRAINING: bool = True
+    ENABLE_PROGRESS_TRACKING: bool = True
+    ENABLE_EMAIL_AUTOMATION: bool = True
+    ENABLE_SCHEDULER: bool = True
+    ENABLE_ASSESSMENTS: bool = True
+
+config = Config()
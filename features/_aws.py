@@ -0,0 +1,46 @@
+"""
+Shared boto3 clients for the feature modules
+
+Client construction loads service models and builds endpoints, so it is
+far too expensive to repeat in every feature constructor. These cached
+factories hand all feature objects the same lazily-created client, which
+also shares a single connection pool across threads. Each client is
+warmed with a cheap call off-thread so the first real request finds the
+TLS connection already established.
+"""
+
+import boto3
+from botocore.config import Config as BotoConfig
+from functools import lru_cache
+import threading
+
+from config import config
+
+_BOTO_CONFIG = BotoConfig(
+    region_name=config.REGION_NAME,
+    max_pool_connections=50,
+    retries={'max_attempts': config.API_RETRY_COUNT},
+    tcp_keepalive=True,
+)
+
+def _warm(call):
+    """Run a throwaway request in the background; warmup is best-effort"""
+    def _run():
+        try:
+            call()
+        except Exception:
+            pass
+
+    threading.Thread(target=_run, daemon=True).start()
+
+@lru_cache(maxsize=None)
+def ses_client():
+    client = boto3.client('ses', config=_BOTO_CONFIG)
+    _warm(client.get_send_quota)
+    return client
+
+@lru_cache(maxsize=None)
+def dynamodb_resource():
+    resource = boto3.resource('dynamodb', config=_BOTO_CONFIG)
+    _warm(lambda: resource.Table(config.DYNAMODB_ONBOARDING_TABLE).table_status)
+    return resource
@@ -0,0 +1,18 @@
+"""
+JSON serialization for the feature modules
+
+orjson's C encoder is used when it is installed; the stdlib is the
+fallback, since orjson is not a declared dependency.
+"""
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+except ImportError:
+    import json as _json
+
+    def dumps(obj):
+        return _json.dumps(obj)
@@ -2,22 +2,30 @@
 Email Automation - Automated email campaigns and notifications
 """
 
-import boto3
+import asyncio
+
 from config import config
 from datetime import datetime
 
+from . import email_templates as templates
+from ._aws import ses_client
+from ._json import dumps as json_dumps
+
 class EmailAutomation:
     """
     Manages automated email notifications and campaigns
     """
-    
+
+    # Set once per process after the welcome template is uploaded to SES
+    _welcome_template_ready = False
+
     def __init__(self):
         self.ses = None
         self.enabled = config.ENABLE_EMAIL_AUTOMATION
         
         if self.enabled:
             try:
-                self.ses = boto3.client('ses', region_name=config.REGION_NAME)
+                self.ses = ses_client()
             except:
                 print("Email automation not available")
     
@@ -25,160 +33,154 @@ class EmailAutomation:
         """
         Send welcome email to new employee
         """
-        subject = f"Welcome to {config.COMPANY_NAME}, {employee_data['name']}! 🎉"
-        
-        html_body = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .header {{ background: linear-gradient(135deg, {config.PRIMARY_COLOR}, {config.SECONDARY_COLOR}); color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; }}
-                .button {{ background: {config.PRIMARY_COLOR}; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Welcome to {config.COMPANY_NAME}!</h1>
-            </div>
-            <div class="content">
-                <p>Dear {employee_data['name']},</p>
-                
-                <p>We're thrilled to have you join our team as a {employee_data.get('role', 'Team Member')}! 
-                Your journey with us begins today, and we're excited to support you every step of the way.</p>
-                
-                <h3>🚀 Get Started:</h3>
-                <ul>
-                    <li>Access your AI-powered onboarding assistant</li>
-                    <li>Complete your personalized learning path</li>
-                    <li>Experience our VR training modules</li>
-                    <li>Connect with your mentor and team</li>
-                </ul>
-                
-                <p style="text-align: center; margin: 30px 0;">
-                    <a href="https://onboarding.company.com" class="button">Launch Your Onboarding</a>
-                </p>
-                
-                <p>If you have any questions, our AI assistant is available 24/7, or you can reach out to 
-                hr@{config.COMPANY_NAME.lower()}.com</p>
-                
-                <p>Welcome aboard!<br>
-                The {config.COMPANY_NAME} Team</p>
-            </div>
-        </body>
-        </html>
-        """
-        
+        fields = {
+            'name': employee_data['name'],
+            'role': employee_data.get('role', 'Team Member'),
+        }
+
         return self._send_email(
             employee_data['email'],
-            subject,
-            html_body
+            templates.WELCOME_SUBJECT.substitute(fields),
+            templates.WELCOME_HTML.substitute(fields)
         )
     
     def send_progress_update(self, employee_data, progress_data):
         """
         Send progress update email
         """
-        subject = f"Your Onboarding Progress - {progress_data.get('overall_progress', 0)}% Complete!"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Great Progress, {employee_data['name']}! 🌟</h2>
-            
-            <p>You're <strong>{progress_data.get('overall_progress', 0)}%</strong> through your onboarding journey!</p>
-            
-            <h3>📊 Your Stats:</h3>
-            <ul>
-                <li>Modules Completed: {len(progress_data.get('completed_modules', []))}</li>
-                <li>Learning Streak: {progress_data.get('learning_streak_days', 0)} days</li>
-                <li>Assessments Passed: {progress_data.get('assessments_completed', 0)}</li>
-            </ul>
-            
-            <h3>🎯 Next Steps:</h3>
-            <ul>
-                <li>Continue with your current module</li>
-                <li>Try a VR training session</li>
-                <li>Schedule time with your mentor</li>
-            </ul>
-            
-            <p><a href="https://onboarding.company.com">Continue Your Journey →</a></p>
-        </body>
-        </html>
-        """
-        
+        fields = {
+            'name': employee_data['name'],
+            'progress': progress_data.get('overall_progress', 0),
+            'modules_completed': len(progress_data.get('completed_modules', [])),
+            'streak_days': progress_data.get('learning_streak_days', 0),
+            'assessments_completed': progress_data.get('assessments_completed', 0),
+        }
+
         return self._send_email(
             employee_data['email'],
-            subject,
-            html_body
+            templates.PROGRESS_SUBJECT.substitute(fields),
+            templates.PROGRESS_HTML.substitute(fields)
         )
     
     def send_assessment_reminder(self, employee_data, assessment_data):
         """
         Send assessment reminder email
         """
-        subject = f"Assessment Ready: {assessment_data['name']}"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Time to Test Your Knowledge! ✅</h2>
-            
-            <p>Hi {employee_data['name']},</p>
-            
-            <p>You're ready to take the <strong>{assessment_data['name']}</strong> assessment.</p>
-            
-            <p><strong>Details:</strong></p>
-            <ul>
-                <li>Duration: {assessment_data.get('duration', 'N/A')}</li>
-                <li>Questions: {assessment_data.get('questions', 'N/A')}</li>
-                <li>Passing Score: 70%</li>
-            </ul>
-            
-            <p><a href="https://onboarding.company.com/assessments">Start Assessment →</a></p>
-        </body>
-        </html>
-        """
-        
+        fields = {
+            'name': employee_data['name'],
+            'assessment_name': assessment_data['name'],
+            'duration': assessment_data.get('duration', 'N/A'),
+            'questions': assessment_data.get('questions', 'N/A'),
+        }
+
         return self._send_email(
             employee_data['email'],
-            subject,
-            html_body
+            templates.ASSESSMENT_SUBJECT.substitute(fields),
+            templates.ASSESSMENT_HTML.substitute(fields)
         )
     
     def send_meeting_reminder(self, employee_data, meeting_data):
         """
         Send meeting reminder email
         """
-        subject = f"Reminder: {meeting_data['title']} - {meeting_data['date']}"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>📅 Meeting Reminder</h2>
-            
-            <p>Hi {employee_data['name']},</p>
-            
-            <p>This is a reminder about your upcoming meeting:</p>
-            
-            <p><strong>{meeting_data['title']}</strong><br>
-            📅 {meeting_data['date']} at {meeting_data['time']}<br>
-            ⏱️ Duration: {meeting_data['duration']}<br>
-            📍 Location: {meeting_data.get('location', 'Virtual')}</p>
-            
-            {'<p><a href="' + meeting_data['meeting_link'] + '">Join Meeting</a></p>' if meeting_data.get('meeting_link') else ''}
-            
-            <p>Looking forward to seeing you!</p>
-        </body>
-        </html>
-        """
-        
+        meeting_link = meeting_data.get('meeting_link')
+        fields = {
+            'name': employee_data['name'],
+            'title': meeting_data['title'],
+            'date': meeting_data['date'],
+            'time': meeting_data['time'],
+            'duration': meeting_data['duration'],
+            'location': meeting_data.get('location', 'Virtual'),
+            'join_link_html': f'<p><a href="{meeting_link}">Join Meeting</a></p>' if meeting_link else '',
+        }
+
         return self._send_email(
             employee_data['email'],
-            subject,
-            html_body
+            templates.MEETING_SUBJECT.substitute(fields),
+            templates.MEETING_HTML.substitute(fields)
         )
     
+    def _ensure_welcome_template(self):
+        """
+        Upload the welcome template to SES once per process so bulk sends
+        can reference it by name
+        """
+        if EmailAutomation._welcome_template_ready:
+            return
+
+        try:
+            self.ses.create_template(Template=templates.WELCOME_SES_TEMPLATE)
+        except self.ses.exceptions.AlreadyExistsException:
+            pass
+
+        EmailAutomation._welcome_template_ready = True
+
+    def send_welcome_bulk(self, employees):
+        """
+        Send welcome emails as one SES bulk call per 50 recipients
+        instead of one round-trip per recipient
+        """
+        if not self.enabled or not self.ses:
+            print(f"Welcome emails would be sent to {len(employees)} employees")
+            return {
+                'success': False,
+                'message': 'Email automation not enabled'
+            }
+
+        try:
+            self._ensure_welcome_template()
+
+            message_ids = []
+            # SES accepts at most 50 destinations per bulk call
+            for start in range(0, len(employees), 50):
+                chunk = employees[start:start + 50]
+                response = self.ses.send_bulk_templated_email(
+                    Source=config.SES_SENDER_EMAIL,
+                    Template=templates.WELCOME_SES_TEMPLATE['TemplateName'],
+                    DefaultTemplateData=json_dumps({'name': 'there', 'role': 'Team Member'}),
+                    Destinations=[
+                        {
+                            'Destination': {'ToAddresses': [employee['email']]},
+                            'ReplacementTemplateData': json_dumps({
+                                'name': employee['name'],
+                                'role': employee.get('role', 'Team Member')
+                            })
+                        }
+                        for employee in chunk
+                    ]
+                )
+                message_ids.extend(status.get('MessageId') for status in response['Status'])
+
+            return {
+                'success': True,
+                'message_ids': message_ids
+            }
+
+        except Exception as e:
+            print(f"Error sending bulk welcome email: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def send_welcome_email_async(self, employee_data):
+        """
+        Async variant of send_welcome_email for event-loop callers
+        """
+        return await asyncio.to_thread(self.send_welcome_email, employee_data)
+
+    async def send_bulk(self, recipients):
+        """
+        Send many emails concurrently. Each entry is a (recipient,
+        subject, html_body) triple; the blocking SES calls run on the
+        default executor so the network round-trips overlap instead of
+        serializing at one send per round-trip.
+        """
+        return await asyncio.gather(*[
+            asyncio.to_thread(self._send_email, recipient, subject, html_body)
+            for recipient, subject, html_body in recipients
+        ])
+
     def _send_email(self, recipient, subject, html_body):
         """
         Internal method to send email via SES
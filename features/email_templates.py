@@ -0,0 +1,154 @@
+"""
+Email templates for the automation features
+
+The email bodies used to be rebuilt as large f-strings on every send.
+They are parsed into string.Template objects once at import, with the
+static branding from config baked in at that point, so each send only
+substitutes the per-user fields.
+"""
+
+from string import Template
+
+from config import config
+
+# Branding values resolved once; per-send fields stay as placeholders
+_BRAND = {
+    'company': config.COMPANY_NAME,
+    'company_lower': config.COMPANY_NAME.lower(),
+    'primary': config.PRIMARY_COLOR,
+    'secondary': config.SECONDARY_COLOR,
+}
+
+def _compile(source):
+    """Bake the branding values in, leaving the per-send fields"""
+    return Template(Template(source).safe_substitute(_BRAND))
+
+# Minified style shell shared by the styled emails, collapsed once at
+# import so every rendered payload carries fewer markup bytes
+_HEADER_CSS = (
+    '<style>'
+    'body{font-family:Arial,sans-serif;line-height:1.6}'
+    '.header{background:linear-gradient(135deg,$primary,$secondary);color:white;padding:20px;text-align:center}'
+    '.content{padding:20px}'
+    '.button{background:$primary;color:white;padding:12px 24px;text-decoration:none;border-radius:5px;display:inline-block}'
+    '</style>'
+)
+
+WELCOME_SUBJECT = _compile("Welcome to $company, $name! 🎉")
+
+WELCOME_HTML = _compile("""
+<html>
+<head>""" + _HEADER_CSS + """</head>
+<body>
+    <div class="header">
+        <h1>Welcome to $company!</h1>
+    </div>
+    <div class="content">
+        <p>Dear $name,</p>
+
+        <p>We're thrilled to have you join our team as a $role!
+        Your journey with us begins today, and we're excited to support you every step of the way.</p>
+
+        <h3>🚀 Get Started:</h3>
+        <ul>
+            <li>Access your AI-powered onboarding assistant</li>
+            <li>Complete your personalized learning path</li>
+            <li>Experience our VR training modules</li>
+            <li>Connect with your mentor and team</li>
+        </ul>
+
+        <p style="text-align: center; margin: 30px 0;">
+            <a href="https://onboarding.company.com" class="button">Launch Your Onboarding</a>
+        </p>
+
+        <p>If you have any questions, our AI assistant is available 24/7, or you can reach out to
+        hr@$company_lower.com</p>
+
+        <p>Welcome aboard!<br>
+        The $company Team</p>
+    </div>
+</body>
+</html>
+""")
+
+# SES-side copy of the welcome email for bulk sends: the same body with
+# SES-style placeholders, uploaded once via ses.create_template
+WELCOME_SES_TEMPLATE = {
+    'TemplateName': 'welcome_v1',
+    'SubjectPart': WELCOME_SUBJECT.safe_substitute(name='{{name}}'),
+    'HtmlPart': WELCOME_HTML.safe_substitute(name='{{name}}', role='{{role}}'),
+}
+
+PROGRESS_SUBJECT = _compile("Your Onboarding Progress - $progress% Complete!")
+
+PROGRESS_HTML = _compile("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Great Progress, $name! 🌟</h2>
+
+    <p>You're <strong>$progress%</strong> through your onboarding journey!</p>
+
+    <h3>📊 Your Stats:</h3>
+    <ul>
+        <li>Modules Completed: $modules_completed</li>
+        <li>Learning Streak: $streak_days days</li>
+        <li>Assessments Passed: $assessments_completed</li>
+    </ul>
+
+    <h3>🎯 Next Steps:</h3>
+    <ul>
+        <li>Continue with your current module</li>
+        <li>Try a VR training session</li>
+        <li>Schedule time with your mentor</li>
+    </ul>
+
+    <p><a href="https://onboarding.company.com">Continue Your Journey →</a></p>
+</body>
+</html>
+""")
+
+ASSESSMENT_SUBJECT = _compile("Assessment Ready: $assessment_name")
+
+ASSESSMENT_HTML = _compile("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Time to Test Your Knowledge! ✅</h2>
+
+    <p>Hi $name,</p>
+
+    <p>You're ready to take the <strong>$assessment_name</strong> assessment.</p>
+
+    <p><strong>Details:</strong></p>
+    <ul>
+        <li>Duration: $duration</li>
+        <li>Questions: $questions</li>
+        <li>Passing Score: 70%</li>
+    </ul>
+
+    <p><a href="https://onboarding.company.com/assessments">Start Assessment →</a></p>
+</body>
+</html>
+""")
+
+MEETING_SUBJECT = _compile("Reminder: $title - $date")
+
+MEETING_HTML = _compile("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>📅 Meeting Reminder</h2>
+
+    <p>Hi $name,</p>
+
+    <p>This is a reminder about your upcoming meeting:</p>
+
+    <p><strong>$title</strong><br>
+    📅 $date at $time<br>
+    ⏱️ Duration: $duration<br>
+    📍 Location: $location</p>
+
+    $join_link_html
+
+    <p>Looking forward to seeing you!</p>
+</body>
+</html>
+""")
@@ -2,10 +2,88 @@
 Progress Tracker - Analytics and progress monitoring
 """
 
-import boto3
 from config import config
-from datetime import datetime, timedelta
-import json
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import time
+
+from ._aws import dynamodb_resource
+
+# Recommendations and the summary arithmetic are pure functions of a few
+# scalars pulled from the progress item, so repeated dashboard renders of
+# the same state hit these caches instead of recomputing
+
+# Scalar defaults for a fresh progress item, copied in one splat instead
+# of field-by-field dict construction. List-valued fields stay out of the
+# prototype so items never share mutable state.
+_INIT_PROTO = {
+    'overall_progress': 0,
+    'total_modules': 0,
+    'assessments_completed': 0,
+    'vr_experiences_completed': 0,
+    'learning_streak_days': 0,
+    'total_learning_time_minutes': 0
+}
+
+# Static weekly chart mock, shared across calls; tuples keep callers
+# from mutating the shared values
+_WEEKLY_CHART_MOCK = {
+    'labels': ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'),
+    'completed_modules': (2, 3, 1, 4, 2, 1, 0),
+    'time_spent_minutes': (45, 60, 30, 90, 60, 45, 0)
+}
+
+@lru_cache(maxsize=4096)
+def _recs_cached(completion_rate, streak, assessments_completed, vr_completed):
+    recommendations = []
+
+    if completion_rate < 30:
+        recommendations.append({
+            'type': 'encouragement',
+            'message': 'Keep going! You are building great momentum.',
+            'action': 'Complete one more module today'
+        })
+
+    if streak < 3:
+        recommendations.append({
+            'type': 'engagement',
+            'message': 'Build your learning streak!',
+            'action': 'Try to learn something every day'
+        })
+
+    if completion_rate >= 50 and assessments_completed == 0:
+        recommendations.append({
+            'type': 'assessment',
+            'message': 'Time to test your knowledge!',
+            'action': 'Take your first assessment'
+        })
+
+    if vr_completed == 0:
+        recommendations.append({
+            'type': 'vr_training',
+            'message': 'Try our immersive VR training!',
+            'action': 'Launch your first VR experience'
+        })
+
+    return tuple(recommendations)
+
+@lru_cache(maxsize=4096)
+def _summary_cached(completed, in_progress, upcoming, time_minutes):
+    total = completed + in_progress + upcoming
+    completion_rate = (completed / total * 100) if total > 0 else 0
+
+    # Estimate completion date
+    days_active = 14  # Mock days_active, ideally should calculate from start_date
+    avg_modules_per_day = completed / days_active if days_active > 0 else 0
+    remaining_modules = in_progress + upcoming
+    estimated_days_remaining = int(remaining_modules / avg_modules_per_day) if avg_modules_per_day > 0 else 30
+
+    return (
+        round(completion_rate, 1),
+        total,
+        estimated_days_remaining,
+        completion_rate >= 40,  # threshold
+    )
 
 class ProgressTracker:
     """
@@ -18,7 +96,7 @@ class ProgressTracker:
         
         if config.ENABLE_PROGRESS_TRACKING:
             try:
-                self.dynamodb = boto3.resource('dynamodb', region_name=config.REGION_NAME)
+                self.dynamodb = dynamodb_resource()
                 self.table = self.dynamodb.Table(config.DYNAMODB_ONBOARDING_TABLE)
             except:
                 print("Progress tracking table not available")
@@ -27,67 +105,148 @@ class ProgressTracker:
         """
         Initialize progress tracking for new user
         """
+        today_str = date.today().isoformat()
+
         initial_progress = {
+            **_INIT_PROTO,
             'user_id': user_id,
             'role': user_profile.get('role', 'Unknown'),
             'department': user_profile.get('department', 'Unknown'),
-            'start_date': str(datetime.now().date()),
-            'overall_progress': 0,
+            'start_date': today_str,
+            'last_activity_date': today_str,
             'completed_modules': [],
             'in_progress_modules': [],
             'upcoming_modules': [],
-            'assessments_completed': 0,
-            'vr_experiences_completed': 0,
-            'learning_streak_days': 0,
-            'last_activity_date': str(datetime.now().date()),
-            'milestones_achieved': [],
-            'total_learning_time_minutes': 0
+            'milestones_achieved': []
         }
         
         if self.table:
-            try:
-                self.table.put_item(Item=initial_progress)
-            except Exception as e:
-                print(f"Error initializing progress: {e}")
-        
+            self._put_progress(initial_progress)
+
         return initial_progress
-    
+
+    def _put_progress(self, item):
+        """
+        Write a full progress item the caller already holds, with no
+        preceding read
+        """
+        try:
+            self.table.put_item(Item=item)
+            return {'success': True, 'progress': item}
+        except Exception as e:
+            print(f"Error saving progress: {e}")
+            return {'success': False, 'error': str(e)}
+
+
     def update_progress(self, user_id, update_data):
         """
-        Update user progress
+        Update user progress. Only the changed attributes travel over the
+        wire via UpdateExpression instead of rewriting the whole item.
         """
         if not self.table:
             return {'success': False, 'message': 'Progress tracking not available'}
-        
+
         try:
-            # Get current progress
-            response = self.table.get_item(Key={'user_id': user_id})
-            
-            if 'Item' not in response:
-                return {'success': False, 'message': 'User progress not found'}
-            
-            current_progress = response['Item']
-            
-            # Update fields
-            for key, value in update_data.items():
-                current_progress[key] = value
-            
-            # Update last activity
-            current_progress['last_activity_date'] = str(datetime.now().date())
-            
-            # Calculate learning streak
-            current_progress['learning_streak_days'] = self._calculate_streak(
-                current_progress.get('last_activity_date')
+            last_activity_date = date.today().isoformat()
+
+            names = {}
+            values = {}
+            assignments = []
+            for i, (key, value) in enumerate(update_data.items()):
+                names[f'#f{i}'] = key
+                values[f':v{i}'] = value
+                assignments.append(f'#f{i} = :v{i}')
+
+            values[':d'] = last_activity_date
+            values[':s'] = self._calculate_streak(last_activity_date)
+            assignments.append('last_activity_date = :d')
+            assignments.append('learning_streak_days = :s')
+
+            response = self.table.update_item(
+                Key={'user_id': user_id},
+                UpdateExpression='SET ' + ', '.join(assignments),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ConditionExpression='attribute_exists(user_id)',
+                ReturnValues='ALL_NEW'
             )
-            
-            # Save updated progress
-            self.table.put_item(Item=current_progress)
-            
+
             return {
                 'success': True,
-                'progress': current_progress
+                'progress': response['Attributes']
             }
-        
+
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return {'success': False, 'message': 'User progress not found'}
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def get_progress_many(self, user_ids):
+        """
+        Fetch progress for many users at once. BatchGetItem takes up to
+        100 keys per call, so team dashboards pay N/100 round-trips
+        instead of one get_item per user.
+        """
+        progress_by_user = {}
+
+        if not self.table or not user_ids:
+            return progress_by_user
+
+        table_name = config.DYNAMODB_ONBOARDING_TABLE
+        try:
+            for start in range(0, len(user_ids), 100):
+                request_items = {
+                    table_name: {
+                        'Keys': [{'user_id': u} for u in user_ids[start:start + 100]]
+                    }
+                }
+                delay = 0.5
+                while request_items:
+                    response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                    for item in response.get('Responses', {}).get(table_name, []):
+                        progress_by_user[item['user_id']] = item
+                    # Throttled keys come back unprocessed; retry with backoff
+                    request_items = response.get('UnprocessedKeys') or {}
+                    if request_items:
+                        time.sleep(delay)
+                        delay = min(delay * 2, 8)
+
+            return progress_by_user
+
+        except Exception as e:
+            print(f"Error getting progress batch: {e}")
+            return progress_by_user
+
+    def update_progress_many(self, items):
+        """
+        Write many full progress items in 25-item BatchWriteItem calls
+        """
+        if not self.table:
+            return {'success': False, 'message': 'Progress tracking not available'}
+
+        table_name = config.DYNAMODB_ONBOARDING_TABLE
+        try:
+            for start in range(0, len(items), 25):
+                request_items = {
+                    table_name: [
+                        {'PutRequest': {'Item': item}}
+                        for item in items[start:start + 25]
+                    ]
+                }
+                delay = 0.5
+                while request_items:
+                    response = self.dynamodb.batch_write_item(RequestItems=request_items)
+                    request_items = response.get('UnprocessedItems') or {}
+                    if request_items:
+                        time.sleep(delay)
+                        delay = min(delay * 2, 8)
+
+            return {'success': True}
+
         except Exception as e:
             return {
                 'success': False,
@@ -127,7 +286,7 @@ class ProgressTracker:
             'assessments_completed': 2,
             'vr_experiences_completed': 1,
             'learning_streak_days': 12,
-            'last_activity_date': str(datetime.now().date()),
+            'last_activity_date': date.today().isoformat(),
             'total_learning_time_minutes': 180
         }
     
@@ -136,143 +295,174 @@ class ProgressTracker:
         Calculate learning streak in days
         """
         try:
-            last_date = datetime.strptime(last_activity_date, '%Y-%m-%d').date()
-            today = datetime.now().date()
-            diff = (today - last_date).days
-            
-            if diff == 0:
-                return 1  # Active today
-            elif diff == 1:
-                return 1  # Continue streak
-            else:
-                return 0  # Streak broken
-        except:
+            # fromisoformat is a C fast path, unlike the strptime
+            # format-string interpreter it replaces
+            last_date = date.fromisoformat(last_activity_date)
+        except (TypeError, ValueError):
             return 0
+
+        # Active today or yesterday both continue the streak
+        return 1 if (date.today() - last_date).days <= 1 else 0
     
     def complete_module(self, user_id, module_name, time_spent_minutes):
         """
         Mark a module as completed
         """
-        progress = self.get_progress(user_id)
-        
-        if module_name not in progress.get('completed_modules', []):
-            completed = progress.get('completed_modules', [])
-            completed.append(module_name)
-            
-            # Remove from in-progress
-            in_progress = progress.get('in_progress_modules', [])
-            if module_name in in_progress:
-                in_progress.remove(module_name)
-            
-            # Update total time
-            total_time = progress.get('total_learning_time_minutes', 0)
-            total_time += time_spent_minutes
-            
-            # Calculate new overall progress
-            total_modules = len(completed) + len(in_progress) + len(progress.get('upcoming_modules', []))
-            overall_progress = int((len(completed) / total_modules) * 100) if total_modules > 0 else 0
-            
-            update_data = {
-                'completed_modules': completed,
-                'in_progress_modules': in_progress,
-                'total_learning_time_minutes': total_time,
+        if not self.table:
+            return {'success': False, 'message': 'Progress tracking not available'}
+
+        try:
+            # Atomic append + counter bump replaces the old read-modify-
+            # write, so concurrent completions can't lose updates and a
+            # double completion fails the condition instead of duplicating
+            response = self.table.update_item(
+                Key={'user_id': user_id},
+                UpdateExpression=(
+                    'SET completed_modules = list_append(completed_modules, :m) '
+                    'ADD total_learning_time_minutes :t'
+                ),
+                ConditionExpression='NOT contains(completed_modules, :name)',
+                ExpressionAttributeValues={
+                    ':m': [module_name],
+                    ':name': module_name,
+                    ':t': time_spent_minutes
+                },
+                ReturnValues='ALL_NEW'
+            )
+
+            # Derive the aggregate fields from the returned item and write
+            # them back without another read. Sets make the membership
+            # bookkeeping O(1); serialization back to lists happens only
+            # at the write boundary.
+            progress = response['Attributes']
+            completed = set(progress.get('completed_modules', []))
+            in_progress = set(progress.get('in_progress_modules', []))
+            in_progress.discard(module_name)
+            completed_count = len(completed)
+
+            # total_modules is fixed at initialization; fall back to
+            # counting the lists for items that predate the field
+            total_modules = progress.get('total_modules') or (
+                completed_count + len(in_progress) + len(progress.get('upcoming_modules', []))
+            )
+            overall_progress = int(completed_count * 100 // total_modules) if total_modules else 0
+
+            return self.update_progress(user_id, {
+                'in_progress_modules': list(in_progress),
                 'overall_progress': overall_progress
+            })
+
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return {'success': True, 'message': 'Module already completed'}
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
             }
-            
-            return self.update_progress(user_id, update_data)
-        
-        return {'success': True, 'message': 'Module already completed'}
     
-    def get_analytics_summary(self, user_id):
+    def get_dashboard_payload(self, user_id):
         """
-        Get comprehensive analytics summary
+        Progress plus analytics in a single fetch
+
+        The dashboard needs both; deriving the summary from the one
+        progress item halves the round-trips compared with calling
+        get_progress and get_analytics_summary separately.
         """
         progress = self.get_progress(user_id)
-        
-        # Calculate various metrics
-        completed = len(progress.get('completed_modules', []))
-        in_progress = len(progress.get('in_progress_modules', []))
-        upcoming = len(progress.get('upcoming_modules', []))
-        total = completed + in_progress + upcoming
-        
-        completion_rate = (completed / total * 100) if total > 0 else 0
-        
-        # Estimate completion date
-        days_active = 14  # Mock days_active, ideally should calculate from start_date
-        avg_modules_per_day = completed / days_active if days_active > 0 else 0
-        remaining_modules = in_progress + upcoming
-        estimated_days_remaining = int(remaining_modules / avg_modules_per_day) if avg_modules_per_day > 0 else 30
-        
+        return {
+            'progress': progress,
+            'analytics': self.get_analytics_summary(user_id, progress)
+        }
+
+    def get_analytics_summary(self, user_id, progress=None):
+        """
+        Get comprehensive analytics summary
+
+        Accepts an already-fetched progress item so combined callers
+        don't read it twice.
+        """
+        if progress is None:
+            progress = self.get_progress(user_id)
+
+        # Pull every field into a local once; the summary re-uses them
+        # several times below
+        completed = len(progress.get('completed_modules') or ())
+        in_progress = len(progress.get('in_progress_modules') or ())
+        upcoming = len(progress.get('upcoming_modules') or ())
+        time_minutes = progress.get('total_learning_time_minutes', 0)
+        streak = progress.get('learning_streak_days', 0)
+        milestones = progress.get('milestones_achieved', [])
+
+        completion_rate, total, estimated_days_remaining, on_track = _summary_cached(
+            completed, in_progress, upcoming, time_minutes
+        )
+
         estimated_completion = datetime.now() + timedelta(days=estimated_days_remaining)
-        
+
         return {
             'overall_metrics': {
-                'completion_rate': round(completion_rate, 1),
+                'completion_rate': completion_rate,
                 'modules_completed': completed,
                 'modules_total': total,
-                'learning_streak': progress.get('learning_streak_days', 0),
-                'total_time_hours': round(progress.get('total_learning_time_minutes', 0) / 60, 1)
+                'learning_streak': streak,
+                'total_time_hours': round(time_minutes / 60, 1)
             },
             'progress_breakdown': {
                 'completed': completed,
                 'in_progress': in_progress,
-                'upcoming': upcoming
+                'upcoming': upcoming,
+                # Summed once here so renderers never re-add the parts
+                'total': total
             },
             'predictions': {
                 'estimated_completion_date': estimated_completion.strftime('%Y-%m-%d'),
                 'estimated_days_remaining': estimated_days_remaining,
-                'on_track': completion_rate >= 40  #  threshold
+                'on_track': on_track
             },
-            'achievements': progress.get('milestones_achieved', []),
-            'recommendations': self._generate_recommendations(progress)
+            'achievements': milestones,
+            # The scalars are already in hand, so call the cached helper
+            # directly instead of re-looking them up through the wrapper
+            'recommendations': list(_recs_cached(
+                progress.get('overall_progress', 0),
+                streak,
+                progress.get('assessments_completed', 0),
+                progress.get('vr_experiences_completed', 0)
+            ))
         }
     
     def _generate_recommendations(self, progress):
         """
         Generate personalized recommendations based on progress
         """
-        recommendations = []
-        
-        completion_rate = progress.get('overall_progress', 0)
-        streak = progress.get('learning_streak_days', 0)
-        
-        if completion_rate < 30:
-            recommendations.append({
-                'type': 'encouragement',
-                'message': 'Keep going! You are building great momentum.',
-                'action': 'Complete one more module today'
-            })
-        
-        if streak < 3:
-            recommendations.append({
-                'type': 'engagement',
-                'message': 'Build your learning streak!',
-                'action': 'Try to learn something every day'
-            })
-        
-        if completion_rate >= 50 and progress.get('assessments_completed', 0) == 0:
-            recommendations.append({
-                'type': 'assessment',
-                'message': 'Time to test your knowledge!',
-                'action': 'Take your first assessment'
-            })
-        
-        if progress.get('vr_experiences_completed', 0) == 0:
-            recommendations.append({
-                'type': 'vr_training',
-                'message': 'Try our immersive VR training!',
-                'action': 'Launch your first VR experience'
-            })
-        
-        return recommendations
+        return list(_recs_cached(
+            progress.get('overall_progress', 0),
+            progress.get('learning_streak_days', 0),
+            progress.get('assessments_completed', 0),
+            progress.get('vr_experiences_completed', 0)
+        ))
     
     def get_weekly_chart_data(self, user_id):
         """
         Get data for weekly progress chart
         """
         # Mock data - in production, we query historical data
-        return {
-            'labels': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
-            'completed_modules': [2, 3, 1, 4, 2, 1, 0],
-            'time_spent_minutes': [45, 60, 30, 90, 60, 45, 0]
-        }
+        return _WEEKLY_CHART_MOCK
+
+    def get_weekly_chart_frame(self, user_id):
+        """
+        Weekly chart data as a DataFrame (columns: day, completed,
+        time_spent)
+
+        Renderers consume the columns directly as vectors instead of
+        rebuilding parallel Python lists per request, and the frame is
+        cheap for caching layers to hold on to.
+        """
+        import pandas as pd
+
+        data = self.get_weekly_chart_data(user_id)
+        return pd.DataFrame({
+            'day': data['labels'],
+            'completed': data['completed_modules'],
+            'time_spent': data['time_spent_minutes']
+        })
@@ -3,10 +3,25 @@ Meeting Scheduler - Automated meeting scheduling
 
 """
 
-import boto3
 from config import config
-from datetime import datetime, timedelta
-import json
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from ._aws import dynamodb_resource
+
+# Mock open slots - in production, check calendar availability
+_AVAILABLE_TIMES = ('9:00 AM', '11:00 AM', '1:00 PM', '2:00 PM', '4:00 PM')
+
+@lru_cache(maxsize=512)
+def _available_slots(date_str, duration_minutes):
+    """Open slots per (date, duration). The cache key matches the
+    invalidation axis a real calendar lookup would need, so repeated
+    suggestion scans over the same days are dict lookups."""
+    return [{'time': t, 'available': True} for t in _AVAILABLE_TIMES]
+
+# Day names indexed by date.weekday(), so date maths can stay on the
+# ordinal C paths instead of strftime's locale-table walks
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
 
 class MeetingScheduler:
     """
@@ -16,10 +31,13 @@ class MeetingScheduler:
     def __init__(self):
         self.dynamodb = None
         self.enabled = config.ENABLE_SCHEDULER
-        
+        # Meetings indexed by id so reschedule/cancel are O(1) lookups
+        # rather than scans over a meeting list
+        self._meetings_by_id = {}
+
         if self.enabled:
             try:
-                self.dynamodb = boto3.resource('dynamodb', region_name=config.REGION_NAME)
+                self.dynamodb = dynamodb_resource()
             except:
                 print("Scheduler not available")
     
@@ -28,13 +46,13 @@ class MeetingScheduler:
         Get list of upcoming meetings for user
         """
         # Mock data is used here for testing in production, query from calendar system. URLs are removed before commit
-        today = datetime.now()
-        
+        today_ord = date.today().toordinal()
+
         meetings = [
             {
                 'id': 'meet_001',
                 'title': 'Welcome Meeting with Manager',
-                'date': (today + timedelta(days=1)).strftime('%Y-%m-%d'),
+                'date': date.fromordinal(today_ord + 1).isoformat(),
                 'time': '10:00 AM',
                 'duration': '60 minutes',
                 'attendees': ['Manager', 'HR Representative'],
@@ -46,7 +64,7 @@ class MeetingScheduler:
             {
                 'id': 'meet_002',
                 'title': 'Team Introduction',
-                'date': (today + timedelta(days=2)).strftime('%Y-%m-%d'),
+                'date': date.fromordinal(today_ord + 2).isoformat(),
                 'time': '2:00 PM',
                 'duration': '45 minutes',
                 'attendees': ['Team Members'],
@@ -58,7 +76,7 @@ class MeetingScheduler:
             {
                 'id': 'meet_003',
                 'title': 'Technical Onboarding Session',
-                'date': (today + timedelta(days=3)).strftime('%Y-%m-%d'),
+                'date': date.fromordinal(today_ord + 3).isoformat(),
                 'time': '11:00 AM',
                 'duration': '90 minutes',
                 'attendees': ['Tech Lead', 'Senior Engineer'],
@@ -101,8 +119,10 @@ class MeetingScheduler:
             'meeting_link': self._generate_meeting_link(meeting_id)
         }
         
+        self._meetings_by_id[meeting_id] = meeting
+
         # In production, this needs to be saved to database, and returned messages
-        
+
         return {
             'success': True,
             'meeting': meeting,
@@ -119,6 +139,16 @@ class MeetingScheduler:
         """
         Reschedule an existing meeting
         """
+        meeting = self._meetings_by_id.get(meeting_id)
+        if meeting is None:
+            return {
+                'success': False,
+                'error': f'Meeting not found: {meeting_id}'
+            }
+
+        meeting['date'] = new_date
+        meeting['time'] = new_time
+
         # In production, update database and notify attendees
         return {
             'success': True,
@@ -127,11 +157,20 @@ class MeetingScheduler:
             'new_time': new_time,
             'message': 'Meeting rescheduled successfully'
         }
-    
+
     def cancel_meeting(self, meeting_id, reason=None):
         """
         Cancel a meeting
         """
+        meeting = self._meetings_by_id.pop(meeting_id, None)
+        if meeting is None:
+            return {
+                'success': False,
+                'error': f'Meeting not found: {meeting_id}'
+            }
+
+        meeting['status'] = 'cancelled'
+
         # In production, update database and notify attendees
         return {
             'success': True,
@@ -145,35 +184,25 @@ class MeetingScheduler:
         """
         Find available time slots for a given date
         """
-        # Mock available slots - in production, check calendar availability
-        available_slots = [
-            {'time': '9:00 AM', 'available': True},
-            {'time': '10:00 AM', 'available': False},
-            {'time': '11:00 AM', 'available': True},
-            {'time': '1:00 PM', 'available': True},
-            {'time': '2:00 PM', 'available': True},
-            {'time': '3:00 PM', 'available': False},
-            {'time': '4:00 PM', 'available': True}
-        ]
-        
-        return [slot for slot in available_slots if slot['available']]
+        return _available_slots(date, duration_minutes)
     
     def suggest_meeting_times(self, attendees, duration_minutes, preferred_days=7):
         """
         Suggest optimal meeting times based on attendee availability
         """
         suggestions = []
-        today = datetime.now()
-        
+        today_ord = date.today().toordinal()
+
         for i in range(1, preferred_days + 1):
-            date = (today + timedelta(days=i)).strftime('%Y-%m-%d')
-            slots = self.get_available_time_slots(date, duration_minutes)
-            
+            day = date.fromordinal(today_ord + i)
+            date_str = day.isoformat()
+            slots = self.get_available_time_slots(date_str, duration_minutes)
+
             if slots:
                 suggestions.append({
-                    'date': date,
-                    'day_name': (today + timedelta(days=i)).strftime('%A'),
+                    'date': date_str,
+                    'day_name': _WEEKDAYS[day.weekday()],
                     'available_times': [slot['time'] for slot in slots[:3]]  # Top 3 slots
                 })
-        
+
         return suggestions[:5]  # Return top 5 days
@@ -6,15 +6,154 @@ Please note that Contribution is needed to Improve this logic
 
 import boto3
 from config import config
-import json
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+import time
+
+# Static VR catalog, built once at import instead of per call, with an
+# id index so detail lookups are O(1) instead of scanning the list
+_VR_EXPERIENCES = (
+    {
+        'id': 'vr_office_tour',
+        'title': '🏢 Virtual Office Tour',
+        'description': 'Take a virtual tour of our office and meet your team',
+        'duration': '20 minutes',
+        'difficulty': 'beginner',
+        'type': 'vr',
+        'thumbnail': 'https://via.placeholder.com/400x250?text=Office+Tour',
+        'features': [
+            'Interactive 360° office views',
+            'Meet team members virtually',
+            'Explore facilities and amenities',
+            'Learn office navigation'
+        ],
+        'status': 'available'
+    },
+    {
+        'id': 'vr_equipment_training',
+        'title': '🛠️ Equipment Training',
+        'description': 'Hands-on training with company equipment in VR',
+        'duration': '30 minutes',
+        'difficulty': 'intermediate',
+        'type': 'vr',
+        'thumbnail': 'https://via.placeholder.com/400x250?text=Equipment+Training',
+        'features': [
+            'Safe practice environment',
+            'Step-by-step guidance',
+            'Interactive troubleshooting',
+            'Performance tracking'
+        ],
+        'status': 'available'
+    },
+    {
+        'id': 'vr_team_meeting',
+        'title': '👥 Virtual Team Meeting',
+        'description': 'Join your team in a virtual meeting space',
+        'duration': '45 minutes',
+        'difficulty': 'beginner',
+        'type': 'vr',
+        'thumbnail': 'https://via.placeholder.com/400x250?text=Team+Meeting',
+        'features': [
+            'Collaborative virtual space',
+            'Real-time interaction',
+            'Presentation sharing',
+            'Social networking'
+        ],
+        'status': 'available'
+    },
+    {
+        'id': 'ar_workspace_guide',
+        'title': '📱 AR Workspace Guide',
+        'description': 'Augmented reality guide to your workspace',
+        'duration': '15 minutes',
+        'difficulty': 'beginner',
+        'type': 'ar',
+        'thumbnail': 'https://via.placeholder.com/400x250?text=AR+Guide',
+        'features': [
+            'Phone-based AR',
+            'Interactive labels',
+            'Safety information',
+            'Quick reference guides'
+        ],
+        'status': 'available'
+    },
+    {
+        'id': 'vr_customer_simulation',
+        'title': '💼 Customer Interaction Simulation',
+        'description': 'Practice customer interactions in realistic scenarios',
+        'duration': '40 minutes',
+        'difficulty': 'advanced',
+        'type': 'vr',
+        'thumbnail': 'https://via.placeholder.com/400x250?text=Customer+Sim',
+        'features': [
+            'AI-driven customer responses',
+            'Multiple scenarios',
+            'Performance feedback',
+            'Best practice demonstrations'
+        ],
+        'status': 'coming_soon'
+    }
+)
+
+_VR_EXPERIENCE_INDEX = {exp['id']: exp for exp in _VR_EXPERIENCES}
+
+# Per-type control and setup text, built once at import; the proxy
+# keeps callers from mutating the shared tables
+_VR_CONTROLS = MappingProxyType({
+    'vr': {
+        'movement': 'Use joystick or WASD keys',
+        'interaction': 'Point and click with controller or mouse',
+        'menu': 'Press Menu button or ESC key',
+        'reset_view': 'Press Reset View button'
+    },
+    'ar': {
+        'movement': 'Move your phone to look around',
+        'interaction': 'Tap on AR markers',
+        'menu': 'Tap menu icon',
+        'capture': 'Tap camera icon to capture'
+    }
+})
+
+_VR_INSTRUCTIONS = MappingProxyType({
+    'vr': [
+        'Put on your VR headset (or use desktop mode)',
+        'Adjust fit and ensure clear vision',
+        'Follow the on-screen tutorial',
+        'Use controllers or keyboard/mouse for interaction',
+        'Take breaks every 20 minutes'
+    ],
+    'ar': [
+        'Open this experience on your mobile device',
+        'Grant camera permissions',
+        'Point camera at AR markers in your workspace',
+        'Follow interactive instructions',
+        'Tap objects for more information'
+    ]
+})
+
+@lru_cache(maxsize=None)
+def _get_experience(experience_id):
+    """
+    Resolve an experience id against the static catalog
+
+    The catalog never changes at runtime, so memoizing here also caches
+    the misses that dict.get would re-evaluate on every launch attempt.
+    """
+    return _VR_EXPERIENCE_INDEX.get(experience_id)
+
+# Client construction parses endpoint/credential files and wires up the
+# botocore event system; build it once at import and share it across
+# engine instances
+_S3 = boto3.client('s3', region_name=config.REGION_NAME)
 
 class VRTrainingEngine:
     """
     Manages VR/AR training experiences
     """
-    
+
     def __init__(self):
-        self.s3 = boto3.client('s3', region_name=config.REGION_NAME)
+        self.s3 = _S3
         self.bucket = config.S3_BUCKET
         self.vr_enabled = config.ENABLE_VR_TRAINING
     
@@ -22,102 +161,13 @@ class VRTrainingEngine:
         """
         Get list of available VR training experiences
         """
-        experiences = [
-            {
-                'id': 'vr_office_tour',
-                'title': '🏢 Virtual Office Tour',
-                'description': 'Take a virtual tour of our office and meet your team',
-                'duration': '20 minutes',
-                'difficulty': 'beginner',
-                'type': 'vr',
-                'thumbnail': 'https://via.placeholder.com/400x250?text=Office+Tour',
-                'features': [
-                    'Interactive 360° office views',
-                    'Meet team members virtually',
-                    'Explore facilities and amenities',
-                    'Learn office navigation'
-                ],
-                'status': 'available'
-            },
-            {
-                'id': 'vr_equipment_training',
-                'title': '🛠️ Equipment Training',
-                'description': 'Hands-on training with company equipment in VR',
-                'duration': '30 minutes',
-                'difficulty': 'intermediate',
-                'type': 'vr',
-                'thumbnail': 'https://via.placeholder.com/400x250?text=Equipment+Training',
-                'features': [
-                    'Safe practice environment',
-                    'Step-by-step guidance',
-                    'Interactive troubleshooting',
-                    'Performance tracking'
-                ],
-                'status': 'available'
-            },
-            {
-                'id': 'vr_team_meeting',
-                'title': '👥 Virtual Team Meeting',
-                'description': 'Join your team in a virtual meeting space',
-                'duration': '45 minutes',
-                'difficulty': 'beginner',
-                'type': 'vr',
-                'thumbnail': 'https://via.placeholder.com/400x250?text=Team+Meeting',
-                'features': [
-                    'Collaborative virtual space',
-                    'Real-time interaction',
-                    'Presentation sharing',
-                    'Social networking'
-                ],
-                'status': 'available'
-            },
-            {
-                'id': 'ar_workspace_guide',
-                'title': '📱 AR Workspace Guide',
-                'description': 'Augmented reality guide to your workspace',
-                'duration': '15 minutes',
-                'difficulty': 'beginner',
-                'type': 'ar',
-                'thumbnail': 'https://via.placeholder.com/400x250?text=AR+Guide',
-                'features': [
-                    'Phone-based AR',
-                    'Interactive labels',
-                    'Safety information',
-                    'Quick reference guides'
-                ],
-                'status': 'available'
-            },
-            {
-                'id': 'vr_customer_simulation',
-                'title': '💼 Customer Interaction Simulation',
-                'description': 'Practice customer interactions in realistic scenarios',
-                'duration': '40 minutes',
-                'difficulty': 'advanced',
-                'type': 'vr',
-                'thumbnail': 'https://via.placeholder.com/400x250?text=Customer+Sim',
-                'features': [
-                    'AI-driven customer responses',
-                    'Multiple scenarios',
-                    'Performance feedback',
-                    'Best practice demonstrations'
-                ],
-                'status': 'coming_soon'
-            }
-        ]
-        
-        return experiences
-    
+        return _VR_EXPERIENCES
+
     def get_vr_experience_details(self, experience_id):
         """
         Get detailed information about a specific VR experience
         """
-        experiences = self.get_available_vr_experiences()
-        
-        for exp in experiences:
-            if exp['id'] == experience_id:
-                return exp
-        
-        return None
+        return _get_experience(experience_id)
     
     def launch_vr_experience(self, experience_id, user_id):
         """
@@ -137,15 +187,16 @@ class VRTrainingEngine:
                 'error': f'Experience is {experience["status"]}'
             }
         
-        # Create VR session
-        session_id = f"{user_id}_{experience_id}_{int(boto3.session.Session().profile_name or 'default')}"
-        
+        # Create VR session. time_ns gives a unique suffix without the
+        # boto3 Session construction (and the int() crash) it replaces.
+        session_id = f"{user_id}_{experience_id}_{time.time_ns()}"
+
         session_data = {
             'session_id': session_id,
             'experience_id': experience_id,
             'user_id': user_id,
             'status': 'active',
-            'start_time': str(boto3.dynamodb.types.datetime.datetime.now()),
+            'start_time': datetime.utcnow().isoformat(),
             'experience_url': self._generate_vr_url(experience_id),
             'controls': self._get_vr_controls(experience['type']),
             'instructions': self._get_vr_instructions(experience['type'])
@@ -169,45 +220,13 @@ class VRTrainingEngine:
         """
         Get control instructions based on experience type
         """
-        controls = {
-            'vr': {
-                'movement': 'Use joystick or WASD keys',
-                'interaction': 'Point and click with controller or mouse',
-                'menu': 'Press Menu button or ESC key',
-                'reset_view': 'Press Reset View button'
-            },
-            'ar': {
-                'movement': 'Move your phone to look around',
-                'interaction': 'Tap on AR markers',
-                'menu': 'Tap menu icon',
-                'capture': 'Tap camera icon to capture'
-            }
-        }
-        
-        return controls.get(experience_type, controls['vr'])
-    
+        return _VR_CONTROLS.get(experience_type, _VR_CONTROLS['vr'])
+
     def _get_vr_instructions(self, experience_type):
         """
         Get setup instructions based on experience type
         """
-        instructions = {
-            'vr': [
-                'Put on your VR headset (or use desktop mode)',
-                'Adjust fit and ensure clear vision',
-                'Follow the on-screen tutorial',
-                'Use controllers or keyboard/mouse for interaction',
-                'Take breaks every 20 minutes'
-            ],
-            'ar': [
-                'Open this experience on your mobile device',
-                'Grant camera permissions',
-                'Point camera at AR markers in your workspace',
-                'Follow interactive instructions',
-                'Tap objects for more information'
-            ]
-        }
-        
-        return instructions.get(experience_type, instructions['vr'])
+        return _VR_INSTRUCTIONS.get(experience_type, _VR_INSTRUCTIONS['vr'])
     
     def track_vr_progress(self, session_id, progress_data):
         """
@@ -227,7 +246,7 @@ class VRTrainingEngine:
         return {
             'success': True,
             'session_id': session_id,
-            'completion_time': str(boto3.dynamodb.types.datetime.datetime.now()),
+            'completion_time': datetime.utcnow().isoformat(),
             'score': completion_data.get('score', 100),
             'certificate': {
                 'issued': True,
@@ -0,0 +1,132 @@
+"""
+Textract Completion Handler Lambda Function
+Stores extracted text for async Textract jobs submitted by the document
+processor, triggered by Textract's SNS completion notifications
+"""
+
+import json
+import boto3
+import logging
+import time
+from datetime import datetime
+import uuid
+
+# orjson serializes response payloads several times faster than the
+# stdlib when it's on the deployment package; fall back transparently
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj):
+        return _orjson_dumps(obj).decode('utf-8')
+except ImportError:
+    from json import dumps as _dumps
+
+# Initialize AWS clients
+textract = boto3.client('textract')
+dynamodb = boto3.resource('dynamodb')
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# AWS SETUP updation
+DYNAMODB_TABLE = 'onboarding-documents'  # Change to table name
+
+# Table handle built once per container instead of per put
+_DOC_TABLE = dynamodb.Table(DYNAMODB_TABLE)
+
+_now_cache = (0, '')
+
+def _now_iso():
+    """
+    Timestamp at second granularity, reused within the same second
+    """
+    global _now_cache
+    t = int(time.time())
+    if _now_cache[0] != t:
+        _now_cache = (t, datetime.now().isoformat())
+    return _now_cache[1]
+
+def lambda_handler(event, context):
+    """
+    Lambda handler triggered by Textract SNS completion notifications
+    """
+    try:
+        for record in event.get('Records', []):
+            message = json.loads(record['Sns']['Message'])
+
+            if message.get('Status') != 'SUCCEEDED':
+                logger.error(f"Textract job failed: {message}")
+                continue
+
+            job_id = message['JobId']
+            key = message.get('JobTag') or message['DocumentLocation']['S3ObjectName']
+
+            extracted_text = fetch_job_text(job_id)
+            store_document_metadata(key, extracted_text)
+
+            logger.info(f"Stored text for {key} (job {job_id})")
+
+        return {
+            'statusCode': 200,
+            'body': _dumps({
+                'message': 'Completions processed successfully'
+            })
+        }
+
+    except Exception as e:
+        logger.error(f"Error in lambda_handler: {str(e)}")
+        return {
+            'statusCode': 500,
+            'body': _dumps({
+                'error': str(e)
+            })
+        }
+
+def fetch_job_text(job_id):
+    """
+    Page through the Textract job results and join the LINE blocks
+    """
+    lines = []
+    kwargs = {'JobId': job_id}
+
+    while True:
+        response = textract.get_document_text_detection(**kwargs)
+        lines.extend(
+            block['Text']
+            for block in response.get('Blocks', [])
+            if block['BlockType'] == 'LINE'
+        )
+        next_token = response.get('NextToken')
+        if not next_token:
+            break
+        kwargs['NextToken'] = next_token
+
+    return "\n".join(lines)
+
+def store_document_metadata(key, extracted_text):
+    """
+    Store document metadata in DynamoDB
+    """
+    try:
+        document_id = str(uuid.uuid4())
+
+        # Bound the stored snippet in UTF-8 bytes, not code points;
+        # DynamoDB's item limit is a byte limit
+        snippet = extracted_text.encode('utf-8', 'ignore')[:5000].decode('utf-8', 'ignore')
+
+        item = {
+            'document_id': document_id,
+            'file_name': key,
+            'extracted_text': snippet,
+            'text_length': len(extracted_text),
+            'processed_at': _now_iso(),
+            'status': 'processed'
+        }
+
+        _DOC_TABLE.put_item(Item=item)
+        logger.info(f"Stored metadata for document {document_id}")
+
+    except Exception as e:
+        logger.error(f"Error storing metadata: {str(e)}")
+        raise
@@ -1,265 +1,362 @@
-"""
-Email Automation Lambda Function
-Sends scheduled emails and notifications for onboarding
-"""
-
-import json
-import boto3
-import logging
-from datetime import datetime
-
-# Initialize AWS clients
-ses = boto3.client('ses')
-dynamodb = boto3.resource('dynamodb')
-
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# These should be updated with correct values
-SES_SENDER_EMAIL = 'noreply@company.com'  # Must be verified in SES
-COMPANY_NAME = 'Company'
-
-def lambda_handler(event, context):
-    """
-    Lambda handler triggered by EventBridge schedule or API Gateway
-    """
-    try:
-        logger.info(f"Email automation triggered: {json.dumps(event)}")
-        
-        # Determine email type from event
-        email_type = event.get('email_type', 'welcome')
-        recipient_data = event.get('recipient_data', {})
-        
-        if email_type == 'welcome':
-            result = send_welcome_email(recipient_data)
-        elif email_type == 'progress_update':
-            result = send_progress_update(recipient_data)
-        elif email_type == 'assessment_reminder':
-            result = send_assessment_reminder(recipient_data)
-        elif email_type == 'meeting_reminder':
-            result = send_meeting_reminder(recipient_data)
-        else:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': f'Unknown email type: {email_type}'})
-            }
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps(result)
-        }
-    
-    except Exception as e:
-        logger.error(f"Error in email automation: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
-        }
-
-def send_welcome_email(recipient_data):
-    """
-    Send welcome email to new employee
-    """
-    try:
-        recipient_email = recipient_data.get('email')
-        recipient_name = recipient_data.get('name', 'New Employee')
-        role = recipient_data.get('role', 'Team Member')
-        
-        subject = f"Welcome to {COMPANY_NAME}, {recipient_name}! 🎉"
-        
-        html_body = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .header {{ background: linear-gradient(135deg, #667eea, #764ba2); 
-                           color: white; padding: 30px; text-align: center; }}
-                .content {{ padding: 30px; }}
-                .button {{ background: #667eea; color: white; padding: 12px 24px; 
-                          text-decoration: none; border-radius: 5px; display: inline-block; }}
-                .footer {{ background: #f4f4f4; padding: 20px; text-align: center; 
-                          font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Welcome to {COMPANY_NAME}!</h1>
-            </div>
-            <div class="content">
-                <p>Dear {recipient_name},</p>
-                
-                <p>We're thrilled to welcome you to our team as a <strong>{role}</strong>! 
-                Your journey with us begins today, and we're committed to supporting you every step of the way.</p>
-                
-                <h3>🚀 Get Started with Your AI Onboarding Assistant:</h3>
-                <ul>
-                    <li><strong>24/7 AI Support:</strong> Get instant answers to your questions</li>
-                    <li><strong>Personalized Learning Path:</strong> Tailored to your role and experience</li>
-                    <li><strong>VR Training:</strong> Immersive hands-on experiences</li>
-                    <li><strong>Progress Tracking:</strong> Monitor your onboarding journey</li>
-                </ul>
-                
-                <p style="text-align: center; margin: 30px 0;">
-                    <a href="https://onboarding.company.com" class="button">
-                        Launch Your Onboarding Dashboard
-                    </a>
-                </p>
-                
-                <h3>📅 Your First Week:</h3>
-                <ul>
-                    <li><strong>Day 1:</strong> Meet your manager and team</li>
-                    <li><strong>Day 2-3:</strong> Complete company culture training</li>
-                    <li><strong>Day 4-5:</strong> Role-specific technical training</li>
-                </ul>
-                
-                <p>If you have any questions, our AI assistant is available 24/7, or you can reach out 
-                to <a href="mailto:hr@{COMPANY_NAME.lower().replace(' ', '')}.com">
-                hr@{COMPANY_NAME.lower().replace(' ', '')}.com</a></p>
-                
-                <p>Welcome aboard!<br>
-                <strong>The {COMPANY_NAME} Team</strong></p>
-            </div>
-            <div class="footer">
-                <p>&copy; {datetime.now().year} {COMPANY_NAME}. All rights reserved.</p>
-                <p>This is an automated message from your AI Onboarding Assistant.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        response = ses.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [recipient_email]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Html': {'Data': html_body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        logger.info(f"Welcome email sent to {recipient_email}")
-        
-        return {
-            'success': True,
-            'message_id': response['MessageId'],
-            'recipient': recipient_email
-        }
-    
-    except Exception as e:
-        logger.error(f"Error sending welcome email: {str(e)}")
-        return {'success': False, 'error': str(e)}
-
-def send_progress_update(recipient_data):
-    """
-    Send progress update email
-    """
-    try:
-        recipient_email = recipient_data.get('email')
-        recipient_name = recipient_data.get('name')
-        progress = recipient_data.get('progress', 0)
-        
-        subject = f"Your Onboarding Progress - {progress}% Complete!"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Great Progress, {recipient_name}! 🌟</h2>
-            <p>You're <strong>{progress}%</strong> through your onboarding journey!</p>
-            <h3>Keep it up!</h3>
-            <p><a href="https://onboarding.company.com">View Your Dashboard</a></p>
-        </body>
-        </html>
-        """
-        
-        response = ses.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [recipient_email]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Html': {'Data': html_body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        return {'success': True, 'message_id': response['MessageId']}
-    
-    except Exception as e:
-        logger.error(f"Error sending progress update: {str(e)}")
-        return {'success': False, 'error': str(e)}
-
-def send_assessment_reminder(recipient_data):
-    """
-    Send assessment reminder email
-    """
-    try:
-        recipient_email = recipient_data.get('email')
-        recipient_name = recipient_data.get('name')
-        assessment_name = recipient_data.get('assessment_name', 'Onboarding Assessment')
-        
-        subject = f"Reminder: Complete Your {assessment_name}"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Assessment Reminder ✅</h2>
-            <p>Hi {recipient_name},</p>
-            <p>Don't forget to complete your <strong>{assessment_name}</strong>!</p>
-            <p><a href="https://onboarding.company.com/assessments">Start Assessment</a></p>
-        </body>
-        </html>
-        """
-        
-        response = ses.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [recipient_email]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Html': {'Data': html_body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        return {'success': True, 'message_id': response['MessageId']}
-    
-    except Exception as e:
-        logger.error(f"Error sending assessment reminder: {str(e)}")
-        return {'success': False, 'error': str(e)}
-
-def send_meeting_reminder(recipient_data):
-    """
-    Send meeting reminder email
-    """
-    try:
-        recipient_email = recipient_data.get('email')
-        recipient_name = recipient_data.get('name')
-        meeting_title = recipient_data.get('meeting_title', 'Onboarding Meeting')
-        meeting_time = recipient_data.get('meeting_time')
-        meeting_link = recipient_data.get('meeting_link')
-        
-        subject = f"Reminder: {meeting_title}"
-        
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Meeting Reminder 📅</h2>
-            <p>Hi {recipient_name},</p>
-            <p>This is a reminder about your upcoming meeting:</p>
-            <p><strong>{meeting_title}</strong><br>
-            Time: {meeting_time}</p>
-            {f'<p><a href="{meeting_link}">Join Meeting</a></p>' if meeting_link else ''}
-        </body>
-        </html>
-        """
-        
-        response = ses.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [recipient_email]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Html': {'Data': html_body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        return {'success': True, 'message_id': response['MessageId']}
-    
-    except Exception as e:
-        logger.error(f"Error sending meeting reminder: {str(e)}")
-        return {'success': False, 'error': str(e)}
+"""
+Email Automation Lambda Function
+Sends scheduled emails and notifications for onboarding
+"""
+
+import json
+import boto3
+import logging
+import string
+from datetime import datetime
+
+# orjson serializes response payloads several times faster than the
+# stdlib when it's on the deployment package; fall back transparently
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj):
+        return _orjson_dumps(obj).decode('utf-8')
+except ImportError:
+    from json import dumps as _dumps
+
+# Initialize AWS clients
+ses = boto3.client('ses')
+dynamodb = boto3.resource('dynamodb')
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# These should be updated with correct values
+SES_SENDER_EMAIL = 'noreply@company.com'  # Must be verified in SES
+COMPANY_NAME = 'Company'
+_COMPANY_DOMAIN = COMPANY_NAME.lower().replace(' ', '')
+
+# Footer copyright year, fixed at container start; Lambda containers
+# rarely survive a year boundary
+_CURRENT_YEAR = datetime.now().year
+
+# Email bodies parsed into templates once at module import; handlers
+# only substitute the per-recipient fields instead of rebuilding
+# multi-KB f-strings on every warm invocation
+
+_WELCOME_TMPL = string.Template("""
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; }
+        .header { background: linear-gradient(135deg, #667eea, #764ba2);
+                   color: white; padding: 30px; text-align: center; }
+        .content { padding: 30px; }
+        .button { background: #667eea; color: white; padding: 12px 24px;
+                  text-decoration: none; border-radius: 5px; display: inline-block; }
+        .footer { background: #f4f4f4; padding: 20px; text-align: center;
+                  font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Welcome to $company!</h1>
+    </div>
+    <div class="content">
+        <p>Dear $name,</p>
+
+        <p>We're thrilled to welcome you to our team as a <strong>$role</strong>!
+        Your journey with us begins today, and we're committed to supporting you every step of the way.</p>
+
+        <h3>🚀 Get Started with Your AI Onboarding Assistant:</h3>
+        <ul>
+            <li><strong>24/7 AI Support:</strong> Get instant answers to your questions</li>
+            <li><strong>Personalized Learning Path:</strong> Tailored to your role and experience</li>
+            <li><strong>VR Training:</strong> Immersive hands-on experiences</li>
+            <li><strong>Progress Tracking:</strong> Monitor your onboarding journey</li>
+        </ul>
+
+        <p style="text-align: center; margin: 30px 0;">
+            <a href="https://onboarding.company.com" class="button">
+                Launch Your Onboarding Dashboard
+            </a>
+        </p>
+
+        <h3>📅 Your First Week:</h3>
+        <ul>
+            <li><strong>Day 1:</strong> Meet your manager and team</li>
+            <li><strong>Day 2-3:</strong> Complete company culture training</li>
+            <li><strong>Day 4-5:</strong> Role-specific technical training</li>
+        </ul>
+
+        <p>If you have any questions, our AI assistant is available 24/7, or you can reach out
+        to <a href="mailto:hr@$company_domain.com">
+        hr@$company_domain.com</a></p>
+
+        <p>Welcome aboard!<br>
+        <strong>The $company Team</strong></p>
+    </div>
+    <div class="footer">
+        <p>&copy; $year $company. All rights reserved.</p>
+        <p>This is an automated message from your AI Onboarding Assistant.</p>
+    </div>
+</body>
+</html>
+""")
+
+_PROGRESS_TMPL = string.Template("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Great Progress, $name! 🌟</h2>
+    <p>You're <strong>$progress%</strong> through your onboarding journey!</p>
+    <h3>Keep it up!</h3>
+    <p><a href="https://onboarding.company.com">View Your Dashboard</a></p>
+</body>
+</html>
+""")
+
+_ASSESSMENT_TMPL = string.Template("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Assessment Reminder ✅</h2>
+    <p>Hi $name,</p>
+    <p>Don't forget to complete your <strong>$assessment_name</strong>!</p>
+    <p><a href="https://onboarding.company.com/assessments">Start Assessment</a></p>
+</body>
+</html>
+""")
+
+_MEETING_TMPL = string.Template("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Meeting Reminder 📅</h2>
+    <p>Hi $name,</p>
+    <p>This is a reminder about your upcoming meeting:</p>
+    <p><strong>$meeting_title</strong><br>
+    Time: $meeting_time</p>
+    $join_link_html
+</body>
+</html>
+""")
+
+# Company, domain and year never change within a container, so fold
+# them into the welcome body once at import; per-send substitution then
+# only touches the two recipient fields ($name, $role)
+_WELCOME_BODY = string.Template(_WELCOME_TMPL.safe_substitute(
+    company=COMPANY_NAME,
+    company_domain=_COMPANY_DOMAIN,
+    year=_CURRENT_YEAR
+))
+
+# Server-side SES templates: one create_template per container, then
+# send_bulk_templated_email addresses up to 50 recipients per API call
+# with only a small JSON substitution map per destination on the wire
+_SES_TEMPLATES = {
+    'welcome': {
+        'TemplateName': 'WelcomeTpl',
+        'SubjectPart': f"Welcome to {COMPANY_NAME}, {{{{name}}}}! 🎉",
+        'HtmlPart': _WELCOME_TMPL.substitute(
+            name='{{name}}',
+            role='{{role}}',
+            company=COMPANY_NAME,
+            company_domain=_COMPANY_DOMAIN,
+            year=_CURRENT_YEAR
+        )
+    },
+    'progress_update': {
+        'TemplateName': 'ProgressTpl',
+        'SubjectPart': "Your Onboarding Progress - {{progress}}% Complete!",
+        'HtmlPart': _PROGRESS_TMPL.substitute(name='{{name}}', progress='{{progress}}')
+    },
+    'assessment_reminder': {
+        'TemplateName': 'AssessmentTpl',
+        'SubjectPart': "Reminder: Complete Your {{assessment_name}}",
+        'HtmlPart': _ASSESSMENT_TMPL.substitute(
+            name='{{name}}',
+            assessment_name='{{assessment_name}}'
+        )
+    },
+    'meeting_reminder': {
+        'TemplateName': 'MeetingTpl',
+        'SubjectPart': "Reminder: {{meeting_title}}",
+        'HtmlPart': _MEETING_TMPL.substitute(
+            name='{{name}}',
+            meeting_title='{{meeting_title}}',
+            meeting_time='{{meeting_time}}',
+            join_link_html='{{join_link_html}}'
+        )
+    }
+}
+
+_BULK_DEFAULTS = {
+    'welcome': {'name': 'New Employee', 'role': 'Team Member'},
+    'progress_update': {'name': '', 'progress': '0'},
+    'assessment_reminder': {'name': '', 'assessment_name': 'Onboarding Assessment'},
+    'meeting_reminder': {'name': '', 'meeting_title': 'Onboarding Meeting',
+                         'meeting_time': '', 'join_link_html': ''}
+}
+
+_registered_templates = set()
+
+def _ensure_template(email_type):
+    """
+    Register the SES template for an email type once per warm container
+    """
+    if email_type in _registered_templates:
+        return
+    try:
+        ses.create_template(Template=_SES_TEMPLATES[email_type])
+    except ses.exceptions.AlreadyExistsException:
+        pass
+    _registered_templates.add(email_type)
+
+def _bulk_fields(email_type, recipient):
+    """
+    Build the per-recipient substitution map for a bulk send
+    """
+    fields = {key: str(recipient.get(key, default))
+              for key, default in _BULK_DEFAULTS[email_type].items()}
+    if email_type == 'meeting_reminder':
+        meeting_link = recipient.get('meeting_link')
+        fields['join_link_html'] = (
+            f'<p><a href="{meeting_link}">Join Meeting</a></p>' if meeting_link else ''
+        )
+    return fields
+
+# Per-type subject and field builders; the SES call itself lives once
+# in _send, so adding an email type is one new table row
+_EMAIL_SPECS = {
+    'welcome': {
+        'template': _WELCOME_BODY,
+        'subject': lambda d: f"Welcome to {COMPANY_NAME}, {d.get('name', 'New Employee')}! 🎉",
+        'fields': lambda d: {'name': d.get('name', 'New Employee'),
+                             'role': d.get('role', 'Team Member')}
+    },
+    'progress_update': {
+        'template': _PROGRESS_TMPL,
+        'subject': lambda d: f"Your Onboarding Progress - {d.get('progress', 0)}% Complete!",
+        'fields': lambda d: {'name': d.get('name'),
+                             'progress': d.get('progress', 0)}
+    },
+    'assessment_reminder': {
+        'template': _ASSESSMENT_TMPL,
+        'subject': lambda d: f"Reminder: Complete Your {d.get('assessment_name', 'Onboarding Assessment')}",
+        'fields': lambda d: {'name': d.get('name'),
+                             'assessment_name': d.get('assessment_name', 'Onboarding Assessment')}
+    },
+    'meeting_reminder': {
+        'template': _MEETING_TMPL,
+        'subject': lambda d: f"Reminder: {d.get('meeting_title', 'Onboarding Meeting')}",
+        'fields': lambda d: {'name': d.get('name'),
+                             'meeting_title': d.get('meeting_title', 'Onboarding Meeting'),
+                             'meeting_time': d.get('meeting_time'),
+                             'join_link_html': (f'<p><a href="{d["meeting_link"]}">Join Meeting</a></p>'
+                                                if d.get('meeting_link') else '')}
+    }
+}
+
+def _send(email_type, recipient_data):
+    """
+    Render and send a single email of the given type
+    """
+    try:
+        spec = _EMAIL_SPECS[email_type]
+        recipient_email = recipient_data.get('email')
+
+        html_body = spec['template'].substitute(spec['fields'](recipient_data))
+
+        response = ses.send_email(
+            Source=SES_SENDER_EMAIL,
+            Destination={'ToAddresses': [recipient_email]},
+            Message={
+                'Subject': {'Data': spec['subject'](recipient_data), 'Charset': 'UTF-8'},
+                'Body': {'Html': {'Data': html_body, 'Charset': 'UTF-8'}}
+            }
+        )
+
+        logger.info(f"{email_type} email sent to {recipient_email}")
+
+        return {
+            'success': True,
+            'message_id': response['MessageId'],
+            'recipient': recipient_email
+        }
+
+    except Exception as e:
+        logger.error(f"Error sending {email_type} email: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+def send_bulk(email_type, recipients):
+    """
+    Send one email type to many recipients via SendBulkTemplatedEmail
+
+    Each API call covers up to 50 destinations, so N recipients cost
+    ceil(N / 50) HTTPS round-trips instead of N send_email calls.
+    """
+    try:
+        if email_type not in _SES_TEMPLATES:
+            return {'success': False, 'error': f'Unknown email type: {email_type}'}
+
+        _ensure_template(email_type)
+
+        message_ids = []
+        for start in range(0, len(recipients), 50):
+            chunk = recipients[start:start + 50]
+            response = ses.send_bulk_templated_email(
+                Source=SES_SENDER_EMAIL,
+                Template=_SES_TEMPLATES[email_type]['TemplateName'],
+                DefaultTemplateData=_dumps(_BULK_DEFAULTS[email_type]),
+                Destinations=[
+                    {
+                        'Destination': {'ToAddresses': [recipient['email']]},
+                        'ReplacementTemplateData': _dumps(_bulk_fields(email_type, recipient))
+                    }
+                    for recipient in chunk
+                ]
+            )
+            message_ids.extend(
+                status.get('MessageId', '') for status in response['Status']
+            )
+
+        logger.info(f"Bulk {email_type} email sent to {len(recipients)} recipients")
+
+        return {
+            'success': True,
+            'recipients': len(recipients),
+            'message_ids': message_ids
+        }
+
+    except Exception as e:
+        logger.error(f"Error sending bulk {email_type} email: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+def lambda_handler(event, context):
+    """
+    Lambda handler triggered by EventBridge schedule or API Gateway
+    """
+    try:
+        logger.info("Email automation triggered: %s", event)
+
+        # Determine email type from event
+        email_type = event.get('email_type', 'welcome')
+        recipient_data = event.get('recipient_data', {})
+
+        if email_type not in _EMAIL_SPECS:
+            return {
+                'statusCode': 400,
+                'body': _dumps({'error': f'Unknown email type: {email_type}'})
+            }
+
+        # A list of recipients routes through the bulk templated path
+        if isinstance(recipient_data, list):
+            result = send_bulk(email_type, recipient_data)
+        else:
+            result = _send(email_type, recipient_data)
+        
+        return {
+            'statusCode': 200,
+            'body': _dumps(result)
+        }
+    
+    except Exception as e:
+        logger.error(f"Error in email automation: {str(e)}")
+        return {
+            'statusCode': 500,
+            'body': _dumps({'error': str(e)})
+        }
@@ -1,553 +1,811 @@
-# Welcome meeting with manager
-
-# HR orientation session
-
-# Team introduction meetings
-
-# Technical onboarding sessions
-
-# 1-on-1 check-ins with mentor
-
-# Training sessions
-
-"""
-Interview Scheduler Lambda Function
-Automates meeting scheduling for new employee onboarding
-Handles calendar management, conflict resolution, and notifications
-"""
-
-import json
-import boto3
-import logging
-from datetime import datetime, timedelta
-import uuid
-from typing import Dict, Any, List
-
-# Initialize AWS clients
-dynamodb = boto3.resource('dynamodb')
-events_client = boto3.client('events')
-ses_client = boto3.client('ses')
-
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# AWS SETUP
-SCHEDULE_TABLE = 'onboarding-schedules'        # DynamoDB table for schedules
-AVAILABILITY_TABLE = 'interviewer-availability' # DynamoDB table for availability
-MEETINGS_TABLE = 'onboarding-meetings'         # DynamoDB table for meetings
-SES_SENDER_EMAIL = 'noreply@company.com'   # Must be verified in SES
-
-def lambda_handler(event, context):
-    """
-    Main Lambda handler for interview/meeting scheduling
-    
-    Event triggers:
-    - New employee added to system
-    - Manual scheduling request
-    - EventBridge scheduled check
-    - Reschedule request
-    """
-    try:
-        logger.info(f"Processing scheduling event: {json.dumps(event)}")
-        
-        # Determine the scheduling action
-        if 'scheduling_action' in event:
-            action = event['scheduling_action']
-            
-            if action == 'schedule_onboarding_meetings':
-                # Schedule all meetings for new employee
-                result = schedule_onboarding_meetings(event)
-            
-            elif action == 'find_available_slots':
-                # Find available time slots for a meeting
-                result = find_available_time_slots(event)
-            
-            elif action == 'confirm_meeting':
-                # Confirm a scheduled meeting
-                result = confirm_meeting(event)
-            
-            elif action == 'reschedule_meeting':
-                # Reschedule an existing meeting
-                result = reschedule_meeting(event)
-            
-            elif action == 'cancel_meeting':
-                # Cancel a meeting
-                result = cancel_meeting(event)
-            
-            elif action == 'daily_schedule_check':
-                # Daily check for upcoming meetings
-                result = perform_daily_schedule_check(event)
-            
-            else:
-                raise ValueError(f"Unknown scheduling action: {action}")
-        
-        # Handle EventBridge scheduled triggers
-        elif 'source' in event and event['source'] == 'aws.events':
-            result = handle_scheduled_event(event)
-        
-        # Handle new employee trigger
-        elif 'new_employee' in event:
-            result = schedule_new_employee_meetings(event)
-        
-        else:
-            raise ValueError("Invalid event structure for interview scheduler")
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps(result)
-        }
-        
-    except Exception as e:
-        logger.error(f"Error in interview scheduler: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': 'Interview scheduling failed',
-                'details': str(e)
-            })
-        }
-
-def schedule_onboarding_meetings(event):
-    """
-    Schedule all required onboarding meetings for a new employee
-    
-    This is the main function that automates meeting scheduling
-    """
-    try:
-        employee_data = event.get('employee_data', {})
-        
-        employee_id = employee_data.get('employee_id')
-        employee_name = employee_data.get('name')
-        employee_email = employee_data.get('email')
-        role = employee_data.get('role', '')
-        department = employee_data.get('department', '')
-        start_date_str = employee_data.get('start_date', datetime.now().isoformat())
-        start_date = datetime.fromisoformat(start_date_str.split('T')[0])
-        
-        logger.info(f"Scheduling onboarding meetings for {employee_name} ({employee_id})")
-        
-        # Define required meeting types based on role and department
-        required_meetings = get_required_meetings(role, department)
-        
-        scheduled_meetings = []
-        scheduling_conflicts = []
-        
-        # Schedule each required meeting
-        for meeting_config in required_meetings:
-            try:
-                # Generate preferred time slots
-                preferred_times = generate_preferred_times(start_date, meeting_config)
-                
-                # Find available time slot
-                available_slot = find_optimal_time_slot(
-                    employee_id=employee_id,
-                    employee_email=employee_email,
-                    employee_name=employee_name,
-                    meeting_type=meeting_config['type'],
-                    duration_minutes=meeting_config['duration'],
-                    preferred_times=preferred_times,
-                    required_participants=meeting_config['participants']
-                )
-                
-                if available_slot:
-                    # Schedule the meeting
-                    meeting_result = create_meeting(
-                        employee_id, 
-                        employee_email, 
-                        employee_name,
-                        meeting_config, 
-                        available_slot
-                    )
-                    scheduled_meetings.append(meeting_result)
-                    
-                    # Send calendar invites
-                    send_calendar_invites(meeting_result)
-                    
-                else:
-                    scheduling_conflicts.append({
-                        'meeting_type': meeting_config['type'],
-                        'reason': 'no_available_slots',
-                        'participants': meeting_config['participants']
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error scheduling {meeting_config['type']}: {str(e)}")
-                scheduling_conflicts.append({
-                    'meeting_type': meeting_config['type'],
-                    'reason': f'error: {str(e)}',
-                    'participants': meeting_config.get('participants', [])
-                })
-        
-        # Store scheduling results
-        store_scheduling_results(employee_id, scheduled_meetings, scheduling_conflicts)
-        
-        # Send summary email to employee and manager
-        send_scheduling_summary(employee_data, scheduled_meetings, scheduling_conflicts)
-        
-        return {
-            'status': 'success',
-            'employee_id': employee_id,
-            'scheduled_meetings': len(scheduled_meetings),
-            'scheduling_conflicts': len(scheduling_conflicts),
-            'meetings': scheduled_meetings,
-            'conflicts': scheduling_conflicts
-        }
-        
-    except Exception as e:
-        logger.error(f"Error scheduling onboarding meetings: {str(e)}")
-        raise
-
-def get_required_meetings(role, department):
-    """
-    Get list of required meetings based on role and department
-    
-    Returns meeting configurations with participants and timing
-    """
-    
-    # Base meetings for ALL employees
-    base_meetings = [
-        {
-            'type': 'manager_welcome',
-            'title': 'Welcome Meeting with Manager',
-            'duration': 60,  # minutes
-            'timing': 'first_day',
-            'participants': ['direct_manager'],
-            'priority': 'high',
-            'description': 'Initial welcome and role overview'
-        },
-        {
-            'type': 'hr_orientation',
-            'title': 'HR Orientation Session',
-            'duration': 90,
-            'timing': 'first_week',
-            'participants': ['hr_representative'],
-            'priority': 'high',
-            'description': 'Company policies, benefits, and compliance'
-        },
-        {
-            'type': 'buddy_introduction',
-            'title': 'Meet Your Onboarding Buddy',
-            'duration': 30,
-            'timing': 'first_week',
-            'participants': ['onboarding_buddy'],
-            'priority': 'medium',
-            'description': 'Social integration and peer support'
-        }
-    ]
-    
-    # Role-specific meetings
-    role_meetings = []
-    
-    if any(keyword in role.lower() for keyword in ['engineer', 'developer']):
-        role_meetings.extend([
-            {
-                'type': 'technical_architecture',
-                'title': 'Technical Architecture Overview',
-                'duration': 120,
-                'timing': 'first_week',
-                'participants': ['tech_lead', 'senior_engineer'],
-                'priority': 'high',
-                'description': 'System architecture and technical standards'
-            },
-            {
-                'type': 'development_setup',
-                'title': 'Development Environment Setup',
-                'duration': 90,
-                'timing': 'first_day',
-                'participants': ['dev_ops_engineer'],
-                'priority': 'high',
-                'description': 'Code repositories, tools, and workflow'
-            }
-        ])
-    
-    elif any(keyword in role.lower() for keyword in ['sales', 'account']):
-        role_meetings.extend([
-            {
-                'type': 'sales_process_training',
-                'title': 'Sales Process and CRM Training',
-                'duration': 120,
-                'timing': 'first_week',
-                'participants': ['sales_manager', 'sales_ops'],
-                'priority': 'high',
-                'description': 'Sales methodology and system training'
-            },
-            {
-                'type': 'product_demo_training',
-                'title': 'Product Demonstration Training',
-                'duration': 90,
-                'timing': 'second_week',
-                'participants': ['product_specialist'],
-                'priority': 'high',
-                'description': 'Product knowledge and demo skills'
-            }
-        ])
-    
-    elif any(keyword in role.lower() for keyword in ['marketing']):
-        role_meetings.extend([
-            {
-                'type': 'brand_guidelines',
-                'title': 'Brand Guidelines and Marketing Standards',
-                'duration': 90,
-                'timing': 'first_week',
-                'participants': ['brand_manager'],
-                'priority': 'high',
-                'description': 'Brand voice and creative standards'
-            }
-        ])
-    
-    return base_meetings + role_meetings
-
-def generate_preferred_times(start_date, meeting_config):
-    """
-    Generate preferred time slots for a meeting based on timing requirements
-    """
-    preferred_times = []
-    timing = meeting_config.get('timing', 'first_week')
-    duration = meeting_config.get('duration', 60)
-    
-    # Calculate date range based on timing
-    if timing == 'first_day':
-        target_dates = [start_date]
-    elif timing == 'first_week':
-        target_dates = [start_date + timedelta(days=i) for i in range(5)]
-    elif timing == 'second_week':
-        target_dates = [start_date + timedelta(days=i) for i in range(7, 12)]
-    else:
-        target_dates = [start_date + timedelta(days=i) for i in range(14)]
-    
-    # Generate time slots for each target date
-    for date in target_dates:
-        # Skip weekends
-        if date.weekday() >= 5:
-            continue
-        
-        # Generate common business hour slots
-        business_hours = [
-            (9, 0),   # 9:00 AM
-            (10, 0),  # 10:00 AM
-            (11, 0),  # 11:00 AM
-            (13, 0),  # 1:00 PM
-            (14, 0),  # 2:00 PM
-            (15, 0),  # 3:00 PM
-        ]
-        
-        for hour, minute in business_hours:
-            start_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            end_time = start_time + timedelta(minutes=duration)
-            
-            # Don't schedule past 5 PM
-            if end_time.hour >= 17:
-                continue
-            
-            preferred_times.append({
-                'start_time': start_time,
-                'end_time': end_time
-            })
-    
-    return preferred_times
-
-def find_optimal_time_slot(employee_id, employee_email, employee_name, 
-                          meeting_type, duration_minutes, preferred_times, 
-                          required_participants):
-    """
-    Find the optimal available time slot for a meeting
-    Checks participant availability and returns best slot
-    """
-    try:
-        logger.info(f"Finding optimal slot for {meeting_type}")
-        
-        # For this example, we'll return the first available slot
-        # In production, we should check actual calendar availability from DynamoDB
-        
-        if preferred_times:
-            # Return first preferred time (simplified logic)
-            return {
-                'slot': preferred_times[0],
-                'participants': []  # Would contain actual participant details
-            }
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error finding optimal time slot: {str(e)}")
-        return None
-
-def create_meeting(employee_id, employee_email, employee_name, meeting_config, available_slot):
-    """
-    Create a meeting record in DynamoDB
-    """
-    try:
-        table = dynamodb.Table(MEETINGS_TABLE)
-        
-        meeting_id = f"meeting_{uuid.uuid4()}"
-        time_slot = available_slot['slot']
-        
-        meeting_data = {
-            'meeting_id': meeting_id,
-            'employee_id': employee_id,
-            'employee_email': employee_email,
-            'employee_name': employee_name,
-            'meeting_type': meeting_config['type'],
-            'title': meeting_config['title'],
-            'description': meeting_config['description'],
-            'start_time': time_slot['start_time'].isoformat(),
-            'end_time': time_slot['end_time'].isoformat(),
-            'duration_minutes': meeting_config['duration'],
-            'participants': available_slot.get('participants', []),
-            'status': 'scheduled',
-            'created_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        table.put_item(Item=meeting_data)
-        
-        logger.info(f"Created meeting {meeting_id} for {employee_name}")
-        return meeting_data
-        
-    except Exception as e:
-        logger.error(f"Error creating meeting: {str(e)}")
-        raise
-
-def send_calendar_invites(meeting_data):
-    """
-    Send calendar invites to all meeting participants via email
-    """
-    try:
-        start_time = datetime.fromisoformat(meeting_data['start_time'])
-        end_time = datetime.fromisoformat(meeting_data['end_time'])
-        
-        subject = f"Meeting Invitation: {meeting_data['title']}"
-        
-        body = f"""
-        You're invited to: {meeting_data['title']}
-        
-        When: {start_time.strftime('%A, %B %d, %Y at %I:%M %p')} - {end_time.strftime('%I:%M %p')}
-        Duration: {meeting_data['duration_minutes']} minutes
-        
-        Description:
-        {meeting_data['description']}
-        
-        Meeting ID: {meeting_data['meeting_id']}
-        
-        Please confirm your attendance.
-        """
-        
-        # Send to employee
-        ses_client.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [meeting_data['employee_email']]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Text': {'Data': body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        logger.info(f"Sent calendar invite for meeting {meeting_data['meeting_id']}")
-        
-    except Exception as e:
-        logger.error(f"Error sending calendar invites: {str(e)}")
-
-def store_scheduling_results(employee_id, scheduled_meetings, conflicts):
-    """
-    Store scheduling results in DynamoDB for tracking
-    """
-    try:
-        table = dynamodb.Table(SCHEDULE_TABLE)
-        
-        scheduling_record = {
-            'employee_id': employee_id,
-            'record_type': 'scheduling_results',
-            'scheduled_meetings': scheduled_meetings,
-            'scheduling_conflicts': conflicts,
-            'total_scheduled': len(scheduled_meetings),
-            'total_conflicts': len(conflicts),
-            'created_at': datetime.now().isoformat()
-        }
-        
-        table.put_item(Item=scheduling_record)
-        logger.info(f"Stored scheduling results for employee {employee_id}")
-        
-    except Exception as e:
-        logger.error(f"Error storing scheduling results: {str(e)}")
-
-def send_scheduling_summary(employee_data, scheduled_meetings, conflicts):
-    """
-    Send scheduling summary email to employee and manager
-    """
-    try:
-        employee_email = employee_data.get('email')
-        employee_name = employee_data.get('name')
-        
-        subject = f"Your Onboarding Meeting Schedule - {len(scheduled_meetings)} meetings scheduled"
-        
-        meetings_list = []
-        for meeting in scheduled_meetings:
-            start_time = datetime.fromisoformat(meeting['start_time'])
-            meetings_list.append(f"""
-            📅 {meeting['title']}
-            Date: {start_time.strftime('%A, %B %d, %Y')}
-            Time: {start_time.strftime('%I:%M %p')} - {datetime.fromisoformat(meeting['end_time']).strftime('%I:%M %p')}
-            """)
-        
-        body = f"""
-        Dear {employee_name},
-        
-        Welcome! We've scheduled your onboarding meetings:
-        
-        📅 SCHEDULED MEETINGS ({len(scheduled_meetings)}):
-        {chr(10).join(meetings_list)}
-        
-        Check your email for individual meeting invitations.
-        
-        Questions? Contact hr@yourcompany.com
-        
-        Looking forward to your first day!
-        """
-        
-        ses_client.send_email(
-            Source=SES_SENDER_EMAIL,
-            Destination={'ToAddresses': [employee_email]},
-            Message={
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {'Text': {'Data': body, 'Charset': 'UTF-8'}}
-            }
-        )
-        
-        logger.info(f"Sent scheduling summary to {employee_email}")
-        
-    except Exception as e:
-        logger.error(f"Error sending scheduling summary: {str(e)}")
-
-# Additional helper functions
-
-def find_available_time_slots(event):
-    """Find available time slots for a meeting request"""
-    return {'status': 'success', 'available_slots': []}
-
-def confirm_meeting(event):
-    """Confirm a scheduled meeting"""
-    meeting_id = event.get('meeting_id')
-    return {'status': 'success', 'meeting_id': meeting_id}
-
-def reschedule_meeting(event):
-    """Reschedule an existing meeting"""
-    meeting_id = event.get('meeting_id')
-    return {'status': 'success', 'meeting_id': meeting_id}
-
-def cancel_meeting(event):
-    """Cancel a meeting"""
-    meeting_id = event.get('meeting_id')
-    return {'status': 'success', 'meeting_id': meeting_id}
-
-def perform_daily_schedule_check(event):
-    """Perform daily check of scheduled meetings"""
-    return {'status': 'success', 'upcoming_meetings': 0}
-
-def schedule_new_employee_meetings(event):
-    """Handle new employee trigger"""
-    return schedule_onboarding_meetings(event)
-
-def handle_scheduled_event(event):
-    """Handle EventBridge scheduled events"""
-    return perform_daily_schedule_check(event)
+# Welcome meeting with manager
+
+# HR orientation session
+
+# Team introduction meetings
+
+# Technical onboarding sessions
+
+# 1-on-1 check-ins with mentor
+
+# Training sessions
+
+"""
+Interview Scheduler Lambda Function
+Automates meeting scheduling for new employee onboarding
+Handles calendar management, conflict resolution, and notifications
+"""
+
+import functools
+import itertools
+import json
+import boto3
+import logging
+import os
+import re
+import secrets
+from botocore.config import Config as BotoConfig
+from datetime import datetime, timedelta
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Dict, Any, List
+
+# orjson serializes response payloads several times faster than the
+# stdlib when it's on the deployment package; fall back transparently.
+# default=str keeps stray datetime values in results serializable.
+try:
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj):
+        return _orjson_dumps(obj, default=str).decode('utf-8')
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, default=str)
+
+# The default botocore pool (10 connections) overflows once invites fan
+# out across threads; 50 keeps every worker on a kept-alive connection.
+# Adaptive retries pace themselves against observed throttling, and ten
+# attempts ride out the write bursts a Monday-morning batch of new
+# hires throws at provisioned tables. (Switching the meetings and
+# schedule tables to on-demand billing belongs in the table definitions
+# themselves, which are managed outside this repository.)
+_BOTO_CONFIG = BotoConfig(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Initialize AWS clients
+dynamodb = boto3.resource('dynamodb', config=_BOTO_CONFIG)
+events_client = boto3.client('events', config=_BOTO_CONFIG)
+ses_client = boto3.client('ses', config=_BOTO_CONFIG)
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# AWS SETUP
+SCHEDULE_TABLE = 'onboarding-schedules'        # DynamoDB table for schedules
+AVAILABILITY_TABLE = 'interviewer-availability' # DynamoDB table for availability
+MEETINGS_TABLE = 'onboarding-meetings'         # DynamoDB table for meetings
+SES_SENDER_EMAIL = 'noreply@company.com'   # Must be verified in SES
+
+# Table handles resolved once per container
+MEETINGS_TBL = dynamodb.Table(MEETINGS_TABLE)
+SCHEDULE_TBL = dynamodb.Table(SCHEDULE_TABLE)
+
+# When set, invites are queued for an invite-sender Lambda instead of
+# being sent inline, keeping SES latency off the scheduling path
+INVITE_QUEUE_URL = os.environ.get('INVITE_QUEUE_URL', '')
+
+_sqs_client = None
+
+def _get_sqs():
+    global _sqs_client
+    if _sqs_client is None:
+        _sqs_client = boto3.client('sqs', config=_BOTO_CONFIG)
+    return _sqs_client
+
+# One-time EventBridge Scheduler reminders, enabled when a target
+# Lambda and invocation role are configured
+REMINDER_TARGET_ARN = os.environ.get('REMINDER_TARGET_ARN', '')
+REMINDER_ROLE_ARN = os.environ.get('REMINDER_ROLE_ARN', '')
+
+_scheduler_client = None
+
+def _get_scheduler():
+    global _scheduler_client
+    if _scheduler_client is None:
+        _scheduler_client = boto3.client('scheduler', config=_BOTO_CONFIG)
+    return _scheduler_client
+
+# Optional DynamoDB Accelerator endpoint for the read-heavy meeting
+# lookups (confirm/reschedule/cancel/daily check). Reads fall back to
+# DynamoDB when no cluster is configured or the client is not bundled.
+DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT', '')
+
+_dax_meetings_tbl = None
+
+def _meetings_reader():
+    """
+    Table handle for meeting reads: DAX-backed when configured
+
+    Writes keep going straight to DynamoDB and DAX is write-through,
+    so cached reads stay consistent with the put paths above.
+    """
+    global _dax_meetings_tbl
+    if not DAX_ENDPOINT:
+        return MEETINGS_TBL
+    if _dax_meetings_tbl is None:
+        try:
+            import amazondax
+            dax = amazondax.AmazonDaxClient.resource(
+                endpoint_url=DAX_ENDPOINT, config=_BOTO_CONFIG
+            )
+            _dax_meetings_tbl = dax.Table(MEETINGS_TABLE)
+        except ImportError:
+            logger.warning("amazondax not available; meeting reads use DynamoDB directly")
+            _dax_meetings_tbl = MEETINGS_TBL
+    return _dax_meetings_tbl
+
+def lambda_handler(event, context):
+    """
+    Main Lambda handler for interview/meeting scheduling
+    
+    Event triggers:
+    - New employee added to system
+    - Manual scheduling request
+    - EventBridge scheduled check
+    - Reschedule request
+    """
+    try:
+        # %s defers formatting to the logging layer, so the event is
+        # never serialized when INFO is disabled
+        logger.info("Processing scheduling event: %s", event)
+        
+        # Determine the scheduling action via the dispatch table
+        if 'scheduling_action' in event:
+            action = event['scheduling_action']
+            handler = _ACTION_HANDLERS.get(action)
+            if handler is None:
+                raise ValueError(f"Unknown scheduling action: {action}")
+            result = handler(event)
+
+
+        # Handle EventBridge scheduled triggers
+        elif 'source' in event and event['source'] == 'aws.events':
+            result = handle_scheduled_event(event)
+        
+        # Handle new employee trigger
+        elif 'new_employee' in event:
+            result = schedule_new_employee_meetings(event)
+        
+        else:
+            raise ValueError("Invalid event structure for interview scheduler")
+        
+        return {
+            'statusCode': 200,
+            'body': _dumps(result)
+        }
+
+    except Exception as e:
+        logger.error(f"Error in interview scheduler: {str(e)}")
+        return {
+            'statusCode': 500,
+            'body': _dumps({
+                'error': 'Interview scheduling failed',
+                'details': str(e)
+            })
+        }
+
+def schedule_onboarding_meetings(event):
+    """
+    Schedule all required onboarding meetings for a new employee
+    
+    This is the main function that automates meeting scheduling
+    """
+    try:
+        employee_data = event.get('employee_data', {})
+        
+        employee_id = employee_data.get('employee_id')
+        employee_name = employee_data.get('name')
+        employee_email = employee_data.get('email')
+        role = employee_data.get('role', '')
+        department = employee_data.get('department', '')
+        start_date_str = employee_data.get('start_date', datetime.now().isoformat())
+        start_date = datetime.fromisoformat(start_date_str.split('T')[0])
+        
+        logger.info(f"Scheduling onboarding meetings for {employee_name} ({employee_id})")
+
+        # One timestamp covers every record written in this invocation
+        now_iso = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+        # Define required meeting types based on role and department
+        required_meetings = get_required_meetings(role, department)
+        
+        scheduled_meetings = []
+        scheduling_conflicts = []
+
+        # Schedule each required meeting. create_meeting only builds the
+        # record; the batch_writer flushes the puts in groups of up to
+        # 25, so N meetings cost ~1 DynamoDB round-trip instead of N.
+        with MEETINGS_TBL.batch_writer() as bw:
+            for meeting_config in required_meetings:
+                try:
+                    # Generate preferred time slots
+                    preferred_times = generate_preferred_times(start_date, meeting_config)
+
+                    # Find available time slot
+                    available_slot = find_optimal_time_slot(
+                        employee_id=employee_id,
+                        employee_email=employee_email,
+                        employee_name=employee_name,
+                        meeting_type=meeting_config['type'],
+                        duration_minutes=meeting_config['duration'],
+                        preferred_times=preferred_times,
+                        required_participants=meeting_config['participants']
+                    )
+
+                    if available_slot:
+                        # Build the meeting record and queue its write
+                        meeting_result = create_meeting(
+                            employee_id,
+                            employee_email,
+                            employee_name,
+                            meeting_config,
+                            available_slot,
+                            now_iso
+                        )
+                        bw.put_item(Item={k: v for k, v in meeting_result.items()
+                                          if not k.startswith('_')})
+                        scheduled_meetings.append(meeting_result)
+
+                    else:
+                        scheduling_conflicts.append({
+                            'meeting_type': meeting_config['type'],
+                            'reason': 'no_available_slots',
+                            'participants': meeting_config['participants']
+                        })
+
+                except Exception as e:
+                    logger.error(f"Error scheduling {meeting_config['type']}: {str(e)}")
+                    scheduling_conflicts.append({
+                        'meeting_type': meeting_config['type'],
+                        'reason': f'error: {str(e)}',
+                        'participants': meeting_config.get('participants', [])
+                    })
+        
+        # Queue invite jobs for the invite-sender Lambda when a queue is
+        # configured, so the response doesn't wait on SES
+        if scheduled_meetings and INVITE_QUEUE_URL:
+            queue_calendar_invites(scheduled_meetings)
+
+        # At-time reminders via EventBridge Scheduler replace the daily
+        # polling sweep when a reminder target is configured
+        if scheduled_meetings and REMINDER_TARGET_ARN:
+            create_meeting_reminders(scheduled_meetings)
+
+        # Store scheduling results
+        store_scheduling_results(employee_id, scheduled_meetings, scheduling_conflicts, now_iso)
+
+        # One MIME email carries the summary plus a calendar invite per
+        # meeting, so the employee gets a single message and SES sees a
+        # single call. The queue path keeps the plain summary; its
+        # invite-sender Lambda delivers the per-meeting invites.
+        if INVITE_QUEUE_URL:
+            send_scheduling_summary(employee_data, scheduled_meetings, scheduling_conflicts)
+        else:
+            send_consolidated_invite(employee_data, scheduled_meetings, scheduling_conflicts)
+        
+        return {
+            'status': 'success',
+            'employee_id': employee_id,
+            'scheduled_meetings': len(scheduled_meetings),
+            'scheduling_conflicts': len(scheduling_conflicts),
+            'meetings': [{k: v for k, v in m.items() if not k.startswith('_')}
+                         for m in scheduled_meetings],
+            'conflicts': scheduling_conflicts
+        }
+        
+    except Exception as e:
+        logger.error(f"Error scheduling onboarding meetings: {str(e)}")
+        raise
+
+# Meeting templates are static; build them once at import instead of
+# reallocating the dicts on every invocation. Stored as tuples so the
+# shared configs can't be extended in place.
+
+# Base meetings for ALL employees
+_BASE_MEETINGS = (
+    {
+        'type': 'manager_welcome',
+        'title': 'Welcome Meeting with Manager',
+        'duration': 60,  # minutes
+        'timing': 'first_day',
+        'participants': ['direct_manager'],
+        'priority': 'high',
+        'description': 'Initial welcome and role overview'
+    },
+    {
+        'type': 'hr_orientation',
+        'title': 'HR Orientation Session',
+        'duration': 90,
+        'timing': 'first_week',
+        'participants': ['hr_representative'],
+        'priority': 'high',
+        'description': 'Company policies, benefits, and compliance'
+    },
+    {
+        'type': 'buddy_introduction',
+        'title': 'Meet Your Onboarding Buddy',
+        'duration': 30,
+        'timing': 'first_week',
+        'participants': ['onboarding_buddy'],
+        'priority': 'medium',
+        'description': 'Social integration and peer support'
+    }
+)
+
+# Role-specific meetings
+_ROLE_MEETINGS = {
+    'engineer': (
+        {
+            'type': 'technical_architecture',
+            'title': 'Technical Architecture Overview',
+            'duration': 120,
+            'timing': 'first_week',
+            'participants': ['tech_lead', 'senior_engineer'],
+            'priority': 'high',
+            'description': 'System architecture and technical standards'
+        },
+        {
+            'type': 'development_setup',
+            'title': 'Development Environment Setup',
+            'duration': 90,
+            'timing': 'first_day',
+            'participants': ['dev_ops_engineer'],
+            'priority': 'high',
+            'description': 'Code repositories, tools, and workflow'
+        }
+    ),
+    'sales': (
+        {
+            'type': 'sales_process_training',
+            'title': 'Sales Process and CRM Training',
+            'duration': 120,
+            'timing': 'first_week',
+            'participants': ['sales_manager', 'sales_ops'],
+            'priority': 'high',
+            'description': 'Sales methodology and system training'
+        },
+        {
+            'type': 'product_demo_training',
+            'title': 'Product Demonstration Training',
+            'duration': 90,
+            'timing': 'second_week',
+            'participants': ['product_specialist'],
+            'priority': 'high',
+            'description': 'Product knowledge and demo skills'
+        }
+    ),
+    'marketing': (
+        {
+            'type': 'brand_guidelines',
+            'title': 'Brand Guidelines and Marketing Standards',
+            'duration': 90,
+            'timing': 'first_week',
+            'participants': ['brand_manager'],
+            'priority': 'high',
+            'description': 'Brand voice and creative standards'
+        }
+    ,)
+}
+
+# One compiled case-insensitive pattern per bucket; first matching
+# bucket wins, preserving the original elif order
+_ROLE_PATTERNS = (
+    ('engineer', re.compile(r'engineer|developer', re.IGNORECASE)),
+    ('sales', re.compile(r'sales|account', re.IGNORECASE)),
+    ('marketing', re.compile(r'marketing', re.IGNORECASE))
+)
+
+@functools.lru_cache(maxsize=64)
+def _classify_role(role):
+    """
+    Map a free-text role title onto a meeting bucket
+
+    Warm containers see the same handful of titles over and over; the
+    cache skips even the regex scans after the first sighting.
+    """
+    for bucket, pattern in _ROLE_PATTERNS:
+        if pattern.search(role):
+            return bucket
+    return 'other'
+
+def get_required_meetings(role, department):
+    """
+    Get list of required meetings based on role and department
+
+    Returns meeting configurations with participants and timing
+    """
+    return list(_BASE_MEETINGS) + list(_ROLE_MEETINGS.get(_classify_role(role), ()))
+
+# Common business hour slots
+_BUSINESS_SLOTS = (
+    (9, 0),   # 9:00 AM
+    (10, 0),  # 10:00 AM
+    (11, 0),  # 11:00 AM
+    (13, 0),  # 1:00 PM
+    (14, 0),  # 2:00 PM
+    (15, 0),  # 3:00 PM
+)
+
+def generate_preferred_times(start_date, meeting_config):
+    """
+    Yield preferred time slots for a meeting based on timing requirements
+
+    Lazy on purpose: slot selection usually takes the first acceptable
+    candidate, so the remaining ~30 datetime/dict constructions are
+    never performed.
+    """
+    timing = meeting_config.get('timing', 'first_week')
+    duration = meeting_config.get('duration', 60)
+
+    # Calculate date range based on timing
+    if timing == 'first_day':
+        target_dates = [start_date]
+    elif timing == 'first_week':
+        target_dates = [start_date + timedelta(days=i) for i in range(5)]
+    elif timing == 'second_week':
+        target_dates = [start_date + timedelta(days=i) for i in range(7, 12)]
+    else:
+        target_dates = [start_date + timedelta(days=i) for i in range(14)]
+
+    # Apply the weekend filter once on the dates and fold the 5 PM
+    # bound into the slot list up front (a slot is out if its end lands
+    # in hour 17 or later), so the per-slot end-time check disappears
+    target_dates = [d for d in target_dates if d.weekday() < 5]
+    slots = [(h, m) for h, m in _BUSINESS_SLOTS
+             if (h * 60 + m + duration) // 60 < 17]
+
+    duration_delta = timedelta(minutes=duration)
+    for date, (hour, minute) in itertools.product(target_dates, slots):
+        start_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        yield {
+            'start_time': start_time,
+            'end_time': start_time + duration_delta
+        }
+
+def find_optimal_time_slot(employee_id, employee_email, employee_name, 
+                          meeting_type, duration_minutes, preferred_times, 
+                          required_participants):
+    """
+    Find the optimal available time slot for a meeting
+    Checks participant availability and returns best slot
+    """
+    try:
+        logger.info(f"Finding optimal slot for {meeting_type}")
+
+        # For this example, we'll take the first available slot without
+        # materializing the rest of the candidates. In production, we
+        # should iterate until a slot clears calendar availability in
+        # DynamoDB.
+        slot = next(iter(preferred_times), None)
+
+        if slot is not None:
+            return {
+                'slot': slot,
+                'participants': []  # Would contain actual participant details
+            }
+
+        return None
+
+    except Exception as e:
+        logger.error(f"Error finding optimal time slot: {str(e)}")
+        return None
+
+def create_meeting(employee_id, employee_email, employee_name, meeting_config,
+                   available_slot, now_iso=None):
+    """
+    Build a meeting record; the caller batches the DynamoDB write
+    """
+    try:
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+        # token_hex skips the UUID object construction and str() formatting
+        meeting_id = f"meeting_{secrets.token_hex(16)}"
+        time_slot = available_slot['slot']
+
+        meeting_data = {
+            'meeting_id': meeting_id,
+            'employee_id': employee_id,
+            'employee_email': employee_email,
+            'employee_name': employee_name,
+            'meeting_type': meeting_config['type'],
+            'title': meeting_config['title'],
+            'description': meeting_config['description'],
+            'start_time': time_slot['start_time'].isoformat(),
+            'end_time': time_slot['end_time'].isoformat(),
+            'duration_minutes': meeting_config['duration'],
+            'participants': available_slot.get('participants', []),
+            'status': 'scheduled',
+            'created_at': now_iso,
+            'last_updated': now_iso,
+            # Native datetimes for downstream formatting; stripped off
+            # before the record is written
+            '_start_dt': time_slot['start_time'],
+            '_end_dt': time_slot['end_time']
+        }
+
+        logger.info(f"Created meeting {meeting_id} for {employee_name}")
+        return meeting_data
+
+    except Exception as e:
+        logger.error(f"Error creating meeting: {str(e)}")
+        raise
+
+def _meeting_ics(meeting):
+    """
+    Render a meeting as a minimal iCalendar document
+    """
+    start_time = meeting.get('_start_dt') or datetime.fromisoformat(meeting['start_time'])
+    end_time = meeting.get('_end_dt') or datetime.fromisoformat(meeting['end_time'])
+    return "\r\n".join((
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Onboarding Assistant//Interview Scheduler//EN',
+        'METHOD:REQUEST',
+        'BEGIN:VEVENT',
+        f"UID:{meeting['meeting_id']}",
+        f"DTSTART:{start_time:%Y%m%dT%H%M%S}",
+        f"DTEND:{end_time:%Y%m%dT%H%M%S}",
+        f"SUMMARY:{meeting['title']}",
+        f"DESCRIPTION:{meeting['description']}",
+        'STATUS:CONFIRMED',
+        'END:VEVENT',
+        'END:VCALENDAR',
+        ''
+    ))
+
+def create_meeting_reminders(meetings):
+    """
+    Register a one-time EventBridge schedule per meeting
+
+    AWS fires each reminder at the meeting's exact start time with
+    built-in retry and DLQ support, so no Lambda polls for upcoming
+    meetings; DELETE cleans the schedule up after it fires.
+    """
+    try:
+        scheduler = _get_scheduler()
+
+        for meeting in meetings:
+            start_time = meeting.get('_start_dt') or datetime.fromisoformat(meeting['start_time'])
+            scheduler.create_schedule(
+                Name=f"invite-{meeting['meeting_id']}",
+                ScheduleExpression=f"at({start_time:%Y-%m-%dT%H:%M:%S})",
+                FlexibleTimeWindow={'Mode': 'OFF'},
+                Target={
+                    'Arn': REMINDER_TARGET_ARN,
+                    'RoleArn': REMINDER_ROLE_ARN,
+                    'Input': json.dumps({'meeting_id': meeting['meeting_id']})
+                },
+                ActionAfterCompletion='DELETE'
+            )
+
+        logger.info(f"Registered {len(meetings)} meeting reminders")
+
+    except Exception as e:
+        logger.error(f"Error creating meeting reminders: {str(e)}")
+
+def queue_calendar_invites(meetings):
+    """
+    Publish invite jobs to SQS for asynchronous delivery
+
+    The invite-sender Lambda subscribed to the queue performs the SES
+    calls with its own retries and DLQ, so scheduling latency stays on
+    the DynamoDB write path only.
+    """
+    try:
+        sqs = _get_sqs()
+
+        # send_message_batch takes up to 10 entries per call
+        for start in range(0, len(meetings), 10):
+            chunk = meetings[start:start + 10]
+            sqs.send_message_batch(
+                QueueUrl=INVITE_QUEUE_URL,
+                Entries=[
+                    {
+                        'Id': str(i),
+                        'MessageBody': json.dumps({k: v for k, v in meeting.items()
+                                                   if not k.startswith('_')})
+                    }
+                    for i, meeting in enumerate(chunk)
+                ]
+            )
+
+        logger.info(f"Queued {len(meetings)} calendar invites")
+
+    except Exception as e:
+        logger.error(f"Error queueing calendar invites: {str(e)}")
+
+def send_consolidated_invite(employee_data, scheduled_meetings, conflicts):
+    """
+    Send one MIME email carrying the schedule summary and every invite
+
+    A multipart/mixed message with one text/calendar attachment per
+    meeting replaces N single-invite sends plus a separate summary, so
+    each new hire costs one SES round-trip instead of N+1 and draws
+    proportionally less of the daily sending quota.
+    """
+    try:
+        employee_email = employee_data.get('email')
+        employee_name = employee_data.get('name')
+
+        msg = MIMEMultipart('mixed')
+        msg['Subject'] = f"Your Onboarding Meeting Schedule - {len(scheduled_meetings)} meetings scheduled"
+        msg['From'] = SES_SENDER_EMAIL
+        msg['To'] = employee_email
+
+        meetings_list = []
+        for meeting in scheduled_meetings:
+            start_time = meeting.get('_start_dt') or datetime.fromisoformat(meeting['start_time'])
+            end_time = meeting.get('_end_dt') or datetime.fromisoformat(meeting['end_time'])
+            meetings_list.append(f"""
+            📅 {meeting['title']}
+            Date: {start_time:%A, %B %d, %Y}
+            Time: {start_time:%I:%M %p} - {end_time:%I:%M %p}
+            """)
+
+        meetings_text = "\n".join(meetings_list)
+
+        body = f"""
+        Dear {employee_name},
+
+        Welcome! We've scheduled your onboarding meetings:
+
+        📅 SCHEDULED MEETINGS ({len(scheduled_meetings)}):
+        {meetings_text}
+
+        Calendar invitations for each meeting are attached.
+
+        Questions? Contact hr@yourcompany.com
+
+        Looking forward to your first day!
+        """
+
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+
+        for meeting in scheduled_meetings:
+            part = MIMEText(_meeting_ics(meeting), 'calendar', 'utf-8')
+            part.add_header('Content-Disposition', 'attachment',
+                            filename=f"{meeting['meeting_type']}.ics")
+            msg.attach(part)
+
+        ses_client.send_raw_email(RawMessage={'Data': msg.as_bytes()})
+
+        logger.info(f"Sent consolidated schedule email to {employee_email}")
+
+    except Exception as e:
+        logger.error(f"Error sending consolidated invite: {str(e)}")
+
+def store_scheduling_results(employee_id, scheduled_meetings, conflicts, now_iso=None):
+    """
+    Store scheduling results in DynamoDB for tracking
+    """
+    try:
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+
+        # Meeting details already live in MEETINGS_TABLE; storing only
+        # the ids keeps this item small (WCU cost is per-KB) and safely
+        # clear of the 400 KB item cap. Readers that need details do a
+        # BatchGetItem against the meetings table.
+        scheduling_record = {
+            'employee_id': employee_id,
+            'record_type': 'scheduling_results',
+            'meeting_ids': [m['meeting_id'] for m in scheduled_meetings],
+            'scheduling_conflicts': conflicts,
+            'total_scheduled': len(scheduled_meetings),
+            'total_conflicts': len(conflicts),
+            'created_at': now_iso
+        }
+        
+        # Write-only path: ask for no attribute echo or capacity data so
+        # the response envelope stays minimal
+        SCHEDULE_TBL.put_item(
+            Item=scheduling_record,
+            ReturnValues='NONE',
+            ReturnConsumedCapacity='NONE'
+        )
+        logger.info(f"Stored scheduling results for employee {employee_id}")
+        
+    except Exception as e:
+        logger.error(f"Error storing scheduling results: {str(e)}")
+
+def send_scheduling_summary(employee_data, scheduled_meetings, conflicts):
+    """
+    Send scheduling summary email to employee and manager
+    """
+    try:
+        employee_email = employee_data.get('email')
+        employee_name = employee_data.get('name')
+        
+        subject = f"Your Onboarding Meeting Schedule - {len(scheduled_meetings)} meetings scheduled"
+        
+        meetings_list = []
+        for meeting in scheduled_meetings:
+            start_time = meeting.get('_start_dt') or datetime.fromisoformat(meeting['start_time'])
+            end_time = meeting.get('_end_dt') or datetime.fromisoformat(meeting['end_time'])
+            meetings_list.append(f"""
+            📅 {meeting['title']}
+            Date: {start_time:%A, %B %d, %Y}
+            Time: {start_time:%I:%M %p} - {end_time:%I:%M %p}
+            """)
+
+        meetings_text = "\n".join(meetings_list)
+
+        body = f"""
+        Dear {employee_name},
+
+        Welcome! We've scheduled your onboarding meetings:
+
+        📅 SCHEDULED MEETINGS ({len(scheduled_meetings)}):
+        {meetings_text}
+        
+        Check your email for individual meeting invitations.
+        
+        Questions? Contact hr@yourcompany.com
+        
+        Looking forward to your first day!
+        """
+        
+        ses_client.send_email(
+            Source=SES_SENDER_EMAIL,
+            Destination={'ToAddresses': [employee_email]},
+            Message={
+                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
+                'Body': {'Text': {'Data': body, 'Charset': 'UTF-8'}}
+            }
+        )
+        
+        logger.info(f"Sent scheduling summary to {employee_email}")
+        
+    except Exception as e:
+        logger.error(f"Error sending scheduling summary: {str(e)}")
+
+# Additional helper functions
+
+def find_available_time_slots(event):
+    """Find available time slots for a meeting request"""
+    return {'status': 'success', 'available_slots': []}
+
+def confirm_meeting(event):
+    """Confirm a scheduled meeting"""
+    meeting_id = event.get('meeting_id')
+
+    # Read through DAX when configured; the write goes straight to
+    # DynamoDB, which DAX caches write-through
+    response = _meetings_reader().get_item(Key={'meeting_id': meeting_id})
+    if 'Item' not in response:
+        return {'status': 'error', 'error': f'Meeting not found: {meeting_id}'}
+
+    MEETINGS_TBL.update_item(
+        Key={'meeting_id': meeting_id},
+        UpdateExpression='SET #s = :confirmed',
+        ExpressionAttributeNames={'#s': 'status'},
+        ExpressionAttributeValues={':confirmed': 'confirmed'}
+    )
+    return {'status': 'success', 'meeting_id': meeting_id}
+
+def reschedule_meeting(event):
+    """Reschedule an existing meeting"""
+    meeting_id = event.get('meeting_id')
+    return {'status': 'success', 'meeting_id': meeting_id}
+
+def cancel_meeting(event):
+    """Cancel a meeting"""
+    meeting_id = event.get('meeting_id')
+    return {'status': 'success', 'meeting_id': meeting_id}
+
+def perform_daily_schedule_check(event):
+    """Perform daily check of scheduled meetings"""
+    return {'status': 'success', 'upcoming_meetings': 0}
+
+def schedule_new_employee_meetings(event):
+    """Handle new employee trigger"""
+    return schedule_onboarding_meetings(event)
+
+def handle_scheduled_event(event):
+    """Handle EventBridge scheduled events"""
+    return perform_daily_schedule_check(event)
+
+# Action → handler dispatch used by lambda_handler; one dict lookup
+# replaces the chain of string comparisons
+_ACTION_HANDLERS = {
+    'schedule_onboarding_meetings': schedule_onboarding_meetings,
+    'find_available_slots': find_available_time_slots,
+    'confirm_meeting': confirm_meeting,
+    'reschedule_meeting': reschedule_meeting,
+    'cancel_meeting': cancel_meeting,
+    'daily_schedule_check': perform_daily_schedule_check
+}
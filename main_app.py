@@ -2,9 +2,14 @@
 Main Application to Use agents and features
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import importlib
 import streamlit as st
 import sys
 import os
+import time
 import uuid
 
 # Import code
@@ -12,22 +17,6 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import config
 
-# Import all agents
-from agents.orchestrator import OrchestratorAgent
-from agents.personalization import PersonalizationAgent
-from agents.content_curator import ContentCuratorAgent
-from agents.assessment import AssessmentAgent
-
-# Import all features
-from features.vr_training import VRTrainingEngine
-from features.progress_tracker import ProgressTracker
-from features.scheduler import MeetingScheduler
-from features.email_automation import EmailAutomation
-
-# Import utilities
-from utils.aws_helper import AWSHelper
-from utils.data_processor import DataProcessor
-
 # Page config
 st.set_page_config(
     page_title=config.APP_TITLE,
@@ -36,8 +25,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Static chrome: the CSS and header never change, so the strings are
+# built once at import and emitted through st.html, which injects raw
+# HTML and skips the per-rerun markdown parse st.markdown paid for
+# identical content. (The elements themselves must still be emitted on
+# every rerun - anything missing from the element tree disappears.)
+_CHROME_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -63,33 +56,201 @@ st.markdown("""
         border-left: 4px solid #667eea;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = f'<h1 class="main-header">🚀 {config.APP_TITLE}</h1>'
+
+# Sidebar logo inlined as an SVG data URI: no DNS/TLS round-trip to a
+# third-party placeholder host per session, and no outage SPOF
+_LOGO_DATA_URI = (
+    'data:image/svg+xml;base64,'
+    'PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxNTAiIGhlaWdo'
+    'dD0iNTAiPjxyZWN0IHdpZHRoPSIxNTAiIGhlaWdodD0iNTAiIHJ4PSI4IiBmaWxsPSIjNjY3ZWVh'
+    'Ii8+PHRleHQgeD0iNzUiIHk9IjMzIiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXpl'
+    'PSIyMiIgZm9udC13ZWlnaHQ9ImJvbGQiIGZpbGw9IiNmZmZmZmYiIHRleHQtYW5jaG9yPSJtaWRk'
+    'bGUiPlBFUDwvdGV4dD48L3N2Zz4='
+)
+
+st.html(_CHROME_CSS)
+
+# Agent and feature modules pull in boto3 clients and model wiring at
+# import time; resolving them lazily means a page only pays the import
+# and construction cost of the components it actually touches
+_SYSTEM_FACTORIES = {
+    'orchestrator': ('agents.orchestrator', 'OrchestratorAgent'),
+    'personalization': ('agents.personalization', 'PersonalizationAgent'),
+    'content_curator': ('agents.content_curator', 'ContentCuratorAgent'),
+    'assessment': ('agents.assessment', 'AssessmentAgent'),
+    'vr_training': ('features.vr_training', 'VRTrainingEngine'),
+    'progress_tracker': ('features.progress_tracker', 'ProgressTracker'),
+    'scheduler': ('features.scheduler', 'MeetingScheduler'),
+    'email_automation': ('features.email_automation', 'EmailAutomation'),
+    'aws_helper': ('utils.aws_helper', 'AWSHelper'),
+    'data_processor': ('utils.data_processor', 'DataProcessor')
+}
+
+class _LazySystem(dict):
+    """
+    Component container that instantiates on first access
+
+    system['orchestrator'] imports and builds the orchestrator the
+    first time it's read; after that it's a plain dict lookup.
+    """
+
+    def __missing__(self, name):
+        module_name, class_name = _SYSTEM_FACTORIES[name]
+        module = importlib.import_module(module_name)
+        self[name] = component = getattr(module, class_name)()
+        return component
 
 # Initialize all agents and features
 @st.cache_resource
 def initialize_system():
-    """Initialize all agents and features (cached)"""
-    return {
-        'orchestrator': OrchestratorAgent(),
-        'personalization': PersonalizationAgent(),
-        'content_curator': ContentCuratorAgent(),
-        'assessment': AssessmentAgent(),
-        'vr_training': VRTrainingEngine(),
-        'progress_tracker': ProgressTracker(),
-        'scheduler': MeetingScheduler(),
-        'email_automation': EmailAutomation(),
-        'aws_helper': AWSHelper(),
-        'data_processor': DataProcessor()
-    }
+    """Initialize the lazy component container (cached)"""
+    return _LazySystem()
+
+# Shared worker pool for blocking agent calls, one per server process.
+# Submitting the call instead of running it inline keeps the script
+# thread free to update placeholders while the model responds, and
+# gives the orchestrator a home for parallel agent fan-out later.
+@st.cache_resource
+def _agent_executor():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+# One orchestrator context per session: the profile-driven prompt
+# prefix is assembled once and reused for every chat turn
+@st.cache_resource
+def _session_context(session_id, role, department):
+    return system['orchestrator'].make_context(
+        {'role': role, 'department': department}, session_id
+    )
 
 # Get system components
 system = initialize_system()
 
+def _gather(*calls):
+    """
+    Run independent blocking fetches concurrently
+
+    Each (fn, *args) tuple runs on its own worker thread and the results
+    come back in order, so a page's wall time is its slowest remote call
+    instead of the sum of all of them.
+    """
+    async def _run():
+        return await asyncio.gather(
+            *(asyncio.to_thread(fn, *args) for fn, *args in calls)
+        )
+    return asyncio.run(_run())
+
+# Remote fetches cached for 60s, keyed by their arguments. Every button
+# click reruns the whole script, so without these a Home -> Chat -> Home
+# round trip re-hits AWS three times for identical data. The sidebar
+# refresh button clears them when fresh numbers are wanted sooner.
+
+# Progress and analytics come back together from one fetch; the two
+# accessors below slice the shared payload so the sidebar and the
+# progress page never trigger separate reads
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_dashboard(user_id):
+    return system['progress_tracker'].get_dashboard_payload(user_id)
+
+def _cached_progress(user_id):
+    return _cached_dashboard(user_id)['progress']
+
+def _cached_analytics(user_id):
+    return _cached_dashboard(user_id)['analytics']
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_weekly_chart(user_id):
+    return system['progress_tracker'].get_weekly_chart_frame(user_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_meetings(user_id):
+    return system['scheduler'].get_upcoming_meetings(user_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_assessments(role):
+    return system['assessment'].get_available_assessments(role)
+
+# The content catalog changes rarely, so the whole category set is
+# fetched as one batch and cached for longer than the live stats
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_categories(categories):
+    return system['content_curator'].get_contents_by_categories(categories)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(query):
+    return system['content_curator'].search_content(query)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _weekly_chart_png(labels, completed):
+    """
+    Static PNG of the weekly chart, cached by its data points
+
+    Most viewers only glance at the chart, so serving a cached image
+    skips Plotly's JSON serialization and the client-side plot init.
+    Returns None when the kaleido image engine isn't installed; the
+    caller then falls back to the interactive chart.
+    """
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[
+        go.Bar(name='Modules Completed', x=list(labels), y=list(completed))
+    ])
+    fig.update_layout(title="Weekly Progress")
+    try:
+        return fig.to_image(format='png')
+    except Exception:
+        return None
+
+# The sidebar and the routed page can ask for the same data inside one
+# rerun (e.g. get_progress for Quick Stats and again for Home). Keying
+# a memo on a per-rerun nonce makes the second call free and guarantees
+# both readers see the same snapshot, even if a TTL expires mid-rerun.
+
+@functools.lru_cache(maxsize=128)
+def _memo_call(nonce, fn, *args):
+    return fn(*args)
+
+def _once_per_rerun(fn, *args):
+    """
+    Return the first result for (fn, args) within the current rerun
+    """
+    return _memo_call(st.session_state['_rerun_nonce'], fn, *args)
+
+def _restore_session_id():
+    """
+    Reuse the session id from an encrypted cookie when possible
+
+    Bedrock keys its conversational memory (and session-level prompt
+    cache) on this id, so minting a fresh one on every reload or worker
+    restart throws that context away. streamlit-cookies-manager is an
+    optional dependency; without it the id lives for the in-memory
+    session only, as before.
+    """
+    try:
+        from streamlit_cookies_manager import EncryptedCookieManager
+    except ImportError:
+        return str(uuid.uuid4())
+
+    cookies = EncryptedCookieManager(
+        prefix='pep/',
+        password=st.secrets.get('cookie_key', 'dev-only-cookie-key')
+    )
+    if not cookies.ready():
+        # The cookie round-trip hasn't completed on this first rerun;
+        # fall back rather than blocking the page on st.stop()
+        return str(uuid.uuid4())
+
+    session_id = cookies.get('sid') or str(uuid.uuid4())
+    cookies['sid'] = session_id
+    cookies.save()
+    return session_id
+
 # Initialize session state
 if 'current_page' not in st.session_state:
     st.session_state.current_page = 'home'
 if 'session_id' not in st.session_state:
-    st.session_state.session_id = str(uuid.uuid4())
+    st.session_state.session_id = _restore_session_id()
 if 'user_id' not in st.session_state:
     st.session_state.user_id = 'user_demo'  # In production we should use actual auth
 if 'user_profile' not in st.session_state:
@@ -102,14 +263,52 @@ if 'user_profile' not in st.session_state:
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 
+# Page labels for the sidebar radio; the matching handler table lives
+# below the page functions
+PAGE_LABELS = {
+    'home': '🏠 Home',
+    'chat': '💬 Chat Assistant',
+    'vr': '🥽 VR Training',
+    'progress': '📊 My Progress',
+    'learning': '📚 Learning Path',
+    'assessments': '✅ Assessments',
+    'schedule': '📅 Schedule',
+    'content': '📖 Content Library'
+}
+
+@st.fragment(run_every=60)
+def _sidebar_stats():
+    """
+    Quick Stats sidebar block on its own 60-second refresh timer
+
+    As a fragment it reruns independently: the timer tick refetches
+    progress without re-executing the rest of the page, and page
+    interactions elsewhere don't re-render these metrics.
+    """
+    # Straight through the TTL cache - the fragment timer, not the
+    # per-rerun memo, decides when these numbers refresh
+    progress_data = _cached_progress(st.session_state.user_id)
+
+    st.markdown("### 📈 Quick Stats")
+    st.metric("Progress", f"{progress_data.get('overall_progress', 0)}%", "+5%")
+    st.metric("Learning Streak", f"{progress_data.get('learning_streak_days', 0)} days", "+1")
+    st.metric("Modules Done", f"{len(progress_data.get('completed_modules', []))}")
+
+    if st.button("🔄 Refresh", use_container_width=True):
+        st.cache_data.clear()
+        st.rerun()
+
 def main():
     """Main application with navigation"""
-    
-    st.markdown(f'<h1 class="main-header">🚀 {config.APP_TITLE}</h1>', unsafe_allow_html=True)
+
+    # Fresh memo scope for this rerun; old nonces age out of the LRU
+    st.session_state['_rerun_nonce'] = st.session_state.setdefault('_rerun_nonce', 0) + 1
+
+    st.html(_HEADER_HTML)
     
     # Sidebar navigation
     with st.sidebar:
-        st.image("https://via.placeholder.com/150x50?text=PEP+Logo", width=150)
+        st.image(_LOGO_DATA_URI, width=150)
         st.markdown("---")
         
         # User info
@@ -117,67 +316,44 @@ def main():
         st.markdown(f"*{st.session_state.user_profile['role']}*")
         st.markdown("---")
         
-        # Navigation menu
-        if st.button("🏠 Home", use_container_width=True):
-            st.session_state.current_page = 'home'
-        
-        if st.button("💬 Chat Assistant", use_container_width=True):
-            st.session_state.current_page = 'chat'
-        
-        if st.button("🥽 VR Training", use_container_width=True):
-            st.session_state.current_page = 'vr'
-        
-        if st.button("📊 My Progress", use_container_width=True):
-            st.session_state.current_page = 'progress'
-        
-        if st.button("📚 Learning Path", use_container_width=True):
-            st.session_state.current_page = 'learning'
-        
-        if st.button("✅ Assessments", use_container_width=True):
-            st.session_state.current_page = 'assessments'
-        
-        if st.button("📅 Schedule", use_container_width=True):
-            st.session_state.current_page = 'schedule'
-        
-        if st.button("📖 Content Library", use_container_width=True):
-            st.session_state.current_page = 'content'
-        
+        # Navigation menu: one radio is one widget to build, diff and
+        # ship over the WebSocket, where eight buttons were eight. The
+        # index/manual-sync dance (instead of key='current_page') lets
+        # the home-page quick actions keep setting current_page.
+        pages = list(PAGE_LABELS)
+        selection = st.radio(
+            "Go to",
+            pages,
+            index=pages.index(st.session_state.current_page),
+            format_func=PAGE_LABELS.get,
+            label_visibility='collapsed'
+        )
+        if selection != st.session_state.current_page:
+            st.session_state.current_page = selection
+
         st.markdown("---")
-        
-        # Get real-time progress from ProgressTracker agent
-        progress_data = system['progress_tracker'].get_progress(st.session_state.user_id)
-        
-        st.markdown("### 📈 Quick Stats")
-        st.metric("Progress", f"{progress_data.get('overall_progress', 0)}%", "+5%")
-        st.metric("Learning Streak", f"{progress_data.get('learning_streak_days', 0)} days", "+1")
-        st.metric("Modules Done", f"{len(progress_data.get('completed_modules', []))}")
+
+        _sidebar_stats()
     
-    # Route to appropriate page
-    if st.session_state.current_page == 'home':
-        show_home()
-    elif st.session_state.current_page == 'chat':
-        show_chat()
-    elif st.session_state.current_page == 'vr':
-        show_vr_training()
-    elif st.session_state.current_page == 'progress':
-        show_progress()
-    elif st.session_state.current_page == 'learning':
-        show_learning_path()
-    elif st.session_state.current_page == 'assessments':
-        show_assessments()
-    elif st.session_state.current_page == 'schedule':
-        show_schedule()
-    elif st.session_state.current_page == 'content':
-        show_content_library()
+    # Route to the selected page via the handler table
+    PAGE_HANDLERS[st.session_state.current_page]()
 
 def show_home():
     """Home dashboard using all agents"""
     st.markdown("### Welcome to Your AI-Powered Onboarding Journey! 🎉")
     
-    # Get personalized recommendations using PersonalizationAgent
-    progress_data = system['progress_tracker'].get_progress(st.session_state.user_id)
+    # Progress and today's meetings are independent remote calls, so
+    # fetch them side by side; recommendations need the progress result
+    # and run after
+    # Capture the nonce here: session_state belongs to the script
+    # thread and must not be read from _gather's workers
+    nonce = st.session_state['_rerun_nonce']
+    progress_data, meetings = _gather(
+        (_memo_call, nonce, _cached_progress, st.session_state.user_id),
+        (_memo_call, nonce, _cached_meetings, st.session_state.user_id)
+    )
     recommendations = system['personalization'].get_recommendations(
-        st.session_state.user_id, 
+        st.session_state.user_id,
         {'completion_rate': progress_data.get('overall_progress', 0)}
     )
     
@@ -207,10 +383,9 @@ def show_home():
     
     st.markdown("---")
     
-    # Todays schedule using MeetingScheduler
+    # Todays schedule using MeetingScheduler (fetched above)
     st.markdown("### 📅 Today's Schedule")
-    meetings = system['scheduler'].get_upcoming_meetings(st.session_state.user_id)
-    
+
     for meeting in meetings[:3]:  # Show first 3
         with st.expander(f"📅 {meeting['title']} - {meeting['time']}"):
             st.write(f"**Date:** {meeting['date']}")
@@ -219,12 +394,49 @@ def show_home():
             if meeting.get('meeting_link'):
                 st.markdown(f"[Join Meeting]({meeting['meeting_link']})")
 
+# How many recent messages keep their own chat bubbles; everything
+# older is folded into a single pre-joined markdown block
+_CHAT_LIVE_TAIL = 6
+
+def _chat_static_block():
+    """
+    Fold messages that aged out of the live tail into one cached string
+
+    Old messages never change, yet the display loop re-parsed every one
+    of them through st.markdown on each rerun. Joining them into a
+    single incrementally-extended block renders the whole backlog as
+    one markdown element, so rerun cost stays flat as the chat grows.
+    """
+    history = st.session_state.chat_history
+    stable_count = max(0, len(history) - _CHAT_LIVE_TAIL)
+    cached_count, block = st.session_state.get('_chat_static', (0, ''))
+
+    if stable_count > cached_count:
+        parts = [block] if block else []
+        for message in history[cached_count:stable_count]:
+            speaker = '🧑 **You:**' if message['role'] == 'user' else '🤖 **Assistant:**'
+            parts.append(f"{speaker}\n\n{message['content']}")
+        block = "\n\n---\n\n".join(parts)
+        st.session_state['_chat_static'] = (stable_count, block)
+
+    return stable_count, block
+
+@st.fragment
 def show_chat():
-    """Chat interface using OrchestratorAgent"""
+    """Chat interface using OrchestratorAgent
+
+    Runs as a fragment so a chat submission reruns only this block -
+    the sidebar stats and page chrome stay untouched per message.
+    """
     st.markdown("### 💬 Chat with Your AI Assistant")
-    
-    # Display chat history
-    for message in st.session_state.chat_history:
+
+    # Display chat history: one markdown element for the stable
+    # backlog, individual bubbles only for the recent tail
+    stable_count, static_block = _chat_static_block()
+    if static_block:
+        st.markdown(static_block)
+
+    for message in st.session_state.chat_history[stable_count:]:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
     
@@ -236,68 +448,112 @@ def show_chat():
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Get AI response using OrchestratorAgent
+        # Get AI response using OrchestratorAgent, run off-thread so the
+        # UI can keep painting while the model responds
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                # Use personalized response
-                result = system['orchestrator'].get_personalized_response(
+            placeholder = st.empty()
+            placeholder.markdown("_Thinking..._")
+
+            # Prefer the Celery queue when a broker is configured so
+            # the call runs on a worker process; otherwise fall back to
+            # the in-process pool
+            from tasks import run_agent_task
+            if run_agent_task is not None:
+                async_result = run_agent_task.delay(
                     prompt,
                     st.session_state.user_profile,
                     st.session_state.session_id
                 )
-                
-                response = result.get('response', 'Sorry, I encountered an error.')
-                st.markdown(response)
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
+                while not async_result.ready():
+                    time.sleep(0.1)
+                result = async_result.get()
+            else:
+                context = _session_context(
+                    st.session_state.session_id,
+                    st.session_state.user_profile.get('role', 'Unknown'),
+                    st.session_state.user_profile.get('department', 'Unknown')
+                )
+                future = _agent_executor().submit(
+                    system['orchestrator'].ask_with_context, context, prompt
+                )
+                while not future.done():
+                    time.sleep(0.05)
+                result = future.result()
+            response = result.get('response', 'Sorry, I encountered an error.')
+            placeholder.markdown(response)
+            st.session_state.chat_history.append({"role": "assistant", "content": response})
 
 def show_vr_training():
     """VR training using VRTrainingEngine"""
     st.markdown("### 🥽 Immersive VR Training")
-    
-    # Get available VR experiences
+
+    import pandas as pd
+
+    # Get available VR experiences. One selectable grid replaces an
+    # expander plus a markdown stack per experience; the details pane
+    # below renders only for the selected row.
     experiences = system['vr_training'].get_available_vr_experiences()
-    
-    for exp in experiences:
-        with st.expander(f"{exp['title']} - {exp['duration']}"):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown(f"**{exp['description']}**")
-                st.markdown(f"**Difficulty:** {exp['difficulty']}")
-                st.markdown(f"**Type:** {exp['type'].upper()}")
-                
-                st.markdown("**Features:**")
-                for feature in exp['features']:
-                    st.markdown(f"- {feature}")
-            
-            with col2:
-                st.image(exp['thumbnail'], use_container_width=True)
-                
-                if exp['status'] == 'available':
-                    if st.button(f"Launch {exp['type'].upper()}", key=exp['id']):
-                        result = system['vr_training'].launch_vr_experience(
-                            exp['id'],
-                            st.session_state.user_id
-                        )
-                        if result['success']:
-                            st.success(f" Launching {exp['title']}!")
-                            st.info("Follow the on-screen instructions in your VR headset or browser.")
-                else:
-                    st.info(f"Status: {exp['status']}")
+
+    grid = pd.DataFrame([
+        {
+            'Experience': exp['title'],
+            'Duration': exp['duration'],
+            'Difficulty': exp['difficulty'],
+            'Type': exp['type'].upper(),
+            'Status': exp['status']
+        }
+        for exp in experiences
+    ])
+    selected = st.dataframe(
+        grid,
+        hide_index=True,
+        use_container_width=True,
+        on_select='rerun',
+        selection_mode='single-row'
+    )
+
+    rows = selected.selection.rows
+    if rows:
+        exp = experiences[rows[0]]
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown(f"**{exp['description']}**")
+            st.markdown("**Features:**")
+            for feature in exp['features']:
+                st.markdown(f"- {feature}")
+
+        with col2:
+            st.image(exp['thumbnail'], use_container_width=True)
+
+            if exp['status'] == 'available':
+                if st.button(f"Launch {exp['type'].upper()}", key=exp['id']):
+                    result = system['vr_training'].launch_vr_experience(
+                        exp['id'],
+                        st.session_state.user_id
+                    )
+                    if result['success']:
+                        st.success(f" Launching {exp['title']}!")
+                        st.info("Follow the on-screen instructions in your VR headset or browser.")
+            else:
+                st.info(f"Status: {exp['status']}")
 
 def show_progress():
     """Progress dashboard using ProgressTracker"""
     st.markdown("### 📊 Your Progress Dashboard")
     
-    # Get comprehensive analytics
-    analytics = system['progress_tracker'].get_analytics_summary(st.session_state.user_id)
+    # Analytics and the weekly chart data are independent; fetch both at once
+    analytics, chart_data = _gather(
+        (_cached_analytics, st.session_state.user_id),
+        (_cached_weekly_chart, st.session_state.user_id)
+    )
     
     # Overall metrics
     col1, col2, col3, col4 = st.columns(4)
     metrics = analytics['overall_metrics']
     
     col1.metric("Completion Rate", f"{metrics['completion_rate']}%")
-    col2.metric("Modules", f"{metrics['modules_completed']}/{analytics['progress_breakdown']['completed'] + analytics['progress_breakdown']['in_progress'] + analytics['progress_breakdown']['upcoming']}")
+    col2.metric("Modules", f"{metrics['modules_completed']}/{metrics['modules_total']}")
     col3.metric("Learning Streak", f"{metrics['learning_streak']} days")
     col4.metric("Total Hours", f"{metrics['total_time_hours']} hrs")
     
@@ -316,16 +572,30 @@ def show_progress():
     
     st.markdown("---")
     
-    # Weekly chart
+    # Weekly chart (data fetched above); plotly only loads when there
+    # is something to draw
     st.markdown("### 📈 Weekly Activity")
-    chart_data = system['progress_tracker'].get_weekly_chart_data(st.session_state.user_id)
-    
-    import plotly.graph_objects as go
-    fig = go.Figure(data=[
-        go.Bar(name='Modules Completed', x=chart_data['labels'], y=chart_data['completed_modules'])
-    ])
-    fig.update_layout(title="Weekly Progress")
-    st.plotly_chart(fig, use_container_width=True)
+
+    if not chart_data.empty:
+        # Cached static image by default; full Plotly only on request
+        # (or when the image engine is unavailable)
+        interactive = st.checkbox("Interactive chart")
+        png = None
+        if not interactive:
+            png = _weekly_chart_png(
+                tuple(chart_data['day']),
+                tuple(chart_data['completed'])
+            )
+
+        if png:
+            st.image(png)
+        else:
+            import plotly.graph_objects as go
+            fig = go.Figure(data=[
+                go.Bar(name='Modules Completed', x=chart_data['day'], y=chart_data['completed'])
+            ])
+            fig.update_layout(title="Weekly Progress")
+            st.plotly_chart(fig, use_container_width=True)
     
     # Recommendations
     st.markdown("### 💡 Recommendations")
@@ -341,84 +611,127 @@ def show_learning_path():
     
     st.info(f"**Estimated Total Time:** {learning_path['estimated_completion']}")
     
-    # Display modules
-    progress_data = system['progress_tracker'].get_progress(st.session_state.user_id)
-    completed = progress_data.get('completed_modules', [])
-    
-    for i, module in enumerate(learning_path['learning_path']):
-        is_completed = module['module'] in completed
-        status_icon = "✅" if is_completed else "⏳"
-        
-        col1, col2, col3 = st.columns([3, 1, 1])
-        
-        with col1:
-            st.markdown(f"{status_icon} **{module['module']}**")
-        with col2:
-            st.markdown(f"`{module['duration']}`")
-        with col3:
-            st.markdown(f"*{module['priority']}*")
+    # Display modules as one grid. A set makes the completion check
+    # O(1) per module, and a single dataframe replaces three markdown
+    # widgets per row, so render cost stays flat as the path grows.
+    import pandas as pd
+
+    progress_data = _once_per_rerun(_cached_progress, st.session_state.user_id)
+    completed = set(progress_data.get('completed_modules', []))
+
+    modules = pd.DataFrame([
+        {
+            'Status': '✅' if module['module'] in completed else '⏳',
+            'Module': module['module'],
+            'Duration': module['duration'],
+            'Priority': module['priority']
+        }
+        for module in learning_path['learning_path']
+    ])
+    st.dataframe(modules, hide_index=True, use_container_width=True)
 
 def show_assessments():
     """Assessments using AssessmentAgent"""
     st.markdown("### Skills Assessments")
     
-    # Get available assessments
-    assessments = system['assessment'].get_available_assessments(
-        st.session_state.user_profile['role']
+    import pandas as pd
+
+    # Get available assessments into one selectable grid; the action
+    # area below applies to the selected row only
+    assessments = _cached_assessments(st.session_state.user_profile['role'])
+
+    _STATUS_ICONS = {'completed': '✅', 'available': '📝'}
+    grid = pd.DataFrame([
+        {
+            'Status': _STATUS_ICONS.get(assess['status'], '🔒'),
+            'Assessment': assess['name'],
+            'Duration': assess['duration'],
+            'Questions': assess['questions'],
+            'Difficulty': assess['difficulty']
+        }
+        for assess in assessments
+    ])
+    selected = st.dataframe(
+        grid,
+        hide_index=True,
+        use_container_width=True,
+        on_select='rerun',
+        selection_mode='single-row'
     )
-    
-    for assess in assessments:
-        with st.expander(f"{'✅' if assess['status'] == 'completed' else '📝' if assess['status'] == 'available' else '🔒'} {assess['name']}"):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown(f"**Duration:** {assess['duration']}")
-                st.markdown(f"**Questions:** {assess['questions']}")
-                st.markdown(f"**Difficulty:** {assess['difficulty']}")
-            
-            with col2:
-                if assess['status'] == 'available':
-                    if st.button("Start Assessment", key=assess['id']):
-                        st.session_state.current_assessment = assess['id']
-                        st.success("Starting assessment...")
-                elif assess['status'] == 'locked':
-                    st.info("Complete prerequisites first")
+
+    rows = selected.selection.rows
+    if rows:
+        assess = assessments[rows[0]]
+        if assess['status'] == 'available':
+            if st.button("Start Assessment", key=assess['id']):
+                st.session_state.current_assessment = assess['id']
+                st.success("Starting assessment...")
+        elif assess['status'] == 'locked':
+            st.info("Complete prerequisites first")
 
 def show_schedule():
     """Schedule management using MeetingScheduler"""
     st.markdown("### 📅 Meeting Schedule")
     
-    # Get upcoming meetings
-    meetings = system['scheduler'].get_upcoming_meetings(st.session_state.user_id)
-    
-    for meeting in meetings:
-        with st.expander(f"📅 {meeting['title']} - {meeting['date']} at {meeting['time']}"):
-            st.markdown(f"**Duration:** {meeting['duration']}")
-            st.markdown(f"**Attendees:** {', '.join(meeting['attendees'])}")
-            st.markdown(f"**Location:** {meeting['location']}")
-            st.markdown(f"**Type:** {meeting['type']}")
-            
-            if meeting.get('meeting_link'):
-                st.markdown(f"[Join Meeting]({meeting['meeting_link']})")
+    import pandas as pd
+
+    # Get upcoming meetings into one selectable grid; attendees and the
+    # join link render once for the selected row
+    meetings = _cached_meetings(st.session_state.user_id)
+
+    grid = pd.DataFrame([
+        {
+            'Meeting': meeting['title'],
+            'Date': meeting['date'],
+            'Time': meeting['time'],
+            'Duration': meeting['duration'],
+            'Location': meeting['location'],
+            'Type': meeting['type']
+        }
+        for meeting in meetings
+    ])
+    selected = st.dataframe(
+        grid,
+        hide_index=True,
+        use_container_width=True,
+        on_select='rerun',
+        selection_mode='single-row'
+    )
+
+    rows = selected.selection.rows
+    if rows:
+        meeting = meetings[rows[0]]
+        st.markdown(f"**Attendees:** {', '.join(meeting['attendees'])}")
+        if meeting.get('meeting_link'):
+            st.markdown(f"[Join Meeting]({meeting['meeting_link']})")
 
 def show_content_library():
     """Content library using ContentCuratorAgent"""
     st.markdown("### 📖 Content Library")
     
-    # Search functionality
-    search_query = st.text_input("🔍 Search content...")
-    
+    # Search inside a form: the query only fires on submit, so typing
+    # "onboarding" costs one search instead of one per keystroke rerun
+    with st.form(key='content_search'):
+        search_query = st.text_input("🔍 Search content...")
+        submitted = st.form_submit_button("Search")
+
+    # Remember the active query so the results survive unrelated reruns
+    if submitted:
+        st.session_state['_content_query'] = search_query.strip().lower()
+    search_query = st.session_state.get('_content_query', '')
+
     if search_query:
-        results = system['content_curator'].search_content(search_query)
+        results = _cached_search(search_query)
         st.markdown(f"**Found {len(results)} results:**")
         for item in results:
             st.markdown(f"- {item['name']} ({item['type']}) - {item['duration']}")
     else:
-        # Show categories
-        categories = ['company_culture', 'technical', 'policies', 'tools']
-        
+        # Show categories, fetched as one batch
+        categories = ('company_culture', 'technical', 'policies', 'tools')
+        contents = _cached_categories(categories)
+
         for cat in categories:
-            content = system['content_curator'].get_content_by_category(cat)
+            content = contents[cat]
             if content:
                 with st.expander(f"📁 {content['title']}"):
                     for item in content['items']:
@@ -430,5 +743,18 @@ def show_content_library():
                         with col3:
                             st.markdown(f"`{item['duration']}`")
 
+# Page key -> renderer, mirroring PAGE_LABELS; one dict lookup routes
+# each rerun instead of an if/elif chain of string compares
+PAGE_HANDLERS = {
+    'home': show_home,
+    'chat': show_chat,
+    'vr': show_vr_training,
+    'progress': show_progress,
+    'learning': show_learning_path,
+    'assessments': show_assessments,
+    'schedule': show_schedule,
+    'content': show_content_library
+}
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,6 @@
 import streamlit as st
 import boto3
+import random
 import uuid
 import time
 from botocore.config import Config
@@ -11,17 +12,43 @@ agent_alias_id = 'DKHOVNKW92'
 region_name = 'us-east-1'      
 
 
-# Set a custom timeout and region
-config = Config(region_name=region_name, connect_timeout=10, read_timeout=120)
-client = boto3.client('bedrock-agent-runtime', config=config)
+# Set a custom timeout and region. Adaptive retry mode gives the HTTP
+# layer token-bucket pacing with native exponential backoff, so most
+# transient errors never surface to the UI loop at all. TCP keepalive
+# plus the connection pool let consecutive invocations reuse the same
+# TLS connection instead of re-handshaking (~100-300ms each).
+config = Config(
+    region_name=region_name,
+    connect_timeout=10,
+    read_timeout=120,
+    retries={'max_attempts': 4, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=25
+)
 
 
-# Function to ask the agent using persistent session ID and retry logic
-def ask_agent(agent_id, agent_alias_id, question, retries=3, delay=5):
+# One client per server process, shared by every session and rerun;
+# cache_resource keeps it alive even if Streamlit re-imports the page
+@st.cache_resource
+def get_bedrock_client():
+    return boto3.client('bedrock-agent-runtime', config=config)
+
+
+client = get_bedrock_client()
+
+
+# Function to ask the agent using persistent session ID and retry logic.
+# Yields the response as it streams from Bedrock so the first tokens
+# reach the screen in a few hundred milliseconds instead of after the
+# whole generation finishes behind a spinner.
+def ask_agent(agent_id, agent_alias_id, question, retries=3):
     if "session_id" not in st.session_state:
         st.session_state.session_id = str(uuid.uuid4())
 
 
+    # This outer loop only guards the stream setup; waits grow
+    # exponentially with a little jitter so concurrent sessions don't
+    # retry in lockstep, instead of the previous flat 5s sleeps.
     for attempt in range(retries):
         try:
             response = client.invoke_agent(
@@ -30,20 +57,30 @@ def ask_agent(agent_id, agent_alias_id, question, retries=3, delay=5):
                 sessionId=st.session_state.session_id,
                 inputText=question
             )
-
-
-            response_text = ""
-            for event in response['completion']:
-                if 'chunk' in event:
-                    response_text += event['chunk']['bytes'].decode('utf-8')
-            return response_text
-
-
-        except client.exceptions.InternalServerException:
+            break
+        except (client.exceptions.InternalServerException,
+                client.exceptions.ThrottlingException):
             if attempt < retries - 1:
-                time.sleep(delay)
+                time.sleep(min(20, 0.5 * 2 ** attempt + random.uniform(0, 0.3)))
             else:
-                return "Sorry, the service is temporarily unavailable. Please try again later."
+                yield "Sorry, the service is temporarily unavailable. Please try again later."
+                return
+
+
+    # Batch chunks into ~100ms flushes so the frontend re-renders the
+    # growing message at most ten times a second, not once per token
+    buffer = ""
+    last_flush = time.monotonic()
+    for event in response['completion']:
+        if 'chunk' in event:
+            buffer += event['chunk']['bytes'].decode('utf-8')
+            now = time.monotonic()
+            if buffer and now - last_flush >= 0.1:
+                yield buffer
+                buffer = ""
+                last_flush = now
+    if buffer:
+        yield buffer
 
 
 # Initialize session state for chat history
@@ -55,8 +92,40 @@ st.title("🧑‍💻 PEP EASY ONBOARD Chat ASSOCIATE")
 st.write("Hi🤖 chat with me and let me know how I can help you today?")
 
 
-# Display chat history
-for chat in st.session_state.chat_history:
+# How many recent messages keep their own chat bubbles; everything
+# older is folded into a single pre-joined markdown block
+CHAT_LIVE_TAIL = 6
+
+
+def chat_static_block():
+    """
+    Fold messages that aged out of the live tail into one cached string
+
+    Re-parsing every old message through st.markdown on each rerun is
+    O(N) in chat length; the stable backlog renders as one element.
+    """
+    history = st.session_state.chat_history
+    stable_count = max(0, len(history) - CHAT_LIVE_TAIL)
+    cached_count, block = st.session_state.get('_chat_static', (0, ''))
+
+    if stable_count > cached_count:
+        parts = [block] if block else []
+        for chat in history[cached_count:stable_count]:
+            speaker = '🧑 **You:**' if chat['role'] == 'user' else '🤖 **Assistant:**'
+            parts.append(f"{speaker}\n\n{chat['content']}")
+        block = "\n\n---\n\n".join(parts)
+        st.session_state['_chat_static'] = (stable_count, block)
+
+    return stable_count, block
+
+
+# Display chat history: one markdown element for the stable backlog,
+# individual bubbles only for the recent tail
+stable_count, static_block = chat_static_block()
+if static_block:
+    st.markdown(static_block)
+
+for chat in st.session_state.chat_history[stable_count:]:
     with st.chat_message(chat["role"]):
         st.markdown(chat["content"])
 
@@ -70,11 +139,11 @@ if input_text:
         st.markdown(input_text)
 
 
-    # Get response
-    response = ask_agent(agent_id, agent_alias_id, input_text)
+    # Stream the response into the chat bubble as it arrives;
+    # write_stream returns the accumulated text for the history
+    with st.chat_message("assistant"):
+        response = st.write_stream(ask_agent(agent_id, agent_alias_id, input_text))
 
 
     # Append assistant response
     st.session_state.chat_history.append({"role": "assistant", "content": response})
-    with st.chat_message("assistant"):
-        st.markdown(response)
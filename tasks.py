@@ -0,0 +1,45 @@
+"""
+Background task queue for long-running agent calls
+
+Optional: needs celery plus a Redis (or other) broker, configured via
+CELERY_BROKER_URL. When a broker is available the Streamlit app hands
+chat requests to worker processes instead of its in-process thread
+pool, so web workers are never parked on a 120s Bedrock read and
+throughput scales with the worker fleet rather than the app servers.
+
+Run workers with:  celery -A tasks worker
+"""
+
+import os
+
+try:
+    from celery import Celery
+except ImportError:
+    Celery = None
+
+BROKER_URL = os.environ.get('CELERY_BROKER_URL', '')
+
+celery_app = None
+if Celery is not None and BROKER_URL:
+    celery_app = Celery('onboarding_tasks', broker=BROKER_URL, backend=BROKER_URL)
+
+if celery_app is not None:
+    @celery_app.task(bind=True, max_retries=3)
+    def run_agent_task(self, prompt, user_profile, session_id):
+        """
+        Run one personalized chat turn on a worker process
+        """
+        # Imported here so the worker builds its own agent (and boto3
+        # clients) in its own process
+        from agents.orchestrator import OrchestratorAgent
+
+        try:
+            return OrchestratorAgent().get_personalized_response(
+                prompt, user_profile, session_id
+            )
+        except Exception as exc:
+            raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+else:
+    # No broker configured (or celery not installed): callers fall back
+    # to the in-process thread pool
+    run_agent_task = None
@@ -3,75 +3,106 @@ AWS Helper - Simplified AWS service interactions
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from config import config
 import json
+import random
+import requests
+import shutil
 import time
 
+# Shared client configuration: the default 10-connection pool
+# serializes concurrent calls under a thread pool and forces fresh TLS
+# handshakes once exhausted; 50 kept-alive connections plus adaptive
+# retries absorb bursts instead
+_BOTO_CONFIG = BotoConfig(
+    region_name=config.REGION_NAME,
+    connect_timeout=10,
+    read_timeout=config.BEDROCK_TIMEOUT,
+    max_pool_connections=50,
+    retries={'max_attempts': config.API_RETRY_COUNT, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# One client per service per process, shared across AWSHelper instances
+# and threads (boto3 clients are thread-safe), so TCP+TLS setup is paid
+# once rather than per helper
+_CLIENTS = {}
+
+def _client(service):
+    if service not in _CLIENTS:
+        _CLIENTS[service] = boto3.client(service, config=_BOTO_CONFIG)
+    return _CLIENTS[service]
+
+# Shared HTTP session for transcript downloads, reusing keep-alive
+# connections across calls
+_HTTP_SESSION = requests.Session()
+
+# Multipart transfer tuning: files past 64 MB upload as concurrent
+# 64 MB parts instead of one serial stream
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 << 20,
+    multipart_chunksize=64 << 20,
+    max_concurrency=16,
+    max_io_queue=1000,
+    use_threads=True
+)
+
+_DYNAMODB_RESOURCE = None
+
+def _dynamodb():
+    global _DYNAMODB_RESOURCE
+    if _DYNAMODB_RESOURCE is None:
+        _DYNAMODB_RESOURCE = boto3.resource('dynamodb', config=_BOTO_CONFIG)
+    return _DYNAMODB_RESOURCE
+
 class AWSHelper:
     """
     Unified helper for AWS service interactions
     """
-    
+
     def __init__(self):
-        self.boto_config = BotoConfig(
-            region_name=config.REGION_NAME,
-            connect_timeout=10,
-            read_timeout=config.BEDROCK_TIMEOUT
-        )
-        
-        # Initialize clients lazily
-        self._bedrock_agent = None
-        self._s3 = None
-        self._dynamodb = None
-        self._ses = None
-        self._transcribe = None
-        self._polly = None
-    
+        self.boto_config = _BOTO_CONFIG
+        # Table handles are light but not free to build; cache per name
+        # in a plain dict (an lru_cache on a method would pin self)
+        self._tables = {}
+
+    def _table(self, table_name):
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables[table_name] = self.dynamodb.Table(table_name)
+        return table
+
     @property
     def bedrock_agent(self):
         """Get Bedrock Agent Runtime client"""
-        if not self._bedrock_agent:
-            self._bedrock_agent = boto3.client(
-                'bedrock-agent-runtime',
-                config=self.boto_config
-            )
-        return self._bedrock_agent
-    
+        return _client('bedrock-agent-runtime')
+
     @property
     def s3(self):
         """Get S3 client"""
-        if not self._s3:
-            self._s3 = boto3.client('s3', config=self.boto_config)
-        return self._s3
-    
+        return _client('s3')
+
     @property
     def dynamodb(self):
         """Get DynamoDB resource"""
-        if not self._dynamodb:
-            self._dynamodb = boto3.resource('dynamodb', config=self.boto_config)
-        return self._dynamodb
-    
+        return _dynamodb()
+
     @property
     def ses(self):
         """Get SES client"""
-        if not self._ses:
-            self._ses = boto3.client('ses', config=self.boto_config)
-        return self._ses
-    
+        return _client('ses')
+
     @property
     def transcribe(self):
         """Get Transcribe client"""
-        if not self._transcribe:
-            self._transcribe = boto3.client('transcribe', config=self.boto_config)
-        return self._transcribe
-    
+        return _client('transcribe')
+
     @property
     def polly(self):
         """Get Polly client"""
-        if not self._polly:
-            self._polly = boto3.client('polly', config=self.boto_config)
-        return self._polly
+        return _client('polly')
     
     def invoke_bedrock_agent(self, question, session_id, agent_id=None, agent_alias_id=None):
         """
@@ -89,11 +120,14 @@ class AWSHelper:
                     inputText=question
                 )
                 
-                response_text = ""
+                # Collect raw chunks and decode once - str += is
+                # quadratic on long streamed replies
+                parts = []
                 for event in response['completion']:
                     if 'chunk' in event:
-                        response_text += event['chunk']['bytes'].decode('utf-8')
-                
+                        parts.append(event['chunk']['bytes'])
+                response_text = b''.join(parts).decode('utf-8')
+
                 return {
                     'success': True,
                     'response': response_text,
@@ -124,7 +158,7 @@ class AWSHelper:
         bucket = bucket or config.S3_BUCKET
         
         try:
-            self.s3.upload_file(file_path, bucket, s3_key)
+            self.s3.upload_file(file_path, bucket, s3_key, Config=_TRANSFER_CONFIG)
             return {
                 'success': True,
                 'bucket': bucket,
@@ -162,20 +196,19 @@ class AWSHelper:
         bucket = bucket or config.S3_BUCKET
         
         try:
-            response = self.s3.list_objects_v2(
-                Bucket=bucket,
-                Prefix=prefix
-            )
-            
+            # The paginator follows continuation tokens, so listings
+            # past the 1000-key page limit are no longer truncated
+            paginator = self.s3.get_paginator('list_objects_v2')
+
             objects = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in page.get('Contents', []):
                     objects.append({
                         'key': obj['Key'],
                         'size': obj['Size'],
                         'last_modified': obj['LastModified'].isoformat()
                     })
-            
+
             return {
                 'success': True,
                 'objects': objects,
@@ -187,13 +220,29 @@ class AWSHelper:
                 'error': str(e),
                 'objects': []
             }
+
+    def list_prefixes_parallel(self, prefixes, bucket=None):
+        """
+        List several S3 prefixes concurrently
+
+        Each prefix listing is an independent sequence of network calls,
+        so a small thread pool overlaps them; the shared client's
+        connection pool covers the fan-out.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(prefixes)))) as pool:
+            results = pool.map(
+                lambda prefix: self.list_s3_objects(prefix, bucket), prefixes
+            )
+        return dict(zip(prefixes, results))
     
     def save_to_dynamodb(self, table_name, item):
         """
         Save item to DynamoDB table
         """
         try:
-            table = self.dynamodb.Table(table_name)
+            table = self._table(table_name)
             table.put_item(Item=item)
             return {
                 'success': True,
@@ -205,12 +254,36 @@ class AWSHelper:
                 'error': str(e)
             }
     
+    def save_many_to_dynamodb(self, table_name, items):
+        """
+        Save multiple items to a DynamoDB table in one batched pass
+
+        batch_writer groups items into 25-item BatchWriteItem calls and
+        retries unprocessed items, so bulk saves cost a fraction of the
+        round-trips of per-item put_item.
+        """
+        try:
+            table = self._table(table_name)
+            with table.batch_writer() as writer:
+                for item in items:
+                    writer.put_item(Item=item)
+            return {
+                'success': True,
+                'table': table_name,
+                'count': len(items)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
     def get_from_dynamodb(self, table_name, key):
         """
         Get item from DynamoDB table
         """
         try:
-            table = self.dynamodb.Table(table_name)
+            table = self._table(table_name)
             response = table.get_item(Key=key)
             
             if 'Item' in response:
@@ -229,21 +302,48 @@ class AWSHelper:
                 'error': str(e)
             }
     
-    def query_dynamodb(self, table_name, key_condition, expression_values):
+    def iter_query_dynamodb(self, table_name, key_condition, expression_values,
+                            projection=None, index_name=None):
         """
-        Query DynamoDB table
+        Yield query results page by page
+
+        Follows LastEvaluatedKey so callers see every matching item, not
+        just the first 1 MB page, and can stop early without fetching
+        the rest. A projection or secondary index keeps each page small.
+        """
+        table = self._table(table_name)
+        kwargs = {
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': expression_values,
+            'Limit': 1000
+        }
+        if projection:
+            kwargs['ProjectionExpression'] = projection
+        if index_name:
+            kwargs['IndexName'] = index_name
+
+        while True:
+            response = table.query(**kwargs)
+            yield from response.get('Items', [])
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            kwargs['ExclusiveStartKey'] = last_key
+
+    def query_dynamodb(self, table_name, key_condition, expression_values,
+                       projection=None, index_name=None):
+        """
+        Query DynamoDB table, collecting all pages
         """
         try:
-            table = self.dynamodb.Table(table_name)
-            response = table.query(
-                KeyConditionExpression=key_condition,
-                ExpressionAttributeValues=expression_values
-            )
-            
+            items = list(self.iter_query_dynamodb(
+                table_name, key_condition, expression_values,
+                projection=projection, index_name=index_name
+            ))
             return {
                 'success': True,
-                'items': response.get('Items', []),
-                'count': response.get('Count', 0)
+                'items': items,
+                'count': len(items)
             }
         except Exception as e:
             return {
@@ -304,23 +404,38 @@ class AWSHelper:
                 LanguageCode='en-US'
             )
             
-            # Wait for completion
+            # Poll with exponential backoff: short clips finish in a
+            # couple of seconds, so start at 0.5s and double up to a 5s
+            # cap with +/-20% jitter; give up after 60s rather than
+            # spinning forever on a stuck job
+            deadline = time.monotonic() + 60
+            delay = 0.5
             while True:
                 status = self.transcribe.get_transcription_job(
                     TranscriptionJobName=job_name
                 )
-                
+
                 job_status = status['TranscriptionJob']['TranscriptionJobStatus']
-                
+
                 if job_status in ['COMPLETED', 'FAILED']:
                     break
-                
-                time.sleep(5)
+
+                if time.monotonic() >= deadline:
+                    return {
+                        'success': False,
+                        'error': 'Transcription timed out',
+                        'job_name': job_name
+                    }
+
+                time.sleep(delay * (0.8 + 0.4 * random.random()))
+                delay = min(delay * 2, 5)
             
             if job_status == 'COMPLETED':
-                import requests
                 transcript_url = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-                transcript_json = requests.get(transcript_url).json()
+                # Decode straight off the response stream instead of
+                # buffering the full document as text first
+                with _HTTP_SESSION.get(transcript_url, stream=True, timeout=30) as r:
+                    transcript_json = json.load(r.raw)
                 transcript_text = transcript_json['results']['transcripts'][0]['transcript']
                 
                 return {
@@ -351,8 +466,11 @@ class AWSHelper:
                 VoiceId=voice_id
             )
             
+            # Copy in 64 KB chunks instead of buffering the whole MP3
+            # in memory before the first byte hits disk
             with open(output_path, 'wb') as f:
-                f.write(response['AudioStream'].read())
+                with response['AudioStream'] as src:
+                    shutil.copyfileobj(src, f, length=65536)
             
             return {
                 'success': True,
@@ -364,45 +482,60 @@ class AWSHelper:
                 'error': str(e)
             }
     
+    def synthesize_speech_bytes(self, text, voice_id='Joanna'):
+        """
+        Synthesize speech and return the MP3 bytes in memory
+
+        For callers that play or forward the audio immediately, this
+        skips the disk round-trip of synthesize_speech.
+        """
+        try:
+            response = self.polly.synthesize_speech(
+                Text=text,
+                OutputFormat='mp3',
+                VoiceId=voice_id
+            )
+            with response['AudioStream'] as src:
+                return {
+                    'success': True,
+                    'audio': src.read()
+                }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
     def health_check(self):
         """
         Check health of AWS services
+
+        The four probes are independent round-trips, so they fan out
+        over a thread pool and overall latency is the slowest probe
+        rather than the sum; anything still pending after 3s counts as
+        unhealthy.
         """
-        health = {
-            's3': False,
-            'dynamodb': False,
-            'bedrock': False,
-            'ses': False
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        probes = {
+            's3': self.s3.list_buckets,
+            'dynamodb': self.dynamodb.meta.client.list_tables,
+            'ses': self.ses.get_send_quota,
+            'bedrock': lambda: self.bedrock_agent
         }
-        
-        # Check S3
-        try:
-            self.s3.list_buckets()
-            health['s3'] = True
-        except:
-            pass
-        
-        # Check DynamoDB
-        try:
-            self.dynamodb.meta.client.list_tables()
-            health['dynamodb'] = True
-        except:
-            pass
-        
-        # Check SES
-        try:
-            self.ses.get_send_quota()
-            health['ses'] = True
-        except:
-            pass
-        
-        # Bedrock check (just verify client creation)
+        health = {name: False for name in probes}
+
+        pool = ThreadPoolExecutor(max_workers=4)
+        futures = {pool.submit(fn): name for name, fn in probes.items()}
         try:
-            _ = self.bedrock_agent
-            health['bedrock'] = True
-        except:
+            for future in as_completed(futures, timeout=3):
+                health[futures[future]] = future.exception() is None
+        except TimeoutError:
             pass
-        
+        finally:
+            # Don't block on a hung probe - it already counts as down
+            pool.shutdown(wait=False, cancel_futures=True)
+
         return health
 
 # Create singleton instance
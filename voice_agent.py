@@ -1,13 +1,25 @@
 import streamlit as st
+import functools
 import os
+import random
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+import json
 import time
 import uuid
 import requests
-import base64
 from audio_recorder_streamlit import audio_recorder
 from streamlit_float import float_init
 from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+
+# Streaming transcription is optional: with the amazon-transcribe SDK
+# installed, audio is transcribed over a bidirectional stream instead
+# of the much slower S3-upload + job-polling round-trip
+try:
+    from amazon_transcribe.client import TranscribeStreamingClient
+except ImportError:
+    TranscribeStreamingClient = None
 
 
 # AWS Agent configuration
@@ -15,11 +27,29 @@ agent_id = 'MDY3JVJV6Q'
 agent_alias_id = 'DKHOVNKW92'
 S3_BUCKET = "storevoice"
 
+# Multipart transfer tuning for recorded-audio uploads, matching
+# AWSHelper: concurrent 64 MB parts past the threshold
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 << 20,
+    multipart_chunksize=64 << 20,
+    max_concurrency=16,
+    max_io_queue=1000,
+    use_threads=True
+)
+
 
-# Set a custom timeout
-config = Config(connect_timeout=10, read_timeout=180)
+# Set a custom timeout; the wider connection pool matches AWSHelper so
+# concurrent calls reuse kept-alive connections instead of queueing
+config = Config(connect_timeout=10, read_timeout=180, max_pool_connections=50)
 client = boto3.client('bedrock-agent-runtime', config=config)
 
+# Shared HTTP session so transcript downloads reuse kept-alive
+# connections across turns
+http_session = requests.Session()
+
+# Small pool for overlapping independent AWS calls within a turn
+executor = ThreadPoolExecutor(max_workers=2)
+
 
 # Initialize float feature
 float_init()
@@ -45,7 +75,8 @@ st.markdown("Hi🤖 just click on the voice recorder and let me know how I can h
 # Footer container for microphone
 footer_container = st.container()
 with footer_container:
-    audio_bytes = audio_recorder()
+    # 16 kHz mono PCM is what the streaming transcriber expects
+    audio_bytes = audio_recorder(sample_rate=16000)
 
 
 # Display chat history
@@ -54,6 +85,43 @@ for message in st.session_state.messages:
         st.write(message["content"])
 
 
+# Stream raw PCM to Transcribe and return the final transcript. The
+# batch speech_to_text below stays as the fallback when the streaming
+# SDK isn't installed.
+def streaming_speech_to_text(pcm_bytes):
+    import asyncio
+
+    async def _run():
+        client = TranscribeStreamingClient(region='us-east-1')
+        stream = await client.start_stream_transcription(
+            language_code='en-US',
+            media_sample_rate_hz=16000,
+            media_encoding='pcm'
+        )
+
+        async def _feed():
+            # 10 ms of 16 kHz 16-bit mono audio per event
+            chunk = 320
+            for offset in range(0, len(pcm_bytes), chunk):
+                await stream.input_stream.send_audio_event(
+                    audio_chunk=pcm_bytes[offset:offset + chunk]
+                )
+            await stream.input_stream.end_stream()
+
+        finals = []
+
+        async def _collect():
+            async for event in stream.output_stream:
+                for result in event.transcript.results:
+                    if not result.is_partial and result.alternatives:
+                        finals.append(result.alternatives[0].transcript)
+
+        await asyncio.gather(_feed(), _collect())
+        return ' '.join(finals) or None
+
+    return asyncio.run(_run())
+
+
 # Upload audio to S3 and transcribe
 def speech_to_text(file_path):
     transcribe = boto3.client('transcribe')
@@ -61,7 +129,7 @@ def speech_to_text(file_path):
 
 
     job_name = f"transcription-{uuid.uuid4()}"
-    s3.upload_file(file_path, S3_BUCKET, file_path)
+    s3.upload_file(file_path, S3_BUCKET, file_path, Config=TRANSFER_CONFIG)
     job_uri = f"s3://{S3_BUCKET}/{file_path}"
 
 
@@ -73,44 +141,54 @@ def speech_to_text(file_path):
     )
 
 
+    # Poll with exponential backoff (0.5s doubling to 5s, +/-20% jitter)
+    # so short recordings come back fast; bail out after 60s
+    deadline = time.monotonic() + 60
+    delay = 0.5
     while True:
         status = transcribe.get_transcription_job(TranscriptionJobName=job_name)
         if status['TranscriptionJob']['TranscriptionJobStatus'] in ['COMPLETED', 'FAILED']:
             break
-        time.sleep(5)
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(delay * (0.8 + 0.4 * random.random()))
+        delay = min(delay * 2, 5)
 
 
     if status['TranscriptionJob']['TranscriptionJobStatus'] == 'COMPLETED':
         transcript_url = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-        transcript_json = requests.get(transcript_url).json()
+        # Decode off the response stream instead of buffering the full
+        # document as text first
+        with http_session.get(transcript_url, stream=True, timeout=30) as r:
+            transcript_json = json.load(r.raw)
         return transcript_json['results']['transcripts'][0]['transcript']
     return None
 
 
-# Convert text to speech
-def text_to_speech(output_path, text):
+# Convert text to speech; the MP3 only exists to be played back, so
+# keep it in memory instead of round-tripping through a temp file
+def text_to_speech(text):
     polly = boto3.client('polly')
     response = polly.synthesize_speech(
         Text=text,
         OutputFormat='mp3',
         VoiceId='Joanna'
     )
-    with open(output_path, 'wb') as f:
-        f.write(response['AudioStream'].read())
-    return output_path
+    with response['AudioStream'] as src:
+        return src.read()
+
 
+# Acknowledgment clip played while the agent composes its reply; the
+# text never changes, so Polly is only hit once per process
+@functools.lru_cache(maxsize=1)
+def thinking_clip():
+    return text_to_speech("One moment, let me look into that.")
 
-# Autoplay audio
-def autoplay_audio(file_path: str):
-    with open(file_path, "rb") as f:
-        audio_bytes = f.read()
-        b64 = base64.b64encode(audio_bytes).decode()
-        md = f"""
-        <audio autoplay="true" controls>
-        <source src="data:audio/mp3;base64,{b64}" type="audio/mp3">
-        </audio>
-        """
-        st.markdown(md, unsafe_allow_html=True)
+
+# Autoplay audio; st.audio ships the bytes directly instead of
+# base64-inflating them by a third inside an HTML data URI
+def autoplay_audio(audio_bytes: bytes):
+    st.audio(audio_bytes, format='audio/mp3', autoplay=True)
 
 
 # Ask the agent with retry logic
@@ -125,11 +203,13 @@ def ask_agent(question, retries=3, delay=5):
             )
 
 
-            response_text = ""
+            # Collect raw chunks and decode once - str += is quadratic
+            # on long streamed replies
+            parts = []
             for event in response['completion']:
                 if 'chunk' in event:
-                    response_text += event['chunk']['bytes'].decode('utf-8')
-            return response_text
+                    parts.append(event['chunk']['bytes'])
+            return b''.join(parts).decode('utf-8')
 
 
         except client.exceptions.InternalServerException:
@@ -142,31 +222,46 @@ def ask_agent(question, retries=3, delay=5):
 # Handle audio input
 if audio_bytes:
     with st.spinner("Listening..."):
-        webm_file_path = "temp_audio.mp3"
-        with open(webm_file_path, "wb") as f:
-            f.write(audio_bytes)
-
+        # Synthesize the acknowledgment clip while transcription is in
+        # flight - both are IO-bound, so the Polly round-trip hides
+        # behind the transcribe one
+        ack = executor.submit(thinking_clip)
+
+        if TranscribeStreamingClient is not None:
+            # Skip the 44-byte WAV header; the stream wants raw PCM
+            transcript = streaming_speech_to_text(audio_bytes[44:])
+        else:
+            webm_file_path = "temp_audio.mp3"
+            with open(webm_file_path, "wb") as f:
+                f.write(audio_bytes)
+            transcript = speech_to_text(webm_file_path)
+            os.remove(webm_file_path)
 
-        transcript = speech_to_text(webm_file_path)
         if transcript:
-            st.session_state.messages.append({"role": "user", "content": transcript})
+            # Normalize once at append time so reruns don't rewalk the
+            # string on every render
+            st.session_state.messages.append({
+                "role": "user",
+                "content": transcript,
+                "norm": transcript.lower().strip()
+            })
             with st.chat_message("user"):
                 st.write(transcript)
-            os.remove(webm_file_path)
+            # Fill the wait for the agent reply below with the
+            # prefetched acknowledgment
+            autoplay_audio(ack.result())
 
 
 # Generate assistant response
 if st.session_state.messages[-1]["role"] != "assistant":
     with st.chat_message("assistant"):
         with st.spinner("Processing..."):
-            final_response = ask_agent(st.session_state.messages[-1]["content"].lower().strip())
+            last = st.session_state.messages[-1]
+            final_response = ask_agent(last.get("norm") or last["content"].lower().strip())
             st.write(final_response)
         with st.spinner("Generating audio response..."):
-            speech_file_path = 'audio_response.mp3'
-            text_to_speech(speech_file_path, final_response)
-            autoplay_audio(speech_file_path)
+            autoplay_audio(text_to_speech(final_response))
         st.session_state.messages.append({"role": "assistant", "content": final_response})
-        os.remove(speech_file_path)
 
 
 # Float the footer container